@@ -3,19 +3,25 @@ from __future__ import annotations
 
 import logging
 from os.path import exists
-from typing import List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 
 import numpy as np
 import SimpleITK as sitk
+from pydicom.dataelem import RawDataElement
+from pydicom.pixels import iter_pixels
+from pydicom.uid import ExplicitVRLittleEndian, ImplicitVRLittleEndian
 
 
 from mdh_app.managers.shared_state_manager import should_exit
 from mdh_app.utils.dicom_utils import read_dcm_file
-from mdh_app.utils.sitk_utils import merge_imagereader_metadata
+from mdh_app.utils.sitk_utils import (
+    merge_imagereader_metadata, merge_dataset_metadata, copy_all_metadata, set_rescale_params
+)
 
 
 if TYPE_CHECKING:
+    import threading
     import numpy.typing as npt
     from pydicom import Dataset
     from mdh_app.managers.shared_state_manager import SharedStateManager
@@ -24,9 +30,17 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Elements larger than this are not read when parsing a multi-frame header (notably PixelData)
+MULTIFRAME_DEFER_SIZE = 1024
+# Transfer syntaxes whose native pixel data can be memory-mapped directly from the file
+MEMMAP_TRANSFER_SYNTAXES = {ExplicitVRLittleEndian, ImplicitVRLittleEndian}
+
+
 def _read_and_validate_files(
     file_paths: List[str],
     expected_SIUID: Optional[str] = None,
+    ss_mgr: Optional[SharedStateManager] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> Optional[List[str]]:
     """Read and validate DICOM files for geometric consistency."""
     if not isinstance(file_paths, list) or not all(isinstance(f, str) for f in file_paths):
@@ -47,11 +61,14 @@ def _read_and_validate_files(
     distances: List[Tuple[float, str]] = []
 
     for filepath in file_paths:
+        if should_exit(ss_mgr, "Aborting image construction task due to shutdown request", cancel_event):
+            return None
+        
         if not exists(filepath):
             logger.warning(f"File does not exist, skipping: {filepath}")
             continue
         
-        ds: Optional[Dataset] = read_dcm_file(filepath)
+        ds: Optional[Dataset] = read_dcm_file(filepath, stop_before_pixels=True)  # Pixels are read by SimpleITK
         if ds is None:
             logger.error(f"Failed to read DICOM file {filepath}, skipping this part of the image.")
             continue
@@ -149,35 +166,388 @@ def _sort_files(distances: List[Tuple[float, str]], spacing_between_slices: Opti
     return sorted_files
 
 
+def _has_varying_rescale(reader: sitk.ImageSeriesReader) -> bool:
+    """Check whether the slices read by a series reader have different rescale slopes or intercepts."""
+    for key in ("0028|1053", "0028|1052"):
+        values = set()
+        for slice_index in range(len(reader.GetFileNames())):
+            try:
+                values.add(float(reader.GetMetaData(slice_index, key)) if reader.HasMetaDataKey(slice_index, key) else None)
+            except ValueError:
+                return True
+        if len(values) > 1:
+            return True
+    return False
+
+
+def _to_native_pixel_type(image: sitk.Image, first_file: str) -> sitk.Image:
+    """Store a rescaled image in its native integer width, keeping any needed rescale parameters in metadata."""
+    ds: Optional[Dataset] = read_dcm_file(first_file, stop_before_pixels=True)
+    bits_allocated = int(ds.get("BitsAllocated", 16)) if ds is not None else 0
+    if bits_allocated not in (8, 16, 32):
+        return copy_all_metadata(src=image, dst=sitk.Cast(image, sitk.sitkFloat32))
+    signed = int(ds.get("PixelRepresentation", 0)) == 1
+    stored_dtype = np.dtype(f"{'int' if signed else 'uint'}{bits_allocated}")
+    
+    view = sitk.GetArrayViewFromImage(image)
+    is_integer_image = image.GetPixelID() not in (sitk.sitkFloat32, sitk.sitkFloat64)
+    
+    # Rescaled integer values (e.g., CT HU) that fit the stored width are kept as-is, without rescale parameters
+    if is_integer_image:
+        vmin, vmax = int(view.min()), int(view.max())
+        for dtype in (np.dtype(f"int{bits_allocated}"), np.dtype(f"uint{bits_allocated}")):
+            if np.iinfo(dtype).min <= vmin and vmax <= np.iinfo(dtype).max:
+                if view.dtype == dtype:
+                    return image
+                native_image = sitk.GetImageFromArray(view.astype(dtype))
+                native_image.CopyInformation(image)
+                return copy_all_metadata(src=image, dst=native_image)
+    
+    # Otherwise store the raw values with a single slope/intercept (not possible if they vary per slice)
+    slope_meta = image.GetMetaData("RescaleSlope") if image.HasMetaDataKey("RescaleSlope") else "1"
+    intercept_meta = image.GetMetaData("RescaleIntercept") if image.HasMetaDataKey("RescaleIntercept") else "0"
+    try:
+        slope, intercept = float(slope_meta), float(intercept_meta)
+    except ValueError:
+        slope, intercept = 0.0, 0.0
+    if slope == 0:
+        logger.info("Rescale parameters vary across slices or are invalid; storing image as float32.")
+        return copy_all_metadata(src=image, dst=sitk.Cast(image, sitk.sitkFloat32))
+    
+    stored = np.rint((view - intercept) / slope).astype(stored_dtype)
+    native_image = sitk.GetImageFromArray(stored)
+    native_image.CopyInformation(image)
+    copy_all_metadata(src=image, dst=native_image)
+    set_rescale_params(native_image, slope, intercept)
+    return native_image
+
+
+### Enhanced Multi-Frame Methods ###
+
+def _is_enhanced_multiframe(ds: Dataset) -> bool:
+    """Check whether a dataset is an enhanced multi-frame image with per-frame functional groups."""
+    try:
+        num_frames = int(ds.get("NumberOfFrames", 1) or 1)
+    except (TypeError, ValueError):
+        return False
+    return num_frames > 1 and "PerFrameFunctionalGroupsSequence" in ds
+
+
+def _get_functional_group_item(ds: Dataset, frame_index: int, group_keyword: str) -> Optional[Dataset]:
+    """Return the first item of a functional group macro for a frame, preferring per-frame over shared groups."""
+    for fg_keyword, item_index in (("PerFrameFunctionalGroupsSequence", frame_index), ("SharedFunctionalGroupsSequence", 0)):
+        fg_sequence = ds.get(fg_keyword, None)
+        if not fg_sequence or len(fg_sequence) <= item_index:
+            continue
+        group_sequence = fg_sequence[item_index].get(group_keyword, None)
+        if group_sequence:
+            return group_sequence[0]
+    return None
+
+
+def _get_multiframe_geometry(
+    ds: Dataset, num_frames: int
+) -> Optional[Tuple[npt.NDArray[np.intp], Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]]]:
+    """Compute (frame order, origin, spacing, direction) of an enhanced multi-frame image from its functional groups."""
+    try:
+        orientation_item = _get_functional_group_item(ds, 0, "PlaneOrientationSequence")
+        measures_item = _get_functional_group_item(ds, 0, "PixelMeasuresSequence")
+        if orientation_item is None or measures_item is None:
+            logger.error("Enhanced multi-frame image is missing PlaneOrientationSequence or PixelMeasuresSequence.")
+            return None
+        
+        iop = [float(v) for v in orientation_item.ImageOrientationPatient]
+        row_spacing, col_spacing = (float(v) for v in measures_item.PixelSpacing)
+        row_cosine, col_cosine = np.array(iop[:3], dtype=np.float64), np.array(iop[3:], dtype=np.float64)
+        normal = np.cross(row_cosine, col_cosine)
+        
+        positions = np.empty((num_frames, 3), dtype=np.float64)
+        for frame_index in range(num_frames):
+            frame_orientation = _get_functional_group_item(ds, frame_index, "PlaneOrientationSequence")
+            if frame_orientation is not None and not np.allclose(
+                [float(v) for v in frame_orientation.ImageOrientationPatient], iop, atol=1e-4
+            ):
+                logger.error(f"Inconsistent ImageOrientationPatient in frame {frame_index + 1}. All frames must have the same orientation.")
+                return None
+            position_item = _get_functional_group_item(ds, frame_index, "PlanePositionSequence")
+            if position_item is None or "ImagePositionPatient" not in position_item:
+                logger.error(f"Missing ImagePositionPatient for frame {frame_index + 1}.")
+                return None
+            positions[frame_index] = [float(v) for v in position_item.ImagePositionPatient]
+        
+        # Order frames along the slice normal, which must then be regularly spaced
+        distances = positions @ normal
+        frame_order = np.argsort(distances, kind="stable")
+        diffs = np.diff(distances[frame_order])
+        slice_spacing = float(np.median(diffs))
+        if slice_spacing <= 0 or not np.allclose(diffs, slice_spacing, rtol=1e-2, atol=1e-3):
+            logger.error(
+                "Frames of the enhanced multi-frame image are not a single, regularly spaced stack "
+                "(e.g., duplicate positions from multiple temporal phases); cannot build a 3D image."
+            )
+            return None
+        
+        origin = tuple(positions[frame_order[0]].tolist())
+        spacing = (col_spacing, row_spacing, slice_spacing)
+        direction = tuple(np.column_stack((row_cosine, col_cosine, normal)).ravel().tolist())
+        return frame_order, origin, spacing, direction
+    except Exception as e:
+        logger.error("Failed to compute enhanced multi-frame image geometry.", exc_info=True, stack_info=True)
+        return None
+
+
+def _get_multiframe_rescale(ds: Dataset, num_frames: int) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Return per-frame rescale slopes and intercepts from the Pixel Value Transformation functional group."""
+    slopes = np.ones(num_frames, dtype=np.float64)
+    intercepts = np.zeros(num_frames, dtype=np.float64)
+    for frame_index in range(num_frames):
+        transform_item = _get_functional_group_item(ds, frame_index, "PixelValueTransformationSequence")
+        if transform_item is None:
+            transform_item = ds  # Some writers keep a single top-level rescale
+        slopes[frame_index] = float(transform_item.get("RescaleSlope", 1) or 1)
+        intercepts[frame_index] = float(transform_item.get("RescaleIntercept", 0) or 0)
+    return slopes, intercepts
+
+
+def _get_stored_values(frame: np.ndarray, bits_stored: int, high_bit: int, signed: bool) -> np.ndarray:
+    """Return the stored values of a frame, dropping bits outside BitsStored/HighBit and sign-extending if signed."""
+    num_bits = frame.dtype.itemsize * 8
+    if bits_stored >= num_bits:
+        return frame
+    unsigned = frame.view(f"u{frame.dtype.itemsize}")
+    unsigned = np.left_shift(unsigned, num_bits - 1 - high_bit, dtype=unsigned.dtype)  # Drop the bits above HighBit
+    if signed:
+        return np.right_shift(unsigned.view(f"i{frame.dtype.itemsize}"), num_bits - bits_stored)  # Arithmetic shift extends the sign
+    return np.right_shift(unsigned, num_bits - bits_stored)
+
+
+def _iter_multiframe_pixels(file_path: str, ds: Dataset, num_frames: int) -> Optional[Iterator[np.ndarray]]:
+    """Yield the stored frames in file order, memory-mapped from the file when uncompressed and decoded one at a time otherwise."""
+    if int(ds.get("SamplesPerPixel", 1)) != 1:
+        logger.error("Only single-sample (grayscale) enhanced multi-frame images are supported.")
+        return None
+    rows, cols = int(ds.Rows), int(ds.Columns)
+    bits_allocated = int(ds.get("BitsAllocated", 16))
+    bits_stored = int(ds.get("BitsStored", bits_allocated))
+    high_bit = int(ds.get("HighBit", bits_stored - 1))
+    signed = int(ds.get("PixelRepresentation", 0)) == 1
+    
+    pixel_elem = ds.get_item(0x7FE00010, keep_deferred=True)
+    transfer_syntax = ds.file_meta.get("TransferSyntaxUID", None)
+    if (
+        isinstance(pixel_elem, RawDataElement)
+        and pixel_elem.value is None
+        and transfer_syntax in MEMMAP_TRANSFER_SYNTAXES
+        and bits_allocated in (8, 16, 32)
+    ):
+        stored_dtype = np.dtype(f"<{'i' if signed else 'u'}{bits_allocated // 8}")
+        expected_bytes = num_frames * rows * cols * stored_dtype.itemsize
+        if pixel_elem.length == 0xFFFFFFFF or pixel_elem.length < expected_bytes:
+            logger.error(f"PixelData is {pixel_elem.length} bytes; expected at least {expected_bytes} bytes.")
+            return None
+        logger.info(f"Memory-mapping {num_frames} uncompressed frames from {file_path}")
+        stored_frames = np.memmap(file_path, dtype=stored_dtype, mode="r", offset=pixel_elem.value_tell, shape=(num_frames, rows, cols))
+        frames = iter(stored_frames)
+    else:
+        # Compressed pixel data is decoded frame by frame rather than in full
+        logger.info(f"Decoding {num_frames} frames from {file_path}")
+        frames = iter_pixels(file_path)
+    return (_get_stored_values(np.asarray(frame).reshape(rows, cols), bits_stored, high_bit, signed) for frame in frames)
+
+
+def _construct_multiframe_image(
+    file_path: str,
+    ds: Dataset,
+    ss_mgr: SharedStateManager,
+    expected_SIUID: Optional[str] = None,
+    native_pixel_type: bool = False,
+    cancel_event: Optional[threading.Event] = None,
+) -> Optional[sitk.Image]:
+    """Construct a 3D SimpleITK image from a single enhanced multi-frame file, filling its buffer one frame at a time."""
+    if expected_SIUID and ds.get("SeriesInstanceUID", "") != expected_SIUID:
+        logger.error(
+            f"SeriesInstanceUID mismatch in {file_path}. "
+            f"Expected: {expected_SIUID}, Found: {ds.get('SeriesInstanceUID', '')}"
+        )
+        return None
+    
+    num_frames = int(ds.NumberOfFrames)
+    geometry = _get_multiframe_geometry(ds, num_frames)
+    if geometry is None:
+        return None
+    frame_order, origin, spacing, direction = geometry
+    
+    if should_exit(ss_mgr, "Aborting image construction task due to shutdown request", cancel_event):
+        return None
+    
+    try:
+        frames = _iter_multiframe_pixels(file_path, ds, num_frames)
+        if frames is None:
+            return None
+        
+        # Slice index of each frame in the spatially sorted volume
+        slice_indices = np.empty(num_frames, dtype=np.intp)
+        slice_indices[frame_order] = np.arange(num_frames)
+        
+        slopes, intercepts = _get_multiframe_rescale(ds, num_frames)
+        uniform_rescale = np.all(slopes == slopes[0]) and np.all(intercepts == intercepts[0]) and slopes[0] != 0
+        store_physical = not (native_pixel_type and uniform_rescale)
+        if native_pixel_type and not uniform_rescale:
+            logger.info("Rescale parameters vary across frames; storing image as float32.")
+        
+        # Each frame is pasted in place into its sorted slice, so the volume is only ever held once
+        image: Optional[sitk.Image] = None
+        frame_count = 0
+        for frame_index, frame in enumerate(frames):
+            if frame_index >= num_frames:
+                break
+            if should_exit(ss_mgr, "Aborting image construction task due to shutdown request", cancel_event):
+                return None
+            if store_physical:
+                frame = np.multiply(frame, np.float32(slopes[frame_index]), dtype=np.float32, casting="unsafe")
+                frame += np.float32(intercepts[frame_index])
+            frame_image = sitk.GetImageFromArray(frame)
+            if image is None:
+                image = sitk.Image([frame.shape[1], frame.shape[0], num_frames], frame_image.GetPixelID())
+            image[:, :, int(slice_indices[frame_index])] = frame_image
+            frame_count += 1
+        del frames  # Release the file mapping
+        
+        if frame_count != num_frames:
+            logger.error(f"Read {frame_count} frames from {file_path}; expected {num_frames}.")
+            return None
+        
+        image.SetOrigin(origin)
+        image.SetSpacing(spacing)
+        image.SetDirection(direction)
+        image = merge_dataset_metadata(ds, image)
+        if not store_physical:
+            set_rescale_params(image, float(slopes[0]), float(intercepts[0]))
+    except Exception as e:
+        logger.error(f"Failed to construct image from enhanced multi-frame file {file_path}.", exc_info=True, stack_info=True)
+        return None
+    
+    logger.info(
+        f"Loaded enhanced multi-frame IMAGE with SeriesInstanceUID '{expected_SIUID}' "
+        f"with origin {image.GetOrigin()}, direction {image.GetDirection()}, "
+        f"spacing {image.GetSpacing()}, size {image.GetSize()}."
+    )
+    return image
+
+
+### Image Construction ###
+
+def read_image_params(
+    file_paths: List[str],
+    ss_mgr: SharedStateManager,
+    expected_SIUID: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Read the geometry of the image that construct_image builds from the same files, without decoding pixel data.
+    
+    Returns:
+        Dict with "origin", "spacing", "direction", "cols", "rows" and "slices", or None if it cannot be determined.
+    """
+    if should_exit(ss_mgr, "Aborting image geometry reading due to shutdown request"):
+        return None
+    
+    try:
+        if isinstance(file_paths, list) and len(file_paths) == 1 and isinstance(file_paths[0], str) and exists(file_paths[0]):
+            header_ds: Optional[Dataset] = read_dcm_file(file_paths[0], defer_size=MULTIFRAME_DEFER_SIZE)
+            if header_ds is not None and _is_enhanced_multiframe(header_ds):
+                if expected_SIUID and header_ds.get("SeriesInstanceUID", "") != expected_SIUID:
+                    logger.error(f"SeriesInstanceUID mismatch in {file_paths[0]}. Expected: {expected_SIUID}, Found: {header_ds.get('SeriesInstanceUID', '')}")
+                    return None
+                num_frames = int(header_ds.NumberOfFrames)
+                geometry = _get_multiframe_geometry(header_ds, num_frames)
+                if geometry is None:
+                    return None
+                _, origin, spacing, direction = geometry
+                return {
+                    "origin": origin, "spacing": spacing, "direction": direction,
+                    "cols": int(header_ds.Columns), "rows": int(header_ds.Rows), "slices": num_frames,
+                }
+        
+        sorted_files = _read_and_validate_files(file_paths, expected_SIUID, ss_mgr)
+        if sorted_files is None:
+            return None
+        
+        # As the series reader: geometry of the first slice, with the mean distance between slices as slice spacing
+        reader = sitk.ImageFileReader()
+        reader.SetFileName(sorted_files[0])
+        reader.ReadImageInformation()
+        origin, spacing, size = reader.GetOrigin(), list(reader.GetSpacing()), reader.GetSize()
+        if len(sorted_files) > 1:
+            reader.SetFileName(sorted_files[-1])
+            reader.ReadImageInformation()
+            spacing[2] = float(np.linalg.norm(np.subtract(reader.GetOrigin(), origin))) / (len(sorted_files) - 1)
+        return {
+            "origin": origin, "spacing": tuple(spacing), "direction": reader.GetDirection(),
+            "cols": size[0], "rows": size[1], "slices": len(sorted_files),
+        }
+    except Exception as e:
+        logger.error("Failed to read the image geometry from the DICOM headers.", exc_info=True, stack_info=True)
+        return None
+
+
 def construct_image(
     file_paths: List[str],
     ss_mgr: SharedStateManager,
     expected_SIUID: Optional[str] = None,
+    native_pixel_type: bool = False,
+    cancel_event: Optional[threading.Event] = None,
 ) -> Optional[sitk.Image]:
-    """Construct 3D SimpleITK image from validated DICOM files."""
-    if should_exit(ss_mgr, "Aborting image construction task due to shutdown request"):
+    """
+    Construct 3D SimpleITK image from validated DICOM files, as float32 or in its native stored type.
+    
+    An optional cancel event stops the build between files, in addition to cleanup/shutdown events.
+    """
+    if should_exit(ss_mgr, "Aborting image construction task due to shutdown request", cancel_event):
         return None
     
-    sorted_files = _read_and_validate_files(file_paths, expected_SIUID)
+    # A single enhanced multi-frame file holds the whole series; its pixel data is not read up front
+    if isinstance(file_paths, list) and len(file_paths) == 1 and isinstance(file_paths[0], str) and exists(file_paths[0]):
+        header_ds: Optional[Dataset] = read_dcm_file(file_paths[0], defer_size=MULTIFRAME_DEFER_SIZE)
+        if header_ds is not None and _is_enhanced_multiframe(header_ds):
+            return _construct_multiframe_image(file_paths[0], header_ds, ss_mgr, expected_SIUID, native_pixel_type, cancel_event)
+    
+    sorted_files = _read_and_validate_files(file_paths, expected_SIUID, ss_mgr, cancel_event)
+    if should_exit(ss_mgr, "Aborting image construction task due to shutdown request", cancel_event):
+        return None
     if sorted_files is None:
         logger.error("File validation failed, cannot construct image")
         return None
     
-    if should_exit(ss_mgr, "Aborting image construction task due to shutdown request"):
-        return None
-    
     # Configure SimpleITK image series reader
     reader = sitk.ImageSeriesReader()
     reader.MetaDataDictionaryArrayUpdateOn()  # Preserve DICOM metadata
     reader.LoadPrivateTagsOn()  # Include private DICOM tags
-    reader.SetOutputPixelType(sitk.sitkFloat32)  # float32 generally adequate
+    if not native_pixel_type:
+        reader.SetOutputPixelType(sitk.sitkFloat32)  # float32 generally adequate
     reader.SetFileNames(sorted_files)
     
+    # Abort the reader between slices if the task is cancelled
+    aborted = []
+    def abort_if_cancelled() -> None:
+        if not aborted and should_exit(ss_mgr, "Aborting image construction task due to shutdown request", cancel_event):
+            aborted.append(True)
+            reader.Abort()
+    reader.AddCommand(sitk.sitkProgressEvent, abort_if_cancelled)
+    
     # Execute image construction
     try:
         logger.info(f"Constructing 3D image from {len(sorted_files)} DICOM files")
         image = reader.Execute()
+        
+        # A native read gives every slice the first slice's rescaled pixel type, which cannot hold per-slice rescales
+        if native_pixel_type and _has_varying_rescale(reader):
+            logger.info("Rescale parameters vary across slices; reading image as float32.")
+            native_pixel_type = False
+            reader.SetOutputPixelType(sitk.sitkFloat32)
+            image = reader.Execute()
     except Exception as e:
+        if aborted:
+            return None
         logger.error("ImageSeriesReader failed to construct image!", exc_info=True, stack_info=True)
         return None
     
@@ -188,6 +558,13 @@ def construct_image(
         logger.exception("Failed to merge metadata.", exc_info=True, stack_info=True)
         # Continue without merged metadata
     
+    if native_pixel_type:
+        try:
+            image = _to_native_pixel_type(image, sorted_files[0])
+        except Exception as e:
+            logger.exception("Failed to convert image to its native pixel type; using float32.", exc_info=True, stack_info=True)
+            image = copy_all_metadata(src=image, dst=sitk.Cast(image, sitk.sitkFloat32))
+    
     logger.info(
         f"Loaded IMAGE with SeriesInstanceUID '{expected_SIUID}' "
         f"with origin {image.GetOrigin()}, direction {image.GetDirection()}, "
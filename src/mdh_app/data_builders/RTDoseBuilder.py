@@ -2,18 +2,20 @@ from __future__ import annotations
 
 
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
 
 
+import numpy as np
 import SimpleITK as sitk
 
 
 from mdh_app.managers.shared_state_manager import should_exit
 from mdh_app.utils.dicom_utils import read_dcm_file, get_first_ref_plan_sop_uid
-from mdh_app.utils.sitk_utils import merge_imagereader_metadata
+from mdh_app.utils.sitk_utils import merge_dataset_metadata, set_rescale_params
 
 
 if TYPE_CHECKING:
+    import threading
     from pydicom import Dataset
     from mdh_app.managers.shared_state_manager import SharedStateManager
 
@@ -72,10 +74,48 @@ def _validate_dose_dataset(ds: Dataset) -> bool:
     return True   
 
 
-def construct_dose(file_path: str, ss_mgr: SharedStateManager) -> Optional[sitk.Image]:
+def _get_dose_geometry(ds: Dataset, num_frames: int) -> Optional[Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]]]:
+    """Compute (origin, spacing, direction) of the dose grid from the RT Dose dataset."""
+    try:
+        origin = tuple(float(v) for v in ds.ImagePositionPatient)
+        iop = np.array([float(v) for v in ds.ImageOrientationPatient], dtype=np.float64)
+        row_spacing, col_spacing = (float(v) for v in ds.PixelSpacing)
+        row_cosine, col_cosine = iop[:3], iop[3:]
+        normal = np.cross(row_cosine, col_cosine)
+        
+        # GridFrameOffsetVector may be relative (first value 0) or absolute; only the differences matter
+        slice_spacing = float(ds.get("SliceThickness", None) or 1.0)
+        offsets = ds.get("GridFrameOffsetVector", None)
+        if num_frames > 1:
+            if not offsets or len(offsets) != num_frames:
+                logger.error(f"GridFrameOffsetVector is missing or does not match NumberOfFrames ({num_frames}).")
+                return None
+            diffs = np.diff(np.array([float(v) for v in offsets], dtype=np.float64))
+            if not np.allclose(diffs, diffs[0], atol=1e-3) or diffs[0] == 0:
+                logger.error("GridFrameOffsetVector is not uniformly spaced; cannot build a regular dose grid.")
+                return None
+            slice_spacing = float(diffs[0])
+        
+        # A decreasing offset vector is represented by a flipped slice direction
+        if slice_spacing < 0:
+            normal = -normal
+            slice_spacing = -slice_spacing
+        
+        spacing = (col_spacing, row_spacing, slice_spacing)
+        direction = tuple(np.column_stack((row_cosine, col_cosine, normal)).ravel().tolist())
+        return origin, spacing, direction
+    except Exception as e:
+        logger.error("Failed to compute RT Dose grid geometry.", exc_info=True, stack_info=True)
+        return None
+
+
+def construct_dose(
+    file_path: str, ss_mgr: SharedStateManager, native_pixel_type: bool = False, cancel_event: Optional[threading.Event] = None
+) -> Optional[sitk.Image]:
+    """Construct an RT Dose image in Gy as float32, or in its native stored type with DoseGridScaling as rescale slope."""
     logger.info(f"Creating RT Dose from file: {file_path}")
     
-    if should_exit(ss_mgr, "Cancelling RT Dose processing due to user request."):
+    if should_exit(ss_mgr, "Cancelling RT Dose processing due to user request.", cancel_event):
         return None
     ds: Optional[Dataset] = read_dcm_file(file_path)
     if ds is None:
@@ -83,22 +123,33 @@ def construct_dose(file_path: str, ss_mgr: SharedStateManager) -> Optional[sitk.
     
     if not _validate_dose_dataset(ds):
         return None
-    if should_exit(ss_mgr, "Cancelling RT Dose processing due to user request."):
+    if should_exit(ss_mgr, "Cancelling RT Dose processing due to user request.", cancel_event):
         return None
     
     try:
-        reader = sitk.ImageFileReader()
-        reader.SetFileName(file_path)
-        reader.ReadImageInformation()
-        reader.SetOutputPixelType(sitk.sitkFloat64)
-        sitk_dose = reader.Execute()
-
+        # Decode the pixel data from the already parsed dataset
         dose_grid_scaling = float(ds.DoseGridScaling)
-        logger.debug(f"Applying dose grid scaling factor: {dose_grid_scaling}")
-        sitk_dose = sitk.Multiply(sitk_dose, dose_grid_scaling)  # apply scaling in float64
-        sitk_dose = sitk.Cast(sitk_dose, sitk.sitkFloat32)  # float32 generally adequate
-
-        sitk_dose = merge_imagereader_metadata(reader, sitk_dose)
+        stored_array = ds.pixel_array
+        if stored_array.ndim == 2:
+            stored_array = stored_array[np.newaxis, ...]
+        
+        geometry = _get_dose_geometry(ds, stored_array.shape[0])
+        if geometry is None:
+            return None
+        origin, spacing, direction = geometry
+        
+        if native_pixel_type:
+            sitk_dose = sitk.GetImageFromArray(stored_array)
+            set_rescale_params(sitk_dose, dose_grid_scaling, 0.0)
+        else:
+            logger.debug(f"Applying dose grid scaling factor: {dose_grid_scaling}")
+            dose_array = np.multiply(stored_array, np.float32(dose_grid_scaling), dtype=np.float32, casting="unsafe")
+            sitk_dose = sitk.GetImageFromArray(dose_array)
+        sitk_dose.SetOrigin(origin)
+        sitk_dose.SetSpacing(spacing)
+        sitk_dose.SetDirection(direction)
+        
+        sitk_dose = merge_dataset_metadata(ds, sitk_dose)
 
         matched_ref_sop_uid = get_first_ref_plan_sop_uid(ds)
         sitk_dose.SetMetaData("ReferencedRTPlanSOPInstanceUID", matched_ref_sop_uid)
@@ -111,4 +162,3 @@ def construct_dose(file_path: str, ss_mgr: SharedStateManager) -> Optional[sitk.
     except Exception as e:
         logger.error("Failed to create SimpleITK dose image.", exc_info=True, stack_info=True)
         return None
-
@@ -3,7 +3,11 @@ from __future__ import annotations
 
 import logging
 from os.path import exists
-from typing import Any, Dict, Tuple, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
+
+
+import numpy as np
+from pydicom.multival import MultiValue
 
 
 from mdh_app.managers.shared_state_manager import should_exit
@@ -18,6 +22,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+CONTOUR_DATA_TAG = 0x30060050
+
+
 def _validate_inputs(
     file_path: str,
     image_params: Dict[str, Any],
@@ -126,6 +133,138 @@ def _extract_roi_info(ds: Dataset, ss_mgr: SharedStateManager) -> Dict[int, Dict
         return {}
 
 
+def _decode_contour_data_bulk(raw_values: List[bytes]) -> List[Optional[np.ndarray]]:
+    """Decode raw backslash-separated DS bytes into flat float32 arrays with a single parse; None for malformed values."""
+    counts = [raw.count(b"\\") + 1 if raw else 0 for raw in raw_values]
+    try:
+        values = np.fromstring(b" ".join(raw_values).replace(b"\\", b" "), dtype=np.float32, sep=" ")
+    except (ValueError, DeprecationWarning):
+        values = None  # Malformed text; NumPy deprecates stopping at it in favor of raising ValueError
+    
+    if values is not None and values.size == sum(counts):
+        return np.split(values, np.cumsum(counts)[:-1])
+    
+    # Some value is malformed; decode one contour at a time so only the bad ones are dropped
+    arrays: List[Optional[np.ndarray]] = []
+    for raw in raw_values:
+        try:
+            arrays.append(np.array([float(v) for v in raw.split(b"\\")] if raw else [], dtype=np.float32))
+        except ValueError:
+            arrays.append(None)
+    return arrays
+
+
+def extract_roi_contours(roi_contour_ds: Dataset) -> List[Tuple[Optional[int], Optional[str], Optional[np.ndarray]]]:
+    """
+    Extract the contours of an ROI Contour item as float32 point arrays.
+
+    ContourData is read from the raw element bytes and decoded for all contours in bulk,
+    bypassing pydicom's per-value DSfloat conversion.
+
+    Args:
+        roi_contour_ds: Item of the ROIContourSequence.
+
+    Returns:
+        List of (ContourNumber, ContourGeometricType, flat float32 array of x, y, z points or None if missing/malformed).
+    """
+    contour_seq = roi_contour_ds.get("ContourSequence", [])
+    
+    raw_values: List[bytes] = []
+    raw_indices: List[int] = []
+    arrays: List[Optional[np.ndarray]] = [None] * len(contour_seq)
+    for idx, contour_ds in enumerate(contour_seq):
+        if CONTOUR_DATA_TAG not in contour_ds:
+            continue
+        value = contour_ds.get_item(CONTOUR_DATA_TAG).value  # Raw bytes unless pydicom already converted it
+        if isinstance(value, (bytes, bytearray)):
+            raw_values.append(bytes(value).strip(b" \x00"))
+            raw_indices.append(idx)
+        elif value is not None and value != "":
+            arrays[idx] = np.asarray(list(value) if isinstance(value, MultiValue) else [value], dtype=np.float32)
+    
+    if raw_values:
+        for idx, array in zip(raw_indices, _decode_contour_data_bulk(raw_values)):
+            arrays[idx] = array
+    
+    return [
+        (contour_ds.get("ContourNumber", None), contour_ds.get("ContourGeometricType", None), array)
+        for contour_ds, array in zip(contour_seq, arrays)
+    ]
+
+
+def build_roi_contour_store(roi_contour_ds: Dataset, image_params: Dict[str, Any], release_raw_data: bool = True) -> Dict[str, Any]:
+    """
+    Pack the contours of an ROI Contour item into contiguous read-only arrays.
+
+    Args:
+        roi_contour_ds: Item of the ROIContourSequence.
+        image_params: Parameters of the referenced image grid ("origin", "spacing", "direction").
+        release_raw_data: Remove the ContourSequence from the dataset once its contours are packed.
+
+    Returns:
+        Dict with "vertices" ((N, 3) float32 points of all contours back to back), "offsets" ((C + 1,) so that
+        contour i is vertices[offsets[i]:offsets[i + 1]]), "slice_indices" ((C,) nearest image slice of each
+        contour, -1 if it has no points), "contour_numbers" and "geometric_types". Missing or malformed
+        contours keep their entry, with no points.
+    """
+    contours = extract_roi_contours(roi_contour_ds)
+    
+    empty_points = np.empty((0, 3), dtype=np.float32)
+    points_list = [
+        points.reshape(-1, 3) if points is not None and points.size % 3 == 0 else empty_points
+        for _, _, points in contours
+    ]
+    counts = np.array([len(points) for points in points_list], dtype=np.int64)
+    offsets = np.zeros(len(points_list) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    vertices = np.concatenate(points_list) if points_list else empty_points
+    slice_indices = get_contour_slice_indices(vertices, offsets, image_params)
+    
+    for array in (vertices, offsets):
+        array.flags.writeable = False
+    
+    if release_raw_data and "ContourSequence" in roi_contour_ds:
+        del roi_contour_ds.ContourSequence
+    
+    return {
+        "vertices": vertices,
+        "offsets": offsets,
+        "slice_indices": slice_indices,
+        "contour_numbers": tuple(contour_number for contour_number, _, _ in contours),
+        "geometric_types": tuple(geometric_type for _, geometric_type, _ in contours),
+    }
+
+
+def get_contour_slice_indices(vertices: np.ndarray, offsets: np.ndarray, image_params: Dict[str, Any]) -> np.ndarray:
+    """Return the read-only (C,) nearest image slice (mean z index) of each packed contour, -1 for contours without points."""
+    counts = np.diff(offsets)
+    origin_array = np.array(image_params["origin"], dtype=np.float32)
+    spacing_array = np.array(image_params["spacing"], dtype=np.float32)
+    direction_array = np.array(image_params["direction"], dtype=np.float32).reshape(3, 3)
+    A_inv_T = np.linalg.inv(direction_array @ np.diag(spacing_array)).T
+    z_indices = (vertices - origin_array) @ A_inv_T[:, 2]
+    z_sums = np.bincount(np.repeat(np.arange(len(counts)), counts), weights=z_indices, minlength=len(counts))
+    slice_indices = np.where(counts > 0, np.rint(z_sums / np.maximum(counts, 1)), -1).astype(np.int32)
+    slice_indices.flags.writeable = False
+    return slice_indices
+
+
+def extract_roi_metadata(roi_ds_dict: Dict[str, Dataset]) -> Dict[str, Any]:
+    """
+    Collect the plain (non-sequence) values of an ROI's sub-datasets into one record keyed by DICOM keyword.
+    
+    Sub-datasets are read in order and the first value of a keyword wins. Multi-valued elements become tuples,
+    so the record can be shared without copying.
+    """
+    record: Dict[str, Any] = {}
+    for sub_ds in roi_ds_dict.values():
+        for elem in sub_ds:
+            if elem.VR == "SQ" or not elem.keyword or elem.keyword in record:
+                continue
+            record[elem.keyword] = tuple(elem.value) if isinstance(elem.value, MultiValue) else elem.value
+    return record
+
+
 def extract_rtstruct_and_roi_datasets(
     file_path: str,
     image_params: Dict[str, Any],
@@ -23,7 +23,7 @@ from mdh_app.dpg_components.interactions.keyboard_handlers import (
     _handler_KeyRelease
 )
 from mdh_app.dpg_components.widgets.progress_bar import update_progress
-from mdh_app.dpg_components.rendering.texture_manager import request_texture_update
+from mdh_app.dpg_components.rendering.texture_manager import request_texture_update, _update_textures
 from mdh_app.dpg_components.themes.global_themes import get_global_theme
 from mdh_app.dpg_components.themes.progress_themes import get_pbar_theme
 from mdh_app.dpg_components.windows.exit.exit_window import create_exit_popup
@@ -53,6 +53,7 @@ class GUILauncher:
         self.config_manager: ConfigManager = ConfigManager()
         self.dicom_manager: DicomManager = DicomManager(self.config_manager, self.shared_state_manager)
         self.data_manager: DataManager = DataManager(self.config_manager, self.shared_state_manager)
+        self.data_manager.on_lazy_roi_complete = _update_textures  # Submitted to the texture thread by the lazy ROI worker
         
         init_engine(self.config_manager.get_database_path(), echo=False)
 
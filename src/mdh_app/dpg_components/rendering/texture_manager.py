@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 import math
-from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 
 import dearpygui.dearpygui as dpg
@@ -22,6 +22,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+VIEW_PARENT_TAGS: Dict[str, str] = {"axial": "mw_ctr_topleft", "coronal": "mw_ctr_bottomleft", "sagittal": "mw_ctr_bottomright"}
+_rendered_view_keys: Dict[str, Tuple[Any, ...]] = {}  # What each view's current texture was rendered from
+
+
 def request_texture_update(*args, **kwargs) -> None:
     """ Triggers a texture update request on the shared state manager. """
     ss_mgr: SharedStateManager = get_user_data(td_key="shared_state_manager")
@@ -31,6 +35,7 @@ def request_texture_update(*args, **kwargs) -> None:
 def _update_textures(*args, **kwargs) -> None:
     """ Updates the data in the DataManager and textures in the DearPyGUI interface. """
     # Get managers
+    ss_mgr: SharedStateManager = get_user_data(td_key="shared_state_manager")
     conf_mgr: ConfigManager = get_user_data(td_key="config_manager")
     data_mgr: DataManager = get_user_data(td_key="data_manager")
     img_tags = get_tag("img_tags")
@@ -43,6 +48,9 @@ def _update_textures(*args, **kwargs) -> None:
     # Identify texture action type
     texture_action_type = kwargs.get("texture_action_type", "update")
     
+    # Previews, rendered while updates arrive faster than full frames can be drawn, use textures of half the length
+    texture_length = max(1, image_length // 2) if kwargs.get("texture_preview", False) else image_length
+    
     # Get raw data params
     data_raw_params = data_mgr.get_raw_data_params()
     data_raw_size, data_raw_spacing = data_raw_params["size"], data_raw_params["spacing"]
@@ -189,20 +197,67 @@ def _update_textures(*args, **kwargs) -> None:
         )
     }
     
-    texture_dict = {}
+    # Only views whose inputs changed since they were last rendered are re-rendered and uploaded
+    display_versions = (data_mgr.get_display_version(), conf_mgr.get_user_config_version())
+    view_params_dict: Dict[str, Tuple[Dict[str, Any], Tuple[Any, ...]]] = {}
     for view_type, slicer in view_slicing_dict.items():
         texture_params = {
             "view_type": view_type, "xyz_slices": dpg_viewed_slices, "xyz_ranges": dpg_ranges, "slicer": slicer, 
-            "image_length": image_length, "size": dpg_size, "voxel_spacing": dpg_spacing, 
+            "image_length": texture_length, "size": dpg_size, "voxel_spacing": dpg_spacing, 
             "rotation": dpg_rotation, "flips": dpg_flips, "contour_thickness": dpg_contour_thickness,
             "display_alphas": dpg_display_alphas, "dose_thresholds": dpg_dose_range,
             "image_window_level": dpg_image_window_level, "image_window_width": dpg_image_window_width,
             "show_crosshairs": dpg.get_value(img_tags["show_crosshairs"]) if dpg.does_item_exist(img_tags["show_crosshairs"]) else True,
             "show_orientation_labels": dpg.get_value(img_tags["show_orientation_labels"]) if dpg.does_item_exist(img_tags["show_orientation_labels"]) else True,
         }
-        texture_dict[view_type] = data_mgr.return_texture_from_active_data(texture_params)
+        view_key = _get_view_render_key(texture_params, display_versions)
+        if (
+            texture_action_type == "update" and 
+            _rendered_view_keys.get(view_type) == view_key and 
+            all(dpg.does_item_exist(get_tag(f"{view_type}_dict")[key]) for key in ("texture", "image"))
+        ):
+            continue
+        view_params_dict[view_type] = (texture_params, view_key)
+    
+    if not view_params_dict:
+        return
+    
+    # The views are rendered concurrently (NumPy and OpenCV release the GIL) and joined before textures are set
+    texture_dict = _render_views(ss_mgr, data_mgr, {view_type: params for view_type, (params, _) in view_params_dict.items()})
+    if texture_dict is None:
+        return
+    for view_type, (_, view_key) in view_params_dict.items():
+        _rendered_view_keys[view_type] = view_key
+    
+    _set_textures_and_images(image_length, texture_dict, texture_length)
+
 
-    _set_textures_and_images(image_length, texture_dict)
+def _render_views(ss_mgr: SharedStateManager, data_mgr: DataManager, texture_params_dict: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Render the textures of the given views on the render pool, or directly if there is one view or one render thread. Returns None if cancelled."""
+    if len(texture_params_dict) == 1 or ss_mgr.num_render_workers < 2:
+        return {view_type: data_mgr.return_texture_from_active_data(texture_params) for view_type, texture_params in texture_params_dict.items()}
+    
+    futures = {view_type: ss_mgr.submit_render_action(data_mgr.return_texture_from_active_data, texture_params) for view_type, texture_params in texture_params_dict.items()}
+    if any(future is None for future in futures.values()):
+        return None
+    return {view_type: future.result() for view_type, future in futures.items()}
+
+
+def _get_view_render_key(texture_params: Dict[str, Any], display_versions: Tuple[int, int]) -> Tuple[Any, ...]:
+    """
+    Return everything a view's texture depends on: its texture parameters and the data/config versions.
+    
+    The other views' slice positions only matter for the crosshairs, so they are left out when crosshairs are hidden.
+    """
+    def freeze(value: Any) -> Any:
+        if isinstance(value, slice):
+            return ("slice", value.start, value.stop, value.step)
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        return value
+    
+    ignore_keys = () if texture_params.get("show_crosshairs") else ("xyz_slices",)
+    return display_versions + tuple((key, freeze(value)) for key, value in sorted(texture_params.items()) if key not in ignore_keys)
 
 
 def _get_dpg_image_length(WH_scales: Tuple[float, float] = (1.0, 1.0)) -> int:
@@ -294,27 +349,30 @@ def _get_visual_texture_params() -> Tuple[List[int], List[int], int, int, int]:
     return display_alphas, dose_range, contour_thickness, image_window_width, image_window_level
 
 
-def _set_textures_and_images(image_length: int, texture_dict: Dict[str, Any]) -> None:
+def _set_textures_and_images(image_length: int, texture_dict: Dict[str, Any], texture_length: Optional[int] = None) -> None:
     """
-    Create or update textures and corresponding images for axial, coronal, and sagittal views.
+    Create or update textures and corresponding images for the given axial, coronal, and/or sagittal views.
 
     Args:
         image_length: Image length (width and height) for the textures.
-        texture_dict: Mapping of view types ("axial", "coronal", "sagittal") to texture data.
+        texture_length: Texture length (width and height), if the textures are stretched over images of another length.
+        texture_dict: Mapping of view types ("axial", "coronal", "sagittal") to texture data; views left out are unchanged.
     
     Raises:
-        ValueError: If image_length is not an integer or texture_dict is missing required keys.
+        ValueError: If image_length is not an integer or texture_dict has no or unknown view keys.
     """
     if not isinstance(image_length, int):
         raise ValueError(f"Image length must be an integer; received: {image_length}")
-    if not texture_dict or not all(k in texture_dict for k in ["axial", "coronal", "sagittal"]):
-        raise ValueError(f"Texture dictionary must contain keys 'axial', 'coronal', and 'sagittal'; received: {texture_dict}")
+    texture_length = image_length if texture_length is None else texture_length
+    if not texture_dict or not all(k in VIEW_PARENT_TAGS for k in texture_dict):
+        raise ValueError(f"Texture dictionary must map views 'axial', 'coronal', or 'sagittal' to textures; received: {texture_dict}")
 
     tag_texture_registry = get_tag("texture_registry")
     tag_item_handler_registry = get_tag("item_handler_registry")
     
     dpg.configure_item("mw_ctr_topright", width=image_length, height=image_length) # Unused view
-    for (view_type, texture), parent_tag in zip(texture_dict.items(), ["mw_ctr_topleft", "mw_ctr_bottomleft", "mw_ctr_bottomright"]):
+    for view_type, texture in texture_dict.items():
+        parent_tag = VIEW_PARENT_TAGS[view_type]
         view_tag_dict: Dict[str, Any] = get_tag(f"{view_type}_dict")
         texture_tag = view_tag_dict["texture"]
         
@@ -323,11 +381,11 @@ def _set_textures_and_images(image_length: int, texture_dict: Dict[str, Any]) ->
         old_width = dpg.get_item_width(texture_tag) if dpg.does_item_exist(texture_tag) else 0
         old_height = dpg.get_item_height(texture_tag) if dpg.does_item_exist(texture_tag) else 0
         
-        if old_width != image_length or old_height != image_length or not dpg.does_item_exist(texture_tag):
+        if old_width != texture_length or old_height != texture_length or not dpg.does_item_exist(texture_tag):
             safe_delete(texture_tag)
-            dpg.add_raw_texture(tag=texture_tag, parent=tag_texture_registry, width=image_length, height=image_length, default_value=texture, format=dpg.mvFormat_Float_rgb)
+            dpg.add_raw_texture(tag=texture_tag, parent=tag_texture_registry, width=texture_length, height=texture_length, default_value=texture, format=dpg.mvFormat_Float_rgb)
         else:
-            dpg.configure_item(texture_tag, width=image_length, height=image_length, default_value=texture, format=dpg.mvFormat_Float_rgb)
+            dpg.configure_item(texture_tag, width=texture_length, height=texture_length, default_value=texture, format=dpg.mvFormat_Float_rgb)
         
         if not dpg.does_item_exist(view_tag_dict["image"]):
             dpg.add_image(tag=view_tag_dict["image"], parent=parent_tag, texture_tag=texture_tag, width=image_length, height=image_length)
@@ -10,6 +10,7 @@ import dearpygui.dearpygui as dpg
 
 from mdh_app.dpg_components.core.utils import get_user_data
 from mdh_app.dpg_components.rendering.texture_manager import request_texture_update
+from mdh_app.dpg_components.widgets.progress_bar import update_progress
 
 
 if TYPE_CHECKING:
@@ -79,6 +80,13 @@ def toggle_all_rois(sender: Union[str, int], app_data: Any, user_data: Tuple[Lis
     [dpg.disable_item(chk) for chk in valid_checkboxes]
     
     should_load = not any(dpg.get_value(chk) for chk in valid_checkboxes)
+    
+    # Build the masks as one parallel batch; this runs as a submitted action, so the GUI stays responsive
+    if should_load:
+        data_mgr: DataManager = get_user_data("data_manager")
+        roi_numbers = data_mgr.get_rtstruct_roi_numbers_by_uid(struct_uid, sort_by_name=True)
+        data_mgr.build_rtstruct_rois(struct_uid, roi_numbers, progress_callback=update_progress)
+    
     for chk in valid_checkboxes:
         dpg.set_value(chk, should_load)
     update_cbox_callback(sender, should_load, ("toggle_all_rois", struct_uid))
@@ -13,6 +13,7 @@ from functools import partial
 import dearpygui.dearpygui as dpg
 
 
+from mdh_app.database.db_utils import get_patient_full
 from mdh_app.dpg_components.core.gui_lifecycle import wrap_with_cleanup
 from mdh_app.dpg_components.core.utils import get_tag, get_user_data
 from mdh_app.dpg_components.rendering.texture_manager import request_texture_update
@@ -250,6 +251,29 @@ def load_patient_data(sender: Union[int, str], app_data: Any, user_data: Tuple[P
     fill_right_col_ptdata(patient)
     request_texture_update(texture_action_type="initialize")
     logger.info(f"Loaded {len(selected_files)} files for patient {patient.name}")
+    
+    # Optionally start decoding the next patient in the table while this one is reviewed
+    conf_mgr: ConfigManager = get_user_data(td_key="config_manager")
+    if conf_mgr.get_bool_prefetch_next_patient():
+        next_patient = _find_next_patient_in_table(patient)
+        if next_patient is not None:
+            data_mgr.prefetch_patient_data(next_patient)
+
+
+def _find_next_patient_in_table(patient: Patient) -> Optional[Patient]:
+    """Return the patient listed after the given one in the current data table page."""
+    subset_pt_data: Optional[Dict[Tuple[str, str], Patient]] = dpg.get_item_user_data(get_tag("data_display_window"))
+    if not subset_pt_data:
+        return None
+    
+    pt_ids = [pt.id for pt in subset_pt_data.values()]
+    if patient.id not in pt_ids:
+        return None
+    
+    idx = pt_ids.index(patient.id) + 1
+    if idx >= len(pt_ids):
+        return None
+    return get_patient_full(pt_ids[idx])
 
 
 def _node_user_data(node: Node, parent_ud: Optional[Dict] = None) -> Dict[str, Any]:
@@ -12,6 +12,7 @@ import dearpygui.dearpygui as dpg
 from mdh_app.database.db_utils import update_patient_processed_at
 from mdh_app.database.models import Patient
 from mdh_app.dpg_components.core.utils import get_tag, get_user_data
+from mdh_app.dpg_components.widgets.progress_bar import update_progress
 from mdh_app.utils.general_utils import validate_filename, sanitize_path_component
 
 
@@ -186,6 +187,14 @@ def _process_roi_saving(sender: Union[str, int], save_selections_dict: Dict[str,
         roi_number = int(roi_number)  # Ensure roi_number is an integer
         rois_to_save.setdefault(save_path, []).append((rtp_sopiuid, roi_number))
     
+    # Build all needed ROI masks in parallel before saving
+    roi_numbers_by_struct: Dict[str, List[int]] = {}
+    for roi_keys in rois_to_save.values():
+        for struct_uid, roi_number in roi_keys:
+            roi_numbers_by_struct.setdefault(struct_uid, []).append(roi_number)
+    for struct_uid, roi_numbers in roi_numbers_by_struct.items():
+        data_mgr.build_rtstruct_rois(struct_uid, roi_numbers, progress_callback=update_progress)
+    
     # After collecting, combine and save the ROIs with the same filenames
     for save_path, roi_keys in rois_to_save.items():
         data_mgr.save_roi(
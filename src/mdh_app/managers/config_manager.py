@@ -24,6 +24,7 @@ class ConfigManager:
     """Manages application configuration settings and data."""
 
     def __init__(self) -> None:
+        self._user_config_version = 0  # Incremented on every user configuration update
         self._set_directories()
         self._ensure_directories_exist()
         self._set_config_files()
@@ -46,6 +47,7 @@ class ConfigManager:
             "assets": os.path.join(resources_dir, "assets"),
             "fonts": os.path.join(resources_dir, "fonts"),
             "database": os.path.join(app_data_dir, "db"), 
+            "mask_cache": os.path.join(app_data_dir, "mask_cache"),
         }
 
     def _ensure_directories_exist(self) -> None:
@@ -132,6 +134,7 @@ class ConfigManager:
 
         user_config: Dict[str, Any] = self.configs[key]
         user_config.update(updates)
+        self._user_config_version += 1
         self._save_config(key, user_config)
         logger.info(f"Updated user configuration settings: {updates}")
 
@@ -263,6 +266,13 @@ class ConfigManager:
         os.makedirs(db_dir, exist_ok=True)
         return os.path.join(db_dir, "mdh_app_db.sqlite")
 
+    def get_mask_cache_dir(self) -> Optional[str]:
+        """Get directory for cached rasterized ROI masks."""
+        mask_cache_dir = self.dirs.get("mask_cache")
+        if mask_cache_dir is not None:
+            os.makedirs(mask_cache_dir, exist_ok=True)
+        return mask_cache_dir
+    
     def get_font_dir(self) -> Optional[str]:
         """Get fonts directory path."""
         font_dir = self.dirs.get("fonts")
@@ -335,6 +345,10 @@ class ConfigManager:
         """Get user configuration."""
         return self.configs.get("user_config", {})
 
+    def get_user_config_version(self) -> int:
+        """Get a counter that changes whenever the user configuration is updated."""
+        return self._user_config_version
+
     def get_user_setting(self, key: str, default: Any = None) -> Any:
         """Get user setting with optional default."""
         return self.get_user_config().get(key, default)
@@ -650,6 +664,118 @@ class ConfigManager:
         
         return voxel_spacing_isotropic_smallest
     
+    def get_bool_prefetch_next_patient(self) -> bool:
+        """Get whether to prefetch the next patient's data in the background."""
+        fallback_value = False
+        
+        prefetch_next_patient = self.get_user_setting("prefetch_next_patient", fallback_value)
+        
+        if not isinstance(prefetch_next_patient, bool):
+            logger.error(
+                f"Value for prefetching the next patient '{prefetch_next_patient}' is invalid. Using fallback: {fallback_value}."
+            )
+            return fallback_value
+        
+        return prefetch_next_patient
+    
+    def get_bool_store_native_pixel_types(self) -> bool:
+        """Get whether to keep images and doses in their native stored integer types."""
+        fallback_value = False
+        
+        store_native_pixel_types = self.get_user_setting("store_native_pixel_types", fallback_value)
+        
+        if not isinstance(store_native_pixel_types, bool):
+            logger.error(
+                f"Value for storing native pixel types '{store_native_pixel_types}' is invalid. Using fallback: {fallback_value}."
+            )
+            return fallback_value
+        
+        return store_native_pixel_types
+    
+    def get_bool_cache_roi_masks_on_disk(self) -> bool:
+        """Get whether to cache rasterized ROI masks on disk between sessions."""
+        fallback_value = False
+        
+        cache_roi_masks_on_disk = self.get_user_setting("cache_roi_masks_on_disk", fallback_value)
+        
+        if not isinstance(cache_roi_masks_on_disk, bool):
+            logger.error(
+                f"Value for caching ROI masks on disk '{cache_roi_masks_on_disk}' is invalid. Using fallback: {fallback_value}."
+            )
+            return fallback_value
+        
+        return cache_roi_masks_on_disk
+
+    def get_mask_cache_max_mb(self) -> Union[int, float]:
+        """Get the size limit, in MB, of the on-disk ROI mask cache."""
+        fallback_value = 1024
+
+        mask_cache_max_mb = self.get_user_setting("mask_cache_max_mb", fallback_value)
+
+        if not isinstance(mask_cache_max_mb, (int, float)) or isinstance(mask_cache_max_mb, bool) or mask_cache_max_mb <= 0:
+            logger.error(
+                f"Mask cache size limit '{mask_cache_max_mb}' is invalid. Using fallback: {fallback_value}."
+            )
+            return fallback_value
+
+        return mask_cache_max_mb
+
+    def get_bool_lazy_roi_rasterization(self) -> bool:
+        """Get whether displayed ROI masks are rasterized slice by slice as they are viewed, completing in the background."""
+        fallback_value = True
+        
+        lazy_roi_rasterization = self.get_user_setting("lazy_roi_rasterization", fallback_value)
+        
+        if not isinstance(lazy_roi_rasterization, bool):
+            logger.error(
+                f"Value for lazy ROI rasterization '{lazy_roi_rasterization}' is invalid. Using fallback: {fallback_value}."
+            )
+            return fallback_value
+        
+        return lazy_roi_rasterization
+    
+    def get_bool_vector_contour_overlay(self) -> bool:
+        """Get whether ROI outlines on native axial slices are drawn directly from the contour polygons."""
+        fallback_value = True
+        
+        vector_contour_overlay = self.get_user_setting("vector_contour_overlay", fallback_value)
+        
+        if not isinstance(vector_contour_overlay, bool):
+            logger.error(
+                f"Value for vector contour overlay '{vector_contour_overlay}' is invalid. Using fallback: {fallback_value}."
+            )
+            return fallback_value
+        
+        return vector_contour_overlay
+    
+    def get_roi_interpolation(self) -> str:
+        """Get the interpolation used to resample ROI masks onto the display grid."""
+        fallback_value = "nearest"
+        
+        roi_interpolation = self.get_user_setting("roi_interpolation", fallback_value)
+        
+        if not (isinstance(roi_interpolation, str) and roi_interpolation in ["nearest", "label_gaussian"]):
+            logger.error(
+                f"ROI interpolation '{roi_interpolation}' is not valid. Using fallback value: {fallback_value}."
+            )
+            return fallback_value
+        
+        return roi_interpolation
+    
+    def get_dose_interpolation(self) -> str:
+        """Get the interpolation used to resample doses onto the display grid and onto each other for summing."""
+        fallback_value = "linear"
+        
+        dose_interpolation = self.get_user_setting("dose_interpolation", fallback_value)
+        
+        if not (isinstance(dose_interpolation, str) and dose_interpolation in ["linear", "nearest", "bspline"]):
+            logger.error(
+                f"Dose interpolation '{dose_interpolation}' is not valid. Using fallback value: {fallback_value}."
+            )
+            return fallback_value
+        
+        return dose_interpolation
+    
     def get_save_settings_dict(self) -> Dict[str, bool]:
         """Get save settings with fallback validation."""
         fallback_dict: Dict[str, bool] = {
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, Optional, Set, Literal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple, Union, Optional, Set, Literal
 import gc
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from json import load, dump, dumps
-from os.path import exists
+from time import sleep, perf_counter
+from os import stat, scandir, remove, utime
+from os.path import exists, join, dirname, getsize
 from copy import deepcopy
+from hashlib import sha1
 
 
 import cv2
@@ -14,22 +19,30 @@ import numpy as np
 import SimpleITK as sitk
 
 
-from mdh_app.data_builders.ImageBuilder import construct_image
-from mdh_app.data_builders.RTStructBuilder import extract_rtstruct_and_roi_datasets
+from mdh_app.data_builders.ImageBuilder import construct_image, read_image_params
+from mdh_app.data_builders.RTStructBuilder import extract_rtstruct_and_roi_datasets, build_roi_contour_store, extract_roi_metadata, get_contour_slice_indices
 from mdh_app.data_builders.RTDoseBuilder import construct_dose
+from mdh_app.managers.shared_state_manager import should_exit
 from mdh_app.utils.dicom_utils import (
     read_dcm_file, get_first_ref_beam_number, get_first_num_fxns_planned, 
-    get_first_ref_series_uid, get_first_ref_struct_sop_uid, 
+    get_first_ref_series_uid, get_first_ref_struct_sop_uid, get_read_only_value,
 )
 from mdh_app.utils.general_utils import (
     get_json_list, struct_name_priority_key, regex_find_dose_and_fractions,
     clean_dicom_string, find_reformatted_mask_name, find_disease_site,
     normalize_rgb_color, atomic_save
 )
-from mdh_app.utils.numpy_utils import resample_contour_dense, numpy_roi_mask_generation, create_HU_to_RED_map
+from mdh_app.utils.numpy_utils import (
+    resample_contour_dense, numpy_roi_mask_generation, create_HU_to_RED_map, allocate_label_planes,
+    set_label_bits, clear_label_bits, get_label_mask, merge_label_masks, get_labels_from_words,
+    window_level_to_uint8, get_window_level_lut, apply_window_level_lut
+)
 from mdh_app.utils.sitk_utils import (
-    sitk_resample_to_reference, resample_sitk_data_with_params, get_orientation_labels, 
-    copy_all_metadata
+    get_orientation_labels, get_image_grid, get_resampled_grid, is_same_grid, resample_to_grid, transform_physical_to_grid_index,
+    copy_all_metadata, get_rescale_params, copy_rescale_params, rescale_array_to_float, sitk_to_float_image,
+    crop_mask_array_to_image, cropped_mask_from_array, resample_cropped_mask_to_grid, is_cropped_image, get_axis_aligned_mapping, sample_axis_aligned,
+    get_crop_params, set_crop_params, get_full_grid_origin, set_mask_statistics, get_mask_statistics,
+    RESCALE_SLOPE_KEY, RESCALE_INTERCEPT_KEY, INTERPOLATORS
 )
 
 
@@ -43,8 +56,133 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def build_single_mask(roi_ds_dict: Dict[str, Dataset], sitk_image_params: Dict[str, Any]) -> Optional[sitk.Image]:
-    """Build binary mask from ROI contour data with TG-263 naming."""
+ROI_MASK_CACHE_VERSION = 1  # Bump when rasterization changes so stale on-disk masks are not reused
+ROI_MASK_CACHE_PREFIX = f"roi_mask_v{ROI_MASK_CACHE_VERSION}_"  # Cached masks of other versions are deleted
+ROI_MASK_CACHE_PRUNE_TARGET = 0.9  # Fraction of the size limit a full cache is pruned down to, so it is not pruned on every save
+CONTOUR_FILL_SHIFT = 4  # Bit shift for sub-pixel accuracy in cv2.fillPoly
+DOSE_LUT_SIZE = 4096  # Entries in the dose wash color lookup table
+DISPLAY_GRID_PARAM_KEYS = ("voxel_spacing", "rotation", "flips")  # Texture parameters that define the cached display grid
+CACHE_REBUILD_PARAM_KEYS = DISPLAY_GRID_PARAM_KEYS + ("roi_interpolation", "dose_interpolation")  # Parameters that the cached data is resampled with
+
+
+def _get_contour_transform(sitk_image_params: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (origin, spacing, A_inv_T) mapping physical contour points to (x, y, z) matrix indices as (points - origin) @ A_inv_T."""
+    origin_array = np.array(sitk_image_params["origin"], dtype=np.float32)
+    spacing_array = np.array(sitk_image_params["spacing"], dtype=np.float32)
+    direction_array = np.array(sitk_image_params["direction"], dtype=np.float32).reshape(3, 3)
+    A_inv_T = np.linalg.inv(direction_array @ np.diag(spacing_array)).T
+    return origin_array, spacing_array, A_inv_T
+
+
+def _get_valid_roi_contours(roi_contours: Dict[str, Any], roi_name: str, roi_number: int) -> List[Tuple[Optional[int], str, np.ndarray]]:
+    """Return (contour number, geometric type, (N, 3) points) of the usable contours of a contour store, logging the skipped ones."""
+    vertices, offsets = roi_contours["vertices"], roi_contours["offsets"]
+    valid_contours = []
+    for contour_idx, (contour_num, contour_geom_type) in enumerate(zip(roi_contours["contour_numbers"], roi_contours["geometric_types"])):
+        if contour_geom_type is None:
+            logger.warning(
+                f"Skipping invalid ContourGeometricType for contour number {contour_num} "
+                f"in ROI '{roi_name}' (number: {roi_number}). Found: {contour_geom_type}."
+            )
+            continue
+        
+        # Points of this contour, as an (N, 3) view of the packed vertices
+        contour_points_3d = vertices[offsets[contour_idx]:offsets[contour_idx + 1]]
+        if not len(contour_points_3d):
+            logger.warning(
+                f"Skipping invalid or missing ContourData for contour number {contour_num} "
+                f"in ROI '{roi_name}' (number: {roi_number})."
+            )
+            continue
+        valid_contours.append((contour_num, contour_geom_type, contour_points_3d))
+    return valid_contours
+
+
+def _add_slice_polygons(slice_contours: Dict[int, List[np.ndarray]], matrix_points_float: np.ndarray, only_slice: Optional[int] = None) -> bool:
+    """
+    Group the (x, y, z) matrix points of a planar contour by their nearest slice into fixed-point cv2 polygons.
+    
+    Returns:
+        True if any points were added.
+    """
+    z_values = matrix_points_float[:, 2]
+    unique_slices = np.unique(np.round(z_values).astype(int))
+    
+    has_points = False
+    for slice_idx in unique_slices:
+        if only_slice is not None and slice_idx != only_slice:
+            continue
+        
+        # Get points for this slice
+        slice_mask = np.abs(z_values - slice_idx) < 0.5
+        if not np.any(slice_mask):
+            continue
+        has_points = True
+        
+        xy_slice = matrix_points_float[slice_mask, :2]
+        xy_points_shifted = np.rint(xy_slice * (2 ** CONTOUR_FILL_SHIFT)).astype(np.int32)
+        xy_points_shifted = np.ascontiguousarray(xy_points_shifted)
+        slice_contours.setdefault(int(slice_idx), []).append(xy_points_shifted)
+    return has_points
+
+
+def _fill_slice_polygons(mask_slice: np.ndarray, contours: List[np.ndarray]) -> None:
+    """Fill the fixed-point polygons of one slice into a 2D (rows, cols) mask."""
+    if len(contours) == 1 and len(contours[0]) == 1:
+        x = contours[0][0][0] >> CONTOUR_FILL_SHIFT  # Bit shift to divide
+        y = contours[0][0][1] >> CONTOUR_FILL_SHIFT
+        if 0 <= y < mask_slice.shape[0] and 0 <= x < mask_slice.shape[1]:
+            mask_slice[y, x] = 1
+    else:
+        # Multiple points/contours
+        # Line types: LINE_4, LINE_8, LINE_AA
+        cv2.fillPoly(mask_slice, contours, color=1, shift=CONTOUR_FILL_SHIFT, lineType=cv2.LINE_8)
+
+
+def build_roi_slice_polylines(
+    roi_contours: Dict[str, Any], 
+    sitk_image_params: Dict[str, Any]
+) -> Optional[Dict[int, Tuple[List[np.ndarray], List[np.ndarray]]]]:
+    """
+    Group the contours of a contour store by slice as fixed-point cv2 polylines in (x, y) matrix indices.
+    
+    Returns:
+        {slice index: (closed polylines, open polylines)}, or None if a contour does not lie within a
+        single slice of the image grid (non-planar, or planar but oblique to the slices).
+    """
+    origin_array, _, A_inv_T = _get_contour_transform(sitk_image_params)
+    vertices, offsets = roi_contours["vertices"], roi_contours["offsets"]
+    
+    slice_polylines: Dict[int, Tuple[List[np.ndarray], List[np.ndarray]]] = {}
+    for contour_idx, contour_geom_type in enumerate(roi_contours["geometric_types"]):
+        contour_points_3d = vertices[offsets[contour_idx]:offsets[contour_idx + 1]]
+        if contour_geom_type is None or not len(contour_points_3d):
+            continue  # Skipped when building the mask as well
+        if contour_geom_type == "OPEN_NONPLANAR":
+            return None
+        
+        matrix_points_float = (contour_points_3d - origin_array) @ A_inv_T
+        slice_indices = np.round(matrix_points_float[:, 2]).astype(int)
+        if np.any(slice_indices != slice_indices[0]):
+            return None
+        
+        xy_points_shifted = np.rint(matrix_points_float[:, :2] * (2 ** CONTOUR_FILL_SHIFT)).astype(np.int32)
+        closed_polylines, open_polylines = slice_polylines.setdefault(int(slice_indices[0]), ([], []))
+        (open_polylines if contour_geom_type == "OPEN_PLANAR" else closed_polylines).append(xy_points_shifted)
+    return slice_polylines
+
+
+def build_single_mask(
+    roi_ds_dict: Dict[str, Dataset], 
+    sitk_image_params: Dict[str, Any], 
+    roi_contours: Optional[Dict[str, Any]] = None
+) -> Optional[sitk.Image]:
+    """
+    Build binary mask from ROI contour data, cropped to its bounding box within the image grid.
+    
+    Contours are decoded from the ROI Contour dataset unless an already-packed contour store
+    (as returned by build_roi_contour_store) is provided.
+    """
     roi_name = roi_ds_dict.get("StructureSetROI", {}).get("ROIName", "N/A")
     roi_number = roi_ds_dict.get("StructureSetROI", {}).get("ROINumber", None)
 
@@ -52,71 +190,30 @@ def build_single_mask(roi_ds_dict: Dict[str, Dataset], sitk_image_params: Dict[s
         logger.error(f"ROI number is missing for ROI with name '{roi_name}'. Cannot build mask.")
         return None
 
-    # Initialize mask with (slices, rows, cols) shape
+    # Grid of (slices, rows, cols) shape; only the bounding box of the contours is allocated
     slices, rows, cols = sitk_image_params["slices"], sitk_image_params["rows"], sitk_image_params["cols"]
-    mask_shape = (slices, rows, cols)
-    mask_np = np.zeros(mask_shape, dtype=np.uint8)
+    grid_shape = np.array((slices, rows, cols), dtype=np.int64)
     
     # Precompute transformation matrix components
-    origin_array = np.array(sitk_image_params["origin"], dtype=np.float32)
-    spacing_array = np.array(sitk_image_params["spacing"], dtype=np.float32)
-    direction_array = np.array(sitk_image_params["direction"], dtype=np.float32).reshape(3, 3)
-    A_inv_T = np.linalg.inv(direction_array @ np.diag(spacing_array)).T
+    origin_array, spacing_array, A_inv_T = _get_contour_transform(sitk_image_params)
     
     has_valid_contour_data = False
-    slice_contours = {}  # Stores references per-slice to build one slice at a time (necessary for proper filling)
-    shift = 4  # Bit shift for sub-pixel accuracy in cv2.fillPoly
-    contour_seq = roi_ds_dict.get("ROIContour", {}).get("ContourSequence", [])
+    slice_contours: Dict[int, List[np.ndarray]] = {}  # Stores references per-slice to build one slice at a time (necessary for proper filling)
+    nonplanar_points: List[np.ndarray] = []  # (x, y, z) int32 matrix points of OPEN_NONPLANAR contours
+    if roi_contours is None:
+        roi_contours = build_roi_contour_store(roi_ds_dict.get("ROIContour", {}), sitk_image_params, release_raw_data=False)
     
-    for contour_ds in contour_seq:
+    for contour_num, contour_geom_type, contour_points_3d in _get_valid_roi_contours(roi_contours, roi_name, roi_number):
         try:
-            contour_num = contour_ds.get("ContourNumber", None)
-            contour_geom_type = contour_ds.get("ContourGeometricType", None)
-            if contour_geom_type is None:
-                logger.warning(
-                    f"Skipping invalid ContourGeometricType for contour number {contour_num} "
-                    f"in ROI '{roi_name}' (number: {roi_number}). Found: {contour_geom_type}."
-                )
-                continue
-            
-            # Extract and reshape contour points from flat array to (N, 3) array
-            contour_points_flat = contour_ds.get("ContourData", [])
-            if not contour_points_flat or len(contour_points_flat) % 3 != 0:
-                logger.warning(
-                    f"Skipping invalid or missing ContourData for contour number {contour_num} "
-                    f"in ROI '{roi_name}' (number: {roi_number}). Found: {contour_points_flat}"
-                )
-                continue
-            
             # Transform physical coordinates to image matrix indices
-            contour_points_3d = np.array(contour_points_flat, dtype=np.float32).reshape(-1, 3)
             dense_points_3d = resample_contour_dense(contour_points_3d, spacing=spacing_array)
             matrix_points_float = (dense_points_3d - origin_array) @ A_inv_T
             
             if contour_geom_type == "OPEN_NONPLANAR":
                 has_valid_contour_data = True
-                matrix_points_int = np.rint(matrix_points_float).astype(np.int32)
-                numpy_roi_mask_generation(mask=mask_np, matrix_points=matrix_points_int, geometric_type=contour_geom_type)
-            else:
-                # Group by Z slice
-                z_values = matrix_points_float[:, 2]
-                unique_slices = np.unique(np.round(z_values).astype(int))
-                
-                for slice_idx in unique_slices:
-                    # Get points for this slice
-                    slice_mask = np.abs(z_values - slice_idx) < 0.5
-                    if not np.any(slice_mask):
-                        continue
-                    
-                    has_valid_contour_data = True
-                    
-                    xy_slice = matrix_points_float[slice_mask, :2]
-                    xy_points_shifted = np.rint(xy_slice * (2 ** shift)).astype(np.int32)
-                    xy_points_shifted = np.ascontiguousarray(xy_points_shifted)
-                    
-                    if slice_idx not in slice_contours:
-                        slice_contours[slice_idx] = []
-                    slice_contours[slice_idx].append(xy_points_shifted)
+                nonplanar_points.append(np.rint(matrix_points_float).astype(np.int32))
+            elif _add_slice_polygons(slice_contours, matrix_points_float):
+                has_valid_contour_data = True
         except Exception as e:
             logger.error(
                 f"Failed to process contour number {contour_num} for ROI '{roi_name}' (number: {roi_number})", 
@@ -129,27 +226,206 @@ def build_single_mask(roi_ds_dict: Dict[str, Dataset], sitk_image_params: Dict[s
         logger.warning(f"No valid contour data processed for ROI '{roi_name}' (number: {roi_number}).")
         return None
     
-    # Draw all contours per slice
+    # Bounding box (z, y, x) of the slice range and the polygons' extents, with a one voxel margin in-plane
+    slice_contours = {slice_idx: contours for slice_idx, contours in slice_contours.items() if 0 <= slice_idx < slices}
+    box_lo, box_hi = [], []
     for slice_idx, contours in slice_contours.items():
-        if len(contours) == 1 and len(contours[0]) == 1:
-            x = contours[0][0][0] >> shift  # Bit shift to divide
-            y = contours[0][0][1] >> shift
-            if 0 <= y < rows and 0 <= x < cols:
-                mask_np[slice_idx, y, x] = 1
-        else:
-            # Multiple points/contours
-            # Line types: LINE_4, LINE_8, LINE_AA
-            cv2.fillPoly(mask_np[slice_idx], contours, color=1, shift=shift, lineType=cv2.LINE_8)
+        xy_points = np.concatenate(contours) >> CONTOUR_FILL_SHIFT
+        box_lo.append((slice_idx, xy_points[:, 1].min() - 1, xy_points[:, 0].min() - 1))
+        box_hi.append((slice_idx + 1, xy_points[:, 1].max() + 2, xy_points[:, 0].max() + 2))
+    for matrix_points_int in nonplanar_points:
+        # Out-of-grid points are clamped to the grid edges, which this box then shares
+        box_lo.append(np.clip(matrix_points_int.min(axis=0), 0, grid_shape[::-1] - 1)[::-1])
+        box_hi.append(np.clip(matrix_points_int.max(axis=0), 0, grid_shape[::-1] - 1)[::-1] + 1)
+    if box_lo:
+        start = np.clip(np.min(box_lo, axis=0), 0, grid_shape)
+        stop = np.maximum(np.clip(np.max(box_hi, axis=0), 0, grid_shape), start)
+    else:
+        start = stop = np.zeros(3, dtype=np.int64)
+    mask_np = np.zeros(tuple(stop - start), dtype=np.uint8)
     
-    # Create SimpleITK image from numpy array
-    mask_sitk: sitk.Image = sitk.GetImageFromArray(mask_np)
-    mask_sitk.SetSpacing(sitk_image_params["spacing"])
-    mask_sitk.SetDirection(sitk_image_params["direction"])
-    mask_sitk.SetOrigin(sitk_image_params["origin"])
+    # Draw all contours per slice, shifted into the box; slices outside the image grid are dropped
+    if not mask_np.size:
+        slice_contours, nonplanar_points = {}, []  # Every contour lies outside the image grid
+    xy_offset = np.array((start[2], start[1]), dtype=np.int32) << CONTOUR_FILL_SHIFT
+    for slice_idx, contours in slice_contours.items():
+        _fill_slice_polygons(mask_np[slice_idx - start[0]], [contour - xy_offset for contour in contours])
+    for matrix_points_int in nonplanar_points:
+        numpy_roi_mask_generation(mask=mask_np, matrix_points=matrix_points_int - start[::-1].astype(np.int32), geometric_type="OPEN_NONPLANAR")
+    
+    # Keep only the bounding box of the mask; its offset within the image grid is stored in metadata
+    mask_sitk: sitk.Image = crop_mask_array_to_image(
+        mask_np, 
+        spacing=sitk_image_params["spacing"], 
+        direction=sitk_image_params["direction"], 
+        origin=sitk_image_params["origin"],
+        array_index=tuple(int(v) for v in start[::-1]),
+        full_size=tuple(int(v) for v in grid_shape[::-1]),
+    )
+    
+    # Centroid, bounding box, voxel count and volume are computed once here and travel with the mask
+    set_mask_statistics(mask_sitk)
 
     return mask_sitk
 
 
+class LazyROIMask:
+    """
+    Binary ROI mask rasterized one slice at a time, on demand.
+    
+    Axial slices are filled exactly as build_single_mask fills them and memoized. Coronal and sagittal
+    lines crossing slices that are not filled yet are previewed from the raw contour polygons, until
+    the background fill reaches those slices. Once every slice is filled, to_image returns the same
+    cropped mask as build_single_mask. Only planar contours are supported.
+    """
+    
+    def __init__(self, roi_contours: Dict[str, Any], sitk_image_params: Dict[str, Any], roi_name: str, roi_number: int) -> None:
+        self.sitk_image_params = sitk_image_params
+        self.shape = (sitk_image_params["slices"], sitk_image_params["rows"], sitk_image_params["cols"])
+        self._origin, self._spacing, self._A_inv_T = _get_contour_transform(sitk_image_params)
+        
+        # Planar contours with their raw matrix points, and the range of slices each one can reach
+        valid_contours = _get_valid_roi_contours(roi_contours, roi_name, roi_number)
+        self._contour_points = [points for _, _, points in valid_contours]
+        self._raw_matrix_points = [(points - self._origin) @ self._A_inv_T for points in self._contour_points]
+        self._contour_slice_lo = np.array([np.round(pts[:, 2].min() - 1e-3) for pts in self._raw_matrix_points], dtype=np.int64)
+        self._contour_slice_hi = np.array([np.round(pts[:, 2].max() + 1e-3) for pts in self._raw_matrix_points], dtype=np.int64)
+        
+        # Memoized slices cover the bounding box of the contours (with a one voxel margin), clipped to the grid
+        if self._raw_matrix_points:
+            all_points = np.concatenate(self._raw_matrix_points)
+            lo = np.floor(all_points.min(axis=0)).astype(np.int64)[::-1] - 1  # (z, y, x)
+            hi = np.ceil(all_points.max(axis=0)).astype(np.int64)[::-1] + 2
+        else:
+            lo, hi = np.zeros(3, dtype=np.int64), np.zeros(3, dtype=np.int64)
+        self._start = np.clip(lo, 0, self.shape)
+        self._stop = np.maximum(np.clip(hi, 0, self.shape), self._start)
+        self._array = np.zeros(tuple(self._stop - self._start), dtype=np.uint8)
+        self._filled = np.zeros(self._array.shape[0], dtype=bool)
+        self._num_filled = 0
+        self._line_cache: Dict[Tuple[int, int], Tuple[int, np.ndarray]] = {}  # (axis, index) -> (filled slices when built, plane)
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def supports(roi_contours: Dict[str, Any]) -> bool:
+        """True if the contour store can be rasterized lazily (it has no OPEN_NONPLANAR contours)."""
+        return "OPEN_NONPLANAR" not in roi_contours["geometric_types"]
+    
+    @property
+    def is_complete(self) -> bool:
+        """True once every slice of the mask is filled."""
+        return self._num_filled == len(self._filled)
+    
+    def _get_slice_polygons(self, slice_idx: int, dense: bool = True) -> List[np.ndarray]:
+        """Return the fixed-point polygons of one slice, from densified contours (exact) or raw ones (preview)."""
+        slice_contours: Dict[int, List[np.ndarray]] = {}
+        candidates = np.flatnonzero((self._contour_slice_lo <= slice_idx) & (self._contour_slice_hi >= slice_idx))
+        for contour_idx in candidates:
+            if dense:
+                dense_points_3d = resample_contour_dense(self._contour_points[contour_idx], spacing=self._spacing)
+                matrix_points_float = (dense_points_3d - self._origin) @ self._A_inv_T
+            else:
+                matrix_points_float = self._raw_matrix_points[contour_idx]
+            _add_slice_polygons(slice_contours, matrix_points_float, only_slice=slice_idx)
+        return slice_contours.get(slice_idx, [])
+    
+    def _fill_slice(self, local_z: int) -> None:
+        """Rasterize one slice of the memoized bounding box (caller holds the lock)."""
+        if self._filled[local_z]:
+            return
+        contours = self._get_slice_polygons(int(self._start[0]) + local_z)
+        if contours:
+            mask_slice = np.zeros(self.shape[1:], dtype=np.uint8)
+            _fill_slice_polygons(mask_slice, contours)
+            self._array[local_z] = mask_slice[self._start[1]:self._stop[1], self._start[2]:self._stop[2]]
+        self._filled[local_z] = True
+        self._num_filled += 1
+    
+    def fill_next_slice(self) -> bool:
+        """Rasterize the next unfilled slice. Returns False once the mask is complete."""
+        with self._lock:
+            if self.is_complete:
+                return False
+            self._fill_slice(int(np.argmin(self._filled)))
+            return True
+    
+    def fill_all(self) -> None:
+        """Rasterize every remaining slice."""
+        while self.fill_next_slice():
+            pass
+    
+    def _get_line_preview(self, axis: int, index: int) -> np.ndarray:
+        """Return the (slices, cols) row or (slices, rows) column at an index within the bounding box, previewing unfilled slices (caller holds the lock)."""
+        cached = self._line_cache.get((axis, index))
+        if cached is not None and cached[0] == self._num_filled:
+            return cached[1]
+        
+        local_index = index - int(self._start[axis])
+        line_slicer = (slice(None), local_index, slice(None)) if axis == 1 else (slice(None), slice(None), local_index)
+        plane = self._array[line_slicer].copy()
+        line_shape = (1, self.shape[2]) if axis == 1 else (self.shape[1], 1)
+        line_offset = np.array([0, index << CONTOUR_FILL_SHIFT] if axis == 1 else [index << CONTOUR_FILL_SHIFT, 0], dtype=np.int32)
+        in_plane_start, in_plane_stop = int(self._start[3 - axis]), int(self._stop[3 - axis])
+        for local_z in np.flatnonzero(~self._filled):
+            contours = self._get_slice_polygons(int(self._start[0]) + int(local_z), dense=False)
+            if not contours:
+                continue
+            line = np.zeros(line_shape, dtype=np.uint8)
+            _fill_slice_polygons(line, [points - line_offset for points in contours])
+            plane[local_z] = line.ravel()[in_plane_start:in_plane_stop]
+        
+        self._line_cache[(axis, index)] = (self._num_filled, plane)
+        return plane
+    
+    def get_plane(self, slicer: Tuple[Union[slice, int], ...]) -> np.ndarray:
+        """Return the 2D uint8 mask within a (z, y, x) slicer (one index, two slices) of the full grid."""
+        index_axis = next(axis for axis, s in enumerate(slicer) if not isinstance(s, slice))
+        index = slicer[index_axis]
+        plane_axes = [axis for axis in range(3) if axis != index_axis]
+        plane = np.zeros(tuple(slicer[axis].stop - slicer[axis].start for axis in plane_axes), dtype=np.uint8)
+        if not self._start[index_axis] <= index < self._stop[index_axis]:
+            return plane
+        
+        # Overlap of the requested plane and the bounding box
+        src, dest = [], []
+        for axis in plane_axes:
+            lo = max(slicer[axis].start, int(self._start[axis]))
+            hi = min(slicer[axis].stop, int(self._stop[axis]))
+            if hi <= lo:
+                return plane
+            src.append(slice(lo - int(self._start[axis]), hi - int(self._start[axis])))
+            dest.append(slice(lo - slicer[axis].start, hi - slicer[axis].start))
+        
+        with self._lock:
+            if index_axis == 0:
+                local_z = index - int(self._start[0])
+                self._fill_slice(local_z)
+                plane[tuple(dest)] = self._array[local_z][tuple(src)]
+            else:
+                plane[tuple(dest)] = self._get_line_preview(index_axis, index)[tuple(src)]
+        return plane
+    
+    def get_value(self, index: Tuple[int, int, int]) -> bool:
+        """Return whether the mask is set at a (z, y, x) voxel, filling its slice if needed."""
+        z, y, x = index
+        return bool(self.get_plane((z, slice(y, y + 1), slice(x, x + 1)))[0, 0])
+    
+    def to_image(self) -> sitk.Image:
+        """Return the complete mask cropped to its nonzero bounding box, as build_single_mask does."""
+        self.fill_all()
+        params = self.sitk_image_params
+        mask_sitk = crop_mask_array_to_image(
+            self._array,
+            spacing=params["spacing"],
+            direction=params["direction"],
+            origin=params["origin"],
+            array_index=tuple(int(v) for v in self._start[::-1]),
+            full_size=self.shape[::-1],
+        )
+        set_mask_statistics(mask_sitk)
+        return mask_sitk
+
+
 class DataManager:
     """Manages RT data loading and processing using SimpleITK."""
 
@@ -182,11 +458,39 @@ class DataManager:
         )
         self._num_dose_colors = len(self._dose_colors)
         
+        # Lookup tables for 8-bit compositing: dose wash colors by quantized dose, and texture values by byte
+        self._dose_lut = np.rint(self._dosewash_colormap(np.linspace(0.0, 1.0, DOSE_LUT_SIZE)) * 255.0).astype(np.uint8)
+        self._texture_lut = (np.arange(256, dtype=np.float32) / 255.0).reshape(256, 1)
+        self._window_level_luts: Dict[Tuple[str, float, float, float, float], Optional[np.ndarray]] = {}  # (dtype, slope, intercept, lower, upper)
+        
         self.HU_to_RED_map = create_HU_to_RED_map(
             hu_values=conf_mgr.get_ct_HU_map_vals(), 
             red_values=conf_mgr.get_ct_RED_map_vals()
         )
         
+        # Staging area for background prefetch of the next patient
+        self._prefetch_lock = threading.Lock()
+        
+        self._prefetch_cancel_event = threading.Event()
+        self._prefetch_thread: Optional[threading.Thread] = None
+        self._prefetched: Dict[str, Any] = {}
+        
+        # Background completion of lazily rasterized ROI masks; the texture update function is submitted to the texture thread when one completes
+        self._lazy_roi_lock = threading.Lock()
+        self._lazy_roi_cancel_event = threading.Event()
+        self._lazy_roi_thread: Optional[threading.Thread] = None
+        self.on_lazy_roi_complete: Optional[Callable[..., None]] = None
+        
+        # Total size of the on-disk ROI mask cache, scanned on the first save and then tracked as masks are saved
+        self._mask_cache_lock = threading.Lock()
+        self._mask_cache_size: Optional[int] = None
+        
+        # Views are rendered concurrently; one at a time rebuilds the display cache before rendering. The packed
+        # label volumes are updated in place and read under the same lock, which the rebuild re-enters
+        self._texture_cache_lock = threading.RLock()
+        
+        self._display_version = 0  # Incremented whenever displayed data changes; see get_display_version
+        self._layer_versions: Dict[str, int] = {"image": 0, "roi": 0, "dose": 0}  # Same, per texture layer
         self.initialize_data()
         self._update_raw_data_params()
     
@@ -198,8 +502,12 @@ class DataManager:
         self.rtstruct_datasets: Dict[str, Dataset] = {}
         self.rtstruct_fpaths: Dict[str, str] = {}
         self.rtstruct_roi_metadata: Dict[str, Dict[int, Dict[str, Any]]] = {}
-        self.rtstruct_roi_ds_dicts: Dict[str, Dict[int, Dict[str, Dataset]]] = {}
-        self.rois: Dict[Tuple[str, int], sitk.Image] = {}
+        self.rtstruct_roi_ds_dicts: Dict[str, Dict[int, Dict[str, Dataset]]] = {}  # ROI datasets, without their ContourSequence
+        self.rtstruct_roi_records: Dict[str, Dict[int, Dict[str, Any]]] = {}  # Plain DICOM values per ROI
+        self.rtstruct_roi_contours: Dict[str, Dict[int, Dict[str, Any]]] = {}  # Packed contours per ROI
+        self.rois: Dict[Tuple[str, int], sitk.Image] = {}  # Masks cropped to their bounding boxes
+        self._lazy_rois: Dict[Tuple[str, int], LazyROIMask] = {}  # Displayed masks still being rasterized
+        self._roi_polylines: Dict[Tuple[str, int], Tuple[Optional[Dict[str, Any]], Optional[Dict[int, Any]]]] = {}  # (image params, polylines per slice)
         self.rtplan_datasets: Dict[str, Dataset] = {}
         self.rtplan_fpaths: Dict[str, str] = {}
         self.rtdoses: Dict[str, sitk.Image] = {}
@@ -209,13 +517,36 @@ class DataManager:
     
     def initialize_texture_cache(self) -> None:
         """Initialize temporary texture cache."""
-        self._cached_sitk_reference: Optional[sitk.Image] = None
+        self._cached_display_grid: Optional[Dict[str, Tuple]] = None  # Geometry of the displayed (resampled, rotated, flipped) grid
         self._cached_texture_param_dict: Dict[str, Any] = {}
-        self._cached_sitk_objects: Dict[Union[str, Tuple[str, int]], sitk.Image] = {}
-        self._cached_dose_sum: Optional[sitk.Image] = None
+        self._cached_sitk_objects: Dict[Union[str, Tuple[str, int]], Any] = {}  # Images and doses; placeholders (or None while lazy) for ROIs
+        self._cached_label_volumes: Dict[str, Dict[str, Any]] = {}  # Bit-packed cached ROIs per RTSTRUCT
+        self._cached_roi_stats: Dict[Tuple[str, int], Dict[str, Any]] = {}  # ROI statistics in display grid indices
+        self._cached_dose_sum: Optional[sitk.Image] = None  # Sum of the cached doses on the grid of the first one
+        self._dose_sum_array: Optional[np.ndarray] = None  # Accumulator that doses are added to and subtracted from
+        self._dose_sum_counts: Optional[np.ndarray] = None  # Number of summed doses that are non-zero at each voxel
+        self._dose_sum_keys: List[Tuple[str, str]] = []  # Doses in the sum, in the order they were added
+        self._dose_sum_max: Optional[Tuple[sitk.Image, float]] = None  # (dose sum, its maximum), computed when first needed
+        self._cached_layers: Dict[Tuple[str, str], Tuple[Tuple[Any, ...], Any]] = {}  # (view type, layer type) -> (layer key, layer)
+        self._mark_display_changed()
+    
+    def _mark_display_changed(self, *layer_types: str) -> None:
+        """
+        Record that the displayed data changed, so views rendered before the change are redrawn.
+        
+        Only the given texture layers ("image", "roi", "dose") are rebuilt, or all of them if none are given.
+        """
+        self._display_version += 1
+        for layer_type in layer_types or tuple(self._layer_versions):
+            self._layer_versions[layer_type] += 1
+    
+    def get_display_version(self) -> int:
+        """Return a counter that changes whenever displayed data, or how it is drawn, changes."""
+        return self._display_version
     
     def clear_data(self) -> None:
         """Clear all loaded data and trigger garbage collection."""
+        self._stop_lazy_roi_worker()
         self.images.clear()
         self.image_fpaths.clear()
         self.images_params.clear()
@@ -223,7 +554,11 @@ class DataManager:
         self.rtstruct_fpaths.clear()
         self.rtstruct_roi_metadata.clear()
         self.rtstruct_roi_ds_dicts.clear()
+        self.rtstruct_roi_records.clear()
+        self.rtstruct_roi_contours.clear()
         self.rois.clear()
+        self._lazy_rois.clear()
+        self._roi_polylines.clear()
         self.rtplan_datasets.clear()
         self.rtplan_fpaths.clear()
         self.rtdoses.clear()
@@ -234,10 +569,14 @@ class DataManager:
     
     def _clear_cache(self) -> None:
         """Clear all cached temporary data."""
-        self._cached_sitk_reference = None
+        self._cached_display_grid = None
         self._cached_texture_param_dict.clear()
         self._cached_sitk_objects.clear()
-        self._cached_dose_sum = None
+        self._cached_label_volumes.clear()
+        self._cached_roi_stats.clear()
+        self._reset_dose_sum()
+        self._cached_layers.clear()
+        self._mark_display_changed()
     
     @property
     def is_any_data_loaded(self) -> bool:
@@ -272,6 +611,27 @@ class DataManager:
     def load_all_dicom_data(self, patient: Patient, selected_files: Set[str]) -> None:
         """Loads selected DICOM data."""
         self._clear_cache()
+        self._finish_prefetch(patient)
+        img_data, rtstruct_files, rtplan_files, rtdose_data = self._classify_patient_files(patient, selected_files)
+        
+        # set class patient to use in other functions ###
+        self._load_all_concurrently(img_data, rtstruct_files, rtplan_files, rtdose_data)
+        self._discard_prefetched()
+
+        # Review from here
+        self._clear_cache()
+        if not self.is_any_data_loaded:
+            logger.error("No valid data was selected or loaded, please try again.")
+            return
+        self.load_rtstruct_goals(patient.mrn)
+        logger.info("Loaded SITK data")
+    
+    def _classify_patient_files(
+        self, 
+        patient: Patient, 
+        selected_files: Optional[Set[str]] = None
+    ) -> Tuple[Dict[str, List[File]], List[File], List[File], Dict[str, List[File]]]:
+        """Group a patient's existing files by modality. If selected_files is None, all files are used."""
         modalities: Dict[str, Set[str]] = self.conf_mgr.get_dicom_modalities()
         
         img_data: Dict[str, List[File]] = {}
@@ -290,7 +650,7 @@ class DataManager:
             if not exists(file_path):
                 logger.error(f"Skipping file '{file_obj.path}' because the file does not exist at path '{file_path}'.")
                 continue
-            if file_path not in selected_files:
+            if selected_files is not None and file_path not in selected_files:
                 continue # No message needed; user intentionally deselected
             
             file_md: FileMetadata = file_obj.file_metadata
@@ -344,19 +704,208 @@ class DataManager:
                 logger.error(f"Skipping file '{file_obj.path}' due to unsupported Modality '{file_modality}'.")
                 continue
         
-        # set class patient to use in other functions ###
-        self.load_images(img_data)
-        self.load_rtstructs(rtstruct_files)
-        self.load_rtplans(rtplan_files)
-        self.load_rtdoses(rtdose_data)
-
-        # Review from here
-        self._clear_cache()
-        if not self.is_any_data_loaded:
-            logger.error("No valid data was selected or loaded, please try again.")
+        return img_data, rtstruct_files, rtplan_files, rtdose_data
+    
+    def _load_all_concurrently(
+        self, 
+        img_data: Dict[str, List[File]], 
+        rtstruct_files: List[File], 
+        rtplan_files: List[File], 
+        rtdose_data: Dict[str, List[File]]
+    ) -> None:
+        """
+        Build IMAGEs, RTSTRUCTs, RTPLANs, and RTDOSEs on the executor, then add them in dependency order.
+        
+        All tasks are independent, so no worker waits on another task. Each RTSTRUCT is built against the geometry
+        read from the headers of the IMAGE series it references (matched via the database metadata), which is
+        cross-checked against the built IMAGE when the results are added.
+        """
+        load_start = perf_counter()
+        stage_lock = threading.Lock()
+        stage_stats: Dict[str, Dict[str, float]] = {
+            stage: {"count": 0, "busy": 0.0, "done": 0.0} for stage in ("image", "rtstruct", "rtplan", "rtdose")
+        }
+        
+        def run_timed(stage: str, func: Callable[..., Any], *args: Any) -> Any:
+            task_start = perf_counter()
+            try:
+                return func(*args)
+            finally:
+                task_end = perf_counter()
+                with stage_lock:
+                    stage_stats[stage]["count"] += 1
+                    stage_stats[stage]["busy"] += task_end - task_start
+                    stage_stats[stage]["done"] = max(stage_stats[stage]["done"], task_end - load_start)
+        
+        def build_rtstruct_from_headers(rtstruct_file: File, series_uid: str) -> Any:
+            header_params = read_image_params([f.path for f in img_data[series_uid]], self.ss_mgr, series_uid)
+            if header_params is None:
+                logger.error(f"Skipping RTSTRUCT file '{rtstruct_file.path}' because the geometry of its referenced IMAGE could not be read.")
+                return None
+            result = self._build_rtstruct(rtstruct_file, header_params)
+            return None if result is None else (series_uid, header_params, result)
+        
+        def collect(futures: List[Tuple[Any, Optional[Future]]]) -> List[Tuple[Any, Any]]:
+            results = []
+            for item, fu in futures:
+                if fu is None or self.ss_mgr.cleanup_event.is_set() or self.ss_mgr.shutdown_event.is_set():
+                    continue
+                try:
+                    result = fu.result()
+                except Exception as e:
+                    logger.exception(f"Failed to load data for '{item}'.", exc_info=True, stack_info=True)
+                    continue
+                if result is not None:
+                    results.append((item, result))
+            return results
+        
+        self.ss_mgr.startup_executor(use_process_pool=False)
+        try:
+            image_futures: Dict[str, Optional[Future]] = {}
+            for series_uid, files in img_data.items():
+                if series_uid in self.images:
+                    logger.error(f"Skipping IMAGE SeriesInstanceUID '{series_uid}' due to duplicate series already loaded.")
+                    continue
+                image_futures[series_uid] = self.ss_mgr.submit_executor_action(run_timed, "image", self._build_image_series, series_uid, files)
+            
+            rtplan_futures = [
+                (rtplan_file, self.ss_mgr.submit_executor_action(run_timed, "rtplan", self._build_rtplan, rtplan_file))
+                for rtplan_file in rtplan_files
+                if (rtplan_file.file_metadata.sop_instance_uid or "").strip() not in self.rtplan_datasets
+            ]
+            rtdose_futures = [
+                (dose_file, self.ss_mgr.submit_executor_action(run_timed, "rtdose", self._build_rtdose, dose_file))
+                for dose_files in rtdose_data.values() for dose_file in dose_files
+                if (dose_file.file_metadata.sop_instance_uid or "").strip() not in self.rtdoses
+            ]
+            
+            rtstruct_futures = []
+            for rtstruct_file in rtstruct_files:
+                if (rtstruct_file.file_metadata.sop_instance_uid or "").strip() in self.rtstruct_datasets:
+                    logger.error(f"Skipping RTSTRUCT file '{rtstruct_file.path}' due to duplicate SOPInstanceUID already loaded.")
+                    continue
+                matched_ref_series_uid = self._match_rtstruct_ref_series_uid(rtstruct_file, image_futures.keys())
+                if matched_ref_series_uid is None:
+                    continue
+                rtstruct_futures.append(
+                    (rtstruct_file, self.ss_mgr.submit_executor_action(run_timed, "rtstruct", build_rtstruct_from_headers, rtstruct_file, matched_ref_series_uid))
+                )
+            
+            # Add results in the same order as the sequential loaders
+            for series_uid, sitk_image in collect(list(image_futures.items())):
+                self.images[series_uid] = sitk_image
+                self.image_fpaths[series_uid] = [f.path for f in img_data[series_uid]]
+            self._update_images_params()
+            for rtstruct_file, (series_uid, header_params, result) in collect(rtstruct_futures):
+                image_params = self.images_params.get(series_uid)
+                if image_params is None:
+                    logger.error(f"Skipping RTSTRUCT file '{rtstruct_file.path}' because its referenced IMAGE failed to load.")
+                    continue
+                if not self._image_params_match(header_params, image_params):
+                    logger.warning(
+                        f"Geometry read from the headers of IMAGE '{series_uid}' differs from the built IMAGE; "
+                        f"recomputing the contour slices of RTSTRUCT file '{rtstruct_file.path}'."
+                    )
+                    for store in result[4].values():
+                        store["slice_indices"] = get_contour_slice_indices(store["vertices"], store["offsets"], image_params)
+                self._add_rtstruct(rtstruct_file.path, *result)
+            for rtplan_file, rtplan_ds in collect(rtplan_futures):
+                self._add_rtplan(rtplan_file, rtplan_ds)
+            for dose_file, sitk_dose in collect(rtdose_futures):
+                self._add_rtdose(dose_file, sitk_dose)
+        finally:
+            self.ss_mgr.shutdown_executor()
+        
+        for stage, stats in stage_stats.items():
+            if stats["count"]:
+                logger.info(
+                    f"Loaded {int(stats['count'])} {stage.upper()} item(s): finished {stats['done']:.2f} s after load start "
+                    f"({stats['busy']:.2f} s of worker time)."
+                )
+        logger.info(f"Loaded all selected data in {perf_counter() - load_start:.2f} s.")
+    
+    ### Prefetch Methods ###
+    def prefetch_patient_data(self, patient: Patient) -> None:
+        """Decode a patient's image series and doses in the background into a staging area."""
+        if patient is None:
             return
-        self.load_rtstruct_goals(patient.mrn)
-        logger.info("Loaded SITK data")
+        self._finish_prefetch()
+        self._discard_prefetched()
+        self._prefetch_cancel_event.clear()
+        self._prefetch_thread = threading.Thread(target=self._prefetch_worker, args=(patient,), daemon=True)
+        self._prefetch_thread.start()
+    
+    def _prefetch_worker(self, patient: Patient) -> None:
+        """Build staged image series and doses one at a time, yielding to foreground actions."""
+        try:
+            img_data, _, _, rtdose_data = self._classify_patient_files(patient)
+            jobs = [("image", uid, tuple(f.path for f in files)) for uid, files in img_data.items()]
+            jobs += [("dose", (f.file_metadata.sop_instance_uid or "").strip(), (f.path,)) for files in rtdose_data.values() for f in files]
+            
+            with self._prefetch_lock:
+                self._prefetched = {"patient_id": patient.id, "image": {}, "dose": {}}
+            
+            for data_type, uid, file_paths in jobs:
+                # Low priority: wait for any foreground action to finish before decoding the next object
+                while self.ss_mgr.action_event.is_set() and not self._is_prefetch_cancelled():
+                    sleep(0.1)
+                if self._is_prefetch_cancelled():
+                    logger.info(f"Prefetch for patient {patient.mrn} was cancelled.")
+                    return
+                
+                native_pixel_type = self.conf_mgr.get_bool_store_native_pixel_types()
+                if data_type == "image":
+                    sitk_data = construct_image(
+                        list(file_paths), self.ss_mgr, uid, native_pixel_type=native_pixel_type, cancel_event=self._prefetch_cancel_event
+                    )
+                else:
+                    sitk_data = construct_dose(
+                        file_paths[0], self.ss_mgr, native_pixel_type=native_pixel_type, cancel_event=self._prefetch_cancel_event
+                    )
+                if self._is_prefetch_cancelled():
+                    logger.info(f"Prefetch for patient {patient.mrn} was cancelled.")
+                    return
+                if sitk_data is None:
+                    continue
+                
+                with self._prefetch_lock:
+                    if self._prefetched.get("patient_id") == patient.id:
+                        self._prefetched[data_type][uid] = (file_paths, sitk_data)
+            
+            logger.info(f"Prefetched {len(jobs)} image series/doses for patient {patient.mrn}.")
+        except Exception:
+            logger.exception(f"Failed to prefetch data for patient {getattr(patient, 'mrn', None)}.", exc_info=True, stack_info=True)
+    
+    def _is_prefetch_cancelled(self) -> bool:
+        """True if the running prefetch should stop."""
+        return self._prefetch_cancel_event.is_set() or self.ss_mgr.cleanup_event.is_set() or self.ss_mgr.shutdown_event.is_set()
+    
+    def _finish_prefetch(self, patient: Optional[Patient] = None) -> None:
+        """Stop any running prefetch, keeping finished objects only if they belong to the given patient."""
+        thread = self._prefetch_thread
+        if thread is not None and thread.is_alive():
+            self._prefetch_cancel_event.set()
+            thread.join()
+        self._prefetch_thread = None
+        if patient is not None and self._prefetched.get("patient_id") != patient.id:
+            self._discard_prefetched()
+    
+    def _take_prefetched(self, data_type: Literal["image", "dose"], uid: str, file_paths: List[str]) -> Optional[sitk.Image]:
+        """Pop a staged object if it was built from exactly the same files."""
+        with self._prefetch_lock:
+            staged = self._prefetched.get(data_type, {}).pop(uid, None)
+        if staged is None:
+            return None
+        staged_paths, sitk_data = staged
+        if tuple(staged_paths) != tuple(file_paths):
+            return None
+        logger.info(f"Using prefetched {data_type} data for UID '{uid}'.")
+        return sitk_data
+    
+    def _discard_prefetched(self) -> None:
+        """Drop any staged objects."""
+        with self._prefetch_lock:
+            self._prefetched = {}
     
     ### Internal Data Retrieval Methods ###
     def _get_data(self, data_type: Literal["image", "roi", "dose"], key: Union[str, Tuple[str, int]], use_cached: bool = False) -> Optional[sitk.Image]:
@@ -364,7 +913,15 @@ class DataManager:
         if use_cached:
             cache_key = (data_type, *key) if isinstance(key, tuple) else (data_type, key)
             self.update_cached_data(True, cache_key)  # builds ROI and adds to cache if needed
-            return self._cached_sitk_objects.get(cache_key, None)
+            if data_type == "roi":
+                self._finish_lazy_roi(*key)  # A lazily rasterized ROI is completed before use
+                return self._get_packed_roi_image(*key)
+            sitk_data = self._cached_sitk_objects.get(cache_key, None)
+            grid = self._cached_display_grid
+            if sitk_data is not None and grid is not None and not is_same_grid(get_image_grid(sitk_data), grid):
+                # Images and doses are resliced per view; resample in full
+                return copy_rescale_params(sitk_data, resample_to_grid(sitk_data, grid, interpolator=self._get_interpolator(data_type)))
+            return sitk_data
         
         if data_type == "image":
             return self.images.get(key, None)
@@ -388,11 +945,19 @@ class DataManager:
                 return
 
             cached_roi_keys = [k for k in self._cached_sitk_objects.keys() if k[0] == "roi"]
+            lazy_mask = self._lazy_rois.get(cached_roi_keys[0][1:]) if cached_roi_keys else None
+            if lazy_mask is not None and cached_roi_keys[0][1:] not in self.rois:
+                params = lazy_mask.sitk_image_params
+                self.original_size = (params["cols"], params["rows"], params["slices"])
+                self.original_spacing = tuple(params["spacing"])
+                self.original_origin = tuple(params["origin"])
+                self.original_direction = tuple(params["direction"])
+                return
             if cached_roi_keys and cached_roi_keys[0][1:] in self.rois:
                 roi = self.rois[cached_roi_keys[0][1:]]
-                self.original_size = roi.GetSize()
+                self.original_size = get_crop_params(roi)[1]
                 self.original_spacing = roi.GetSpacing()
-                self.original_origin = roi.GetOrigin()
+                self.original_origin = get_full_grid_origin(roi)
                 self.original_direction = roi.GetDirection()
                 return
             
@@ -416,9 +981,9 @@ class DataManager:
         
         elif self.rois:
             first_roi = next(iter(self.rois.values()))
-            self.original_size = first_roi.GetSize()
+            self.original_size = get_crop_params(first_roi)[1]
             self.original_spacing = first_roi.GetSpacing()
-            self.original_origin = first_roi.GetOrigin()
+            self.original_origin = get_full_grid_origin(first_roi)
             self.original_direction = first_roi.GetDirection()
         
         elif self.rtdoses:
@@ -449,39 +1014,62 @@ class DataManager:
                 logger.error(f"Skipping IMAGE SeriesInstanceUID '{series_instance_uid}' due to duplicate series already loaded.")
                 continue
             
-            # Get info for files
-            file_paths = [f.path for f in files]
-            modality = (files[0].file_metadata.modality or "").strip().upper()
-            logger.debug(f"Loading {modality} series {series_instance_uid} from {len(file_paths)} files")
-            
-            # Construct image
-            sitk_image = construct_image(file_paths, self.ss_mgr, series_instance_uid)
-            if sitk_image is None:
-                logger.error(f"Failed to load {modality} with SeriesInstanceUID '{series_instance_uid}'.")
-                continue
-            
-            # Validate SeriesInstanceUID
-            validate_series_uid = str(sitk_image.GetMetaData("SeriesInstanceUID")).strip()
-            if validate_series_uid != series_instance_uid:
-                logger.error(f"Mismatch in SeriesInstanceUID for IMAGE files '{file_paths}': metadata has '{series_instance_uid}' but DICOM has '{validate_series_uid}'. Skipping.")
-                continue
-            
-            # Add to dictionaries
-            self.images[series_instance_uid] = sitk_image
-            self.image_fpaths[series_instance_uid] = file_paths
-        
-        self.images_params = {
-            k: {
-                "origin": sitk_image.GetOrigin(),
-                "spacing": sitk_image.GetSpacing(),
-                "direction": sitk_image.GetDirection(),
-                "cols": sitk_image.GetSize()[0],
-                "rows": sitk_image.GetSize()[1],
-                "slices": sitk_image.GetSize()[2],
-            } 
-            for k, sitk_image in self.images.items()
+            sitk_image = self._build_image_series(series_instance_uid, files)
+            if sitk_image is not None:
+                self.images[series_instance_uid] = sitk_image
+                self.image_fpaths[series_instance_uid] = [f.path for f in files]
+        
+        self._update_images_params()
+    
+    def _build_image_series(self, series_instance_uid: str, files: List[File]) -> Optional[sitk.Image]:
+        """Construct (or adopt a prefetched) IMAGE series and validate its SeriesInstanceUID."""
+        # Get info for files
+        file_paths = [f.path for f in files]
+        modality = (files[0].file_metadata.modality or "").strip().upper()
+        logger.debug(f"Loading {modality} series {series_instance_uid} from {len(file_paths)} files")
+        
+        # Construct image, unless it was already prefetched
+        sitk_image = self._take_prefetched("image", series_instance_uid, file_paths)
+        if sitk_image is None:
+            sitk_image = construct_image(
+                file_paths, self.ss_mgr, series_instance_uid, 
+                native_pixel_type=self.conf_mgr.get_bool_store_native_pixel_types()
+            )
+        if sitk_image is None:
+            logger.error(f"Failed to load {modality} with SeriesInstanceUID '{series_instance_uid}'.")
+            return None
+        
+        # Validate SeriesInstanceUID
+        validate_series_uid = str(sitk_image.GetMetaData("SeriesInstanceUID")).strip()
+        if validate_series_uid != series_instance_uid:
+            logger.error(f"Mismatch in SeriesInstanceUID for IMAGE files '{file_paths}': metadata has '{series_instance_uid}' but DICOM has '{validate_series_uid}'. Skipping.")
+            return None
+        
+        return sitk_image
+    
+    @staticmethod
+    def _get_image_params(sitk_image: sitk.Image) -> Dict[str, Any]:
+        """Return the geometry parameters of an image used for ROI construction."""
+        return {
+            "origin": sitk_image.GetOrigin(),
+            "spacing": sitk_image.GetSpacing(),
+            "direction": sitk_image.GetDirection(),
+            "cols": sitk_image.GetSize()[0],
+            "rows": sitk_image.GetSize()[1],
+            "slices": sitk_image.GetSize()[2],
         }
     
+    @staticmethod
+    def _image_params_match(params_a: Dict[str, Any], params_b: Dict[str, Any]) -> bool:
+        """Return True if two image geometries have the same size and (within tolerance) origin, spacing and direction."""
+        if any(params_a[key] != params_b[key] for key in ("cols", "rows", "slices")):
+            return False
+        return all(np.allclose(params_a[key], params_b[key], rtol=1e-5, atol=1e-4) for key in ("origin", "spacing", "direction"))
+    
+    def _update_images_params(self) -> None:
+        """Rebuild image geometry parameters for all loaded IMAGEs."""
+        self.images_params = {k: self._get_image_params(sitk_image) for k, sitk_image in self.images.items()}
+    
     def get_image_series_uids(self) -> List[str]:
         """Return list of available image SeriesInstanceUIDs."""
         return list(self.images.keys())
@@ -549,65 +1137,104 @@ class DataManager:
             if self.ss_mgr.cleanup_event.is_set() or self.ss_mgr.shutdown_event.is_set():
                 return
             
-            # Get file info
-            file_path = rtstruct_file.path
-            modality = (rtstruct_file.file_metadata.modality or "").strip().upper()
-            sop_instance_uid = (rtstruct_file.file_metadata.sop_instance_uid or "").strip()
-            
             # Skip if already loaded
+            sop_instance_uid = (rtstruct_file.file_metadata.sop_instance_uid or "").strip()
             if sop_instance_uid in self.rtstruct_datasets:
-                logger.error(f"Skipping RTSTRUCT file '{file_path}' due to duplicate SOPInstanceUID '{sop_instance_uid}' already loaded.")
-                continue
-            
-            # Get a referenced SeriesInstanceUID that matches a loaded IMAGE, so we can use its params for display
-            ref_series_uid_seq = get_json_list(rtstruct_file.file_metadata.referenced_series_instance_uid_seq)
-            if not ref_series_uid_seq:
-                logger.error(f"Skipping RTSTRUCT file '{file_path}' due to missing ReferencedSeriesInstanceUIDs.")
-                continue
-            matched_ref_series_uids = [uid for uid in ref_series_uid_seq if uid in self.images_params]
-            if not matched_ref_series_uids:
-                logger.error(f"Skipping RTSTRUCT file '{file_path}' as none of its ReferencedSeriesInstanceUIDs {ref_series_uid_seq} match loaded IMAGE SeriesInstanceUIDs.")
+                logger.error(f"Skipping RTSTRUCT file '{rtstruct_file.path}' due to duplicate SOPInstanceUID '{sop_instance_uid}' already loaded.")
                 continue
-            if len(set(matched_ref_series_uids)) > 1:
-                logger.warning(f"RTSTRUCT file '{file_path}' has multiple matched ReferencedSeriesInstanceUIDs: {matched_ref_series_uids}, only the first will be used.")
-            matched_ref_series_uid = matched_ref_series_uids[0]
-            image_params = self.images_params[matched_ref_series_uid]
-
-            # Extract RTSTRUCT and ROI datasets
-            logger.debug(f"Loading {modality} {sop_instance_uid}: {file_path}")
-            result = extract_rtstruct_and_roi_datasets(file_path, image_params, self.ss_mgr)
-            if result is None:
-                logger.error(f"Failed to extract RTSTRUCT data from file '{file_path}'.")
-                continue
-            rtstruct_ds: Dataset = result[0]
-            roi_ds_dict: Dict[int, Dict[str, Dataset]] = result[1] # ROI Number -> {"StructureSetROI": ds, "ROIContour": ds, "RTROIObservations": ds}
             
-            # Validate SOPInstanceUID
-            validate_sopiuid = str(rtstruct_ds.SOPInstanceUID).strip()
-            if validate_sopiuid != sop_instance_uid:
-                logger.error(f"Mismatch in SOPInstanceUID for RTSTRUCT file '{file_path}': metadata has '{sop_instance_uid}' but DICOM has '{validate_sopiuid}'. Skipping.")
+            matched_ref_series_uid = self._match_rtstruct_ref_series_uid(rtstruct_file, self.images_params.keys())
+            if matched_ref_series_uid is None:
                 continue
             
-            # Add to dictionaries
-            self.rtstruct_datasets[sop_instance_uid] = rtstruct_ds
-            self.rtstruct_fpaths[sop_instance_uid] = file_path
-            self.rtstruct_roi_ds_dicts[sop_instance_uid] = roi_ds_dict
-            
-            # Add metadata for each ROI
-            for roi_number in roi_ds_dict.keys():
-                self.init_roi_gui_metadata_by_uid(sop_instance_uid, roi_number)
+            result = self._build_rtstruct(rtstruct_file, self.images_params[matched_ref_series_uid])
+            if result is not None:
+                self._add_rtstruct(rtstruct_file.path, *result)
+    
+    def _match_rtstruct_ref_series_uid(self, rtstruct_file: File, series_uids: Iterable[str]) -> Optional[str]:
+        """Get a referenced SeriesInstanceUID that matches an IMAGE, so we can use its params for display."""
+        file_path = rtstruct_file.path
+        ref_series_uid_seq = get_json_list(rtstruct_file.file_metadata.referenced_series_instance_uid_seq)
+        if not ref_series_uid_seq:
+            logger.error(f"Skipping RTSTRUCT file '{file_path}' due to missing ReferencedSeriesInstanceUIDs.")
+            return None
+        series_uids = set(series_uids)
+        matched_ref_series_uids = [uid for uid in ref_series_uid_seq if uid in series_uids]
+        if not matched_ref_series_uids:
+            logger.error(f"Skipping RTSTRUCT file '{file_path}' as none of its ReferencedSeriesInstanceUIDs {ref_series_uid_seq} match loaded IMAGE SeriesInstanceUIDs.")
+            return None
+        if len(set(matched_ref_series_uids)) > 1:
+            logger.warning(f"RTSTRUCT file '{file_path}' has multiple matched ReferencedSeriesInstanceUIDs: {matched_ref_series_uids}, only the first will be used.")
+        return matched_ref_series_uids[0]
+    
+    def _build_rtstruct(
+        self, rtstruct_file: File, image_params: Dict[str, Any]
+    ) -> Optional[Tuple[str, Dataset, Dict[int, Dict[str, Dataset]], Dict[int, Dict[str, Any]], Dict[int, Dict[str, Any]]]]:
+        """
+        Read an RTSTRUCT, group its ROI datasets and pack their contours.
+        Returns (SOPInstanceUID, dataset, ROI dataset dict, ROI records, ROI contour stores) or None.
+        """
+        # Get file info
+        file_path = rtstruct_file.path
+        modality = (rtstruct_file.file_metadata.modality or "").strip().upper()
+        sop_instance_uid = (rtstruct_file.file_metadata.sop_instance_uid or "").strip()
+        
+        # Extract RTSTRUCT and ROI datasets
+        logger.debug(f"Loading {modality} {sop_instance_uid}: {file_path}")
+        result = extract_rtstruct_and_roi_datasets(file_path, image_params, self.ss_mgr)
+        if result is None:
+            logger.error(f"Failed to extract RTSTRUCT data from file '{file_path}'.")
+            return None
+        rtstruct_ds: Dataset = result[0]
+        roi_ds_dict: Dict[int, Dict[str, Dataset]] = result[1] # ROI Number -> {"StructureSetROI": ds, "ROIContour": ds, "RTROIObservations": ds}
+        
+        # Validate SOPInstanceUID
+        validate_sopiuid = str(rtstruct_ds.SOPInstanceUID).strip()
+        if validate_sopiuid != sop_instance_uid:
+            logger.error(f"Mismatch in SOPInstanceUID for RTSTRUCT file '{file_path}': metadata has '{sop_instance_uid}' but DICOM has '{validate_sopiuid}'. Skipping.")
+            return None
+        
+        # Pack the contours into contiguous arrays; the ContourSequence is released from the dataset
+        roi_records: Dict[int, Dict[str, Any]] = {}
+        roi_contour_stores: Dict[int, Dict[str, Any]] = {}
+        for roi_number, sub_ds_dict in roi_ds_dict.items():
+            roi_contour_stores[roi_number] = build_roi_contour_store(sub_ds_dict["ROIContour"], image_params)
+            roi_records[roi_number] = extract_roi_metadata(sub_ds_dict)
+        
+        return sop_instance_uid, rtstruct_ds, roi_ds_dict, roi_records, roi_contour_stores
+    
+    def _add_rtstruct(
+        self,
+        file_path: str,
+        sop_instance_uid: str,
+        rtstruct_ds: Dataset,
+        roi_ds_dict: Dict[int, Dict[str, Dataset]],
+        roi_records: Dict[int, Dict[str, Any]],
+        roi_contour_stores: Dict[int, Dict[str, Any]]
+    ) -> None:
+        """Add a built RTSTRUCT to the internal dictionaries and initialize its ROI metadata."""
+        self.rtstruct_datasets[sop_instance_uid] = rtstruct_ds
+        self.rtstruct_fpaths[sop_instance_uid] = file_path
+        self.rtstruct_roi_ds_dicts[sop_instance_uid] = roi_ds_dict
+        self.rtstruct_roi_records[sop_instance_uid] = roi_records
+        self.rtstruct_roi_contours[sop_instance_uid] = roi_contour_stores
+        
+        # Add metadata for each ROI
+        for roi_number in roi_ds_dict.keys():
+            self.init_roi_gui_metadata_by_uid(sop_instance_uid, roi_number)
     
     def get_rtstruct_uids(self) -> List[str]:
         """Return list of available RTSTRUCT SOPInstanceUIDs."""
         return list(self.rtstruct_datasets.keys())
     
-    def get_rtstruct_ds_value_by_uid_and_key(self, struct_uid: str, metadata_key: str, default: Any = None, return_deepcopy: bool = True) -> Any:
+    def get_rtstruct_ds_value_by_uid_and_key(self, struct_uid: str, metadata_key: str, default: Any = None, return_deepcopy: bool = False) -> Any:
         """Get metadata from RTSTRUCT using SOPInstanceUID.
         
         Args:
             struct_uid: RTSTRUCT SOPInstanceUID.
             metadata_key: The metadata key to retrieve.
             default: Default value if key doesn't exist.
+            return_deepcopy: Whether to return a deepcopy of the value instead of a read-only view (default: False).
             
         Returns:
             The metadata value or default.
@@ -616,7 +1243,7 @@ class DataManager:
             return default
         ds: Dataset = self.rtstruct_datasets[struct_uid]
         value = ds.get(metadata_key, default)
-        return deepcopy(value) if return_deepcopy else value
+        return deepcopy(value) if return_deepcopy else get_read_only_value(value)
 
 
     ### RTSTRUCT ROI Data Methods ###
@@ -706,32 +1333,117 @@ class DataManager:
         if (struct_uid, roi_number) in self.rois:
             return  # Already built
         
+        # Complete a mask that is being rasterized lazily for display
+        self._finish_lazy_roi(struct_uid, roi_number)
+        if (struct_uid, roi_number) in self.rois:
+            return
+        
+        build_inputs = self._get_roi_build_inputs(struct_uid, roi_number)
+        if build_inputs is None:
+            return
+        
+        # Build the mask (or read it from the on-disk cache)
+        mask_sitk = self._build_roi_mask(struct_uid, roi_number, *build_inputs)
+        if mask_sitk is None:
+            return
+        self.rois[(struct_uid, roi_number)] = mask_sitk
+    
+    def build_rtstruct_rois(
+        self,
+        struct_uid: str,
+        roi_numbers: Optional[List[int]] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> List[int]:
+        """
+        Build ROI masks of an RTSTRUCT in parallel on a private thread pool.
+        
+        The pool is local to the batch so it never disturbs the shared executor (e.g., a DICOM scan or patient load).
+        This blocks until the batch is done, so GUI callers should run it as an action (ss_mgr.submit_action).
+        
+        Args:
+            struct_uid: RTSTRUCT SOPInstanceUID.
+            roi_numbers: ROI numbers to build; all ROIs of the RTSTRUCT if None.
+            progress_callback: Optional callable receiving (completed, total, description).
+        
+        Returns:
+            ROI numbers whose masks are available after the batch.
+        """
+        if roi_numbers is None:
+            roi_numbers = self.get_rtstruct_roi_numbers_by_uid(struct_uid)
+        
+        # Gather inputs up front; already built, disabled, or invalid ROIs are not submitted
+        jobs: Dict[int, Tuple[Dict[str, Dataset], Dict[str, Any]]] = {}
+        for roi_number in roi_numbers:
+            if (struct_uid, roi_number) in self.rois or roi_number in jobs:
+                continue
+            build_inputs = self._get_roi_build_inputs(struct_uid, roi_number)
+            if build_inputs is not None:
+                jobs[roi_number] = build_inputs
+        
+        def build_job(roi_number: int) -> Optional[sitk.Image]:
+            if should_exit(self.ss_mgr, "Cancelling ROI mask building due to user request."):
+                return None
+            return self._build_roi_mask(struct_uid, roi_number, *jobs[roi_number])
+        
+        total = len(jobs)
+        description = f"Building {total} ROI mask(s) for RTSTRUCT '{struct_uid}'"
+        if total:
+            batch_start = perf_counter()
+            if progress_callback is not None:
+                progress_callback(0, total, description)
+            
+            # Mask filling (cv2) and the numpy transforms release the GIL, so threads scale across cores
+            executor = ThreadPoolExecutor(max_workers=max(1, min(self.ss_mgr.num_workers, total)), thread_name_prefix="roi_build")
+            try:
+                futures = {executor.submit(build_job, roi_number): roi_number for roi_number in jobs}
+                completed = 0
+                for fu in as_completed(futures):
+                    if should_exit(self.ss_mgr, "Cancelling ROI mask building due to user request."):
+                        break
+                    roi_number = futures[fu]
+                    completed += 1
+                    try:
+                        mask_sitk = fu.result()
+                    except Exception as e:
+                        logger.exception(f"Failed to build ROI number {roi_number} in RTSTRUCT '{struct_uid}'.", exc_info=True, stack_info=True)
+                        mask_sitk = None
+                    if mask_sitk is not None:
+                        self.rois[(struct_uid, roi_number)] = mask_sitk
+                    if progress_callback is not None:
+                        progress_callback(completed, total, description)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+            
+            logger.info(f"Built {completed} of {total} ROI mask(s) for RTSTRUCT '{struct_uid}' in {perf_counter() - batch_start:.2f} s.")
+            if progress_callback is not None and completed < total:
+                progress_callback(completed, total, "Cancelled building ROI masks.")
+        
+        return [roi_number for roi_number in roi_numbers if (struct_uid, roi_number) in self.rois]
+    
+    def _get_roi_build_inputs(self, struct_uid: str, roi_number: int) -> Optional[Tuple[Dict[str, Dataset], Dict[str, Any]]]:
+        """Return (ROI dataset dict, image parameters) needed to build an ROI mask, or None if it cannot or should not be built."""
         if struct_uid not in self.rtstruct_roi_ds_dicts:
             logger.error(f"RTSTRUCT with UID {struct_uid} not found. Cannot build ROI.")
-            return
+            return None
         roi_ds_dict = self.rtstruct_roi_ds_dicts[struct_uid].get(roi_number)
         if not roi_ds_dict:
             logger.error(f"ROI {roi_number} not found in RTSTRUCT {struct_uid}. Cannot build ROI.")
-            return
+            return None
         
         ref_series_uid = get_first_ref_series_uid(self.rtstruct_datasets[struct_uid])
         if not ref_series_uid or ref_series_uid not in self.images:
             logger.error(f"RTSTRUCT {struct_uid} references missing image series {ref_series_uid}. Cannot build ROI.")
-            return
+            return None
         image_params = self.images_params.get(ref_series_uid)
         if not image_params:
             logger.error(f"Missing image parameters for series {ref_series_uid}. Cannot build ROI.")
-            return
+            return None
         
         # Check metadata to see if disabled
         if self.rtstruct_roi_metadata.get(struct_uid, {}).get(roi_number, {}).get("disabled", True):
-            return  # ROI is disabled, do not build
+            return None  # ROI is disabled, do not build
         
-        # Build the mask
-        mask_sitk = build_single_mask(roi_ds_dict, image_params)
-        if mask_sitk is None:
-            return
-        self.rois[(struct_uid, roi_number)] = mask_sitk
+        return roi_ds_dict, image_params
     
     def get_rtstruct_roi_numbers_by_uid(
         self,
@@ -773,7 +1485,7 @@ class DataManager:
         roi_number: int,
         metadata_key: str,
         default: Any = None,
-        return_deepcopy: bool = True
+        return_deepcopy: bool = False
     ) -> Any:
         """
         Get metadata from a specific ROI in an RTSTRUCT, using SOPInstanceUID and ROI number.
@@ -783,7 +1495,7 @@ class DataManager:
             roi_number: ROI number within the RTSTRUCT.
             metadata_key: The metadata key to retrieve from one of the ROI sub-datasets.
             default: Default value if key doesn't exist.
-            return_deepcopy: Whether to return a deepcopy of the value (default: True).
+            return_deepcopy: Whether to return a deepcopy of the value instead of a read-only view (default: False).
 
         Returns:
             The metadata value or default.
@@ -796,15 +1508,30 @@ class DataManager:
         roi_ds_dict = self.rtstruct_roi_ds_dicts[struct_uid].get(roi_number)
         if not roi_ds_dict:
             return default
+        
+        # Plain values are kept in the ROI record and can be shared as they are
+        roi_record = self.rtstruct_roi_records.get(struct_uid, {}).get(roi_number, {})
+        if metadata_key in roi_record:
+            value = roi_record[metadata_key]
+            return deepcopy(value) if return_deepcopy else value
 
         # Iterate over sub-datasets for this ROI (StructureSetROI, ROIContour, ROIObservation)
         for sub_ds in roi_ds_dict.values():
             value = sub_ds.get(metadata_key, default)
             if value is not default:
-                return deepcopy(value) if return_deepcopy else value
+                return deepcopy(value) if return_deepcopy else get_read_only_value(value)
         
         return default
     
+    def get_rtstruct_roi_contours_by_uid(self, struct_uid: str, roi_number: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the packed contours of an ROI (see build_roi_contour_store), using SOPInstanceUID and ROI number.
+        
+        The arrays are read-only views shared with the data manager. Returns None if the ROI is not found.
+        """
+        roi_contours = self.rtstruct_roi_contours.get(struct_uid, {}).get(roi_number)
+        return dict(roi_contours) if roi_contours is not None else None
+    
     def get_rtstruct_filepath_by_uid(self, struct_uid: str) -> Optional[str]:
         """Get file path for RTSTRUCT using SOPInstanceUID."""
         return self.rtstruct_fpaths.get(struct_uid, None)
@@ -931,6 +1658,7 @@ class DataManager:
             return
 
         metadata_dict[key] = value
+        self._mark_display_changed("roi")
         logger.info(f"Set ROI metadata key '{key}' for struct ({struct_uid}, ROI {roi_number}) to {value}.")
 
     def get_roi_gui_metadata_by_uid(self, struct_uid: str, roi_number: int, return_deepcopy: bool = True) -> Dict[str, Any]:
@@ -1004,69 +1732,66 @@ class DataManager:
         
         return roi_names
     
-    def get_roi_center_of_mass_by_uid(self, struct_uid: str, roi_number: int) -> Optional[Tuple[int, int, int]]:
-        """ Return center of mass for an ROI. Returns center of mass as (x, y, z) tuple or None if no data. """
-        self.update_cached_data(True, ("roi", struct_uid, roi_number))  # ensure ROI is built and cached
-        sitk_roi: sitk.Image = self._cached_sitk_objects.get(("roi", struct_uid, roi_number), self.rois.get((struct_uid, roi_number), None))
+    def get_roi_statistics_by_uid(self, struct_uid: str, roi_number: int) -> Optional[Dict[str, Any]]:
+        """Return a copy of an ROI's geometry statistics (voxel count, volume in cc, physical centroid, bounding box in its image grid)."""
+        self.build_rtstruct_roi(struct_uid, roi_number)
+        sitk_roi = self.rois.get((struct_uid, roi_number))
         if sitk_roi is None:
-            logger.error(f"ROI {roi_number} in RTSTRUCT {struct_uid} could not be created; cannot compute center of mass.")
+            logger.error(f"ROI {roi_number} in RTSTRUCT {struct_uid} could not be created; cannot get its statistics.")
             return None
+        stats = get_mask_statistics(sitk_roi)
+        return stats if stats is not None else set_mask_statistics(sitk_roi)
+    
+    def _get_roi_display_statistics(self, struct_uid: str, roi_number: int) -> Optional[Dict[str, Any]]:
+        """Return the center of mass and extents of an ROI in display grid indices, transforming its stored statistics once per display reference."""
+        self.update_cached_data(True, ("roi", struct_uid, roi_number))  # ensure ROI is built and cached
+        if (struct_uid, roi_number) in self._cached_roi_stats:
+            return self._cached_roi_stats[(struct_uid, roi_number)]
         
-        stats = sitk.LabelShapeStatisticsImageFilter()
-        stats.Execute(sitk_roi)
-        
-        if not stats.HasLabel(1):
-            view = sitk.GetArrayViewFromImage(sitk_roi)
-            coords = np.argwhere(view > 0)
-            if coords.size == 0:  # No points
-                logger.error(f"ROI {roi_number} in RTSTRUCT {struct_uid} has no voxels in its mask; cannot compute center of mass.")
-                return None
-            elif coords.shape[0] == 1:  # Single point
-                return tuple(coords[0][::-1])  # (x, y, z)
-            else:  # Multiple points - return rounded mean
-                mean_idx = np.rint(coords.mean(axis=0)).astype(int)
-                return tuple(mean_idx[::-1])  # (x, y, z)
-        
-        # GetCentroid returns (x, y, z) in physical coordinates
-        centroid_phys = stats.GetCentroid(1)
-        
-        # Convert to voxel indices (integer tuple)
-        centroid_index = sitk_roi.TransformPhysicalPointToIndex(centroid_phys)
+        stats = self.get_roi_statistics_by_uid(struct_uid, roi_number)
+        if stats is None:
+            return None
+        if not stats["voxel_count"]:
+            logger.error(f"ROI {roi_number} in RTSTRUCT {struct_uid} has no voxels in its mask; cannot compute its center of mass or extents.")
+            return None
         
-        return centroid_index  # (x, y, z)
+        # Physical points -> continuous (x, y, z) indices of the display grid, or of the ROI's own full grid if nothing is displayed
+        sitk_roi = self.rois[(struct_uid, roi_number)]
+        grid = self._cached_display_grid
+        crop_index, _ = get_crop_params(sitk_roi)
+        def to_display_index(point: Tuple[float, ...]) -> np.ndarray:
+            if grid is not None:
+                return transform_physical_to_grid_index(grid, point)
+            return np.add(sitk_roi.TransformPhysicalPointToContinuousIndex(point), crop_index)
+        
+        # Bounding box corners (voxel centers) in physical space, then in the display grid
+        bbox_start = np.array(stats["bbox_index"]) - crop_index
+        bbox_stop = bbox_start + np.array(stats["bbox_size"]) - 1
+        corners = [
+            sitk_roi.TransformContinuousIndexToPhysicalPoint([float(v) for v in np.where(corner, bbox_stop, bbox_start)])
+            for corner in np.ndindex(2, 2, 2)
+        ]
+        corner_indices = np.array([to_display_index(corner) for corner in corners])
+        display_size = grid["size"] if grid is not None else get_crop_params(sitk_roi)[1]
+        extent_min = np.clip(np.rint(corner_indices.min(axis=0)), 0, np.array(display_size) - 1).astype(int)
+        extent_max = np.clip(np.rint(corner_indices.max(axis=0)), 0, np.array(display_size) - 1).astype(int)
+        
+        display_stats = {
+            "center_of_mass": tuple(int(v) for v in np.floor(to_display_index(stats["centroid"]) + 0.5)),
+            "extents": tuple((int(lo), int(hi)) for lo, hi in zip(extent_min, extent_max)),
+        }
+        self._cached_roi_stats[(struct_uid, roi_number)] = display_stats
+        return display_stats
+    
+    def get_roi_center_of_mass_by_uid(self, struct_uid: str, roi_number: int) -> Optional[Tuple[int, int, int]]:
+        """ Return center of mass for an ROI. Returns center of mass as (x, y, z) tuple or None if no data. """
+        display_stats = self._get_roi_display_statistics(struct_uid, roi_number)
+        return display_stats["center_of_mass"] if display_stats is not None else None
     
     def get_roi_extent_ranges_by_uid(self, struct_uid: str, roi_number: int) -> Optional[Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]]:
         """Return (x_range, y_range, z_range) index extents of an ROI."""
-        self.update_cached_data(True, ("roi", struct_uid, roi_number))  # ensure ROI is built and cached
-        sitk_roi: sitk.Image = self._cached_sitk_objects.get(("roi", struct_uid, roi_number), self.rois.get((struct_uid, roi_number), None))
-        if sitk_roi is None:
-            logger.error(f"ROI {roi_number} in RTSTRUCT {struct_uid} could not be created; cannot compute center of mass.")
-            return None
-        
-        stats = sitk.LabelShapeStatisticsImageFilter()
-        stats.Execute(sitk_roi)
-
-        if not stats.HasLabel(1):
-            view = sitk.GetArrayViewFromImage(sitk_roi)
-            coords = np.argwhere(view > 0)
-            if coords.size == 0:  # No points
-                logger.error(f"ROI {roi_number} in RTSTRUCT {struct_uid} has no voxels in its mask; cannot compute extent ranges.")
-                return None
-            elif coords.shape[0] == 1:  # Single point
-                return ((coords[0][2], coords[0][2]), (coords[0][1], coords[0][1]), (coords[0][0], coords[0][0]))  # (x_range, y_range, z_range)
-            else:  # Multiple points - return min/max
-                x_min, y_min, z_min = coords.min(axis=0)
-                x_max, y_max, z_max = coords.max(axis=0)
-                return ((x_max, x_min), (y_max, y_min), (z_max, z_min))
-
-        # BoundingBox -> (x_min, y_min, z_min, size_x, size_y, size_z)
-        bb = stats.GetBoundingBox(1)
-
-        x_range = (bb[0], bb[0] + bb[3] - 1)
-        y_range = (bb[1], bb[1] + bb[4] - 1)
-        z_range = (bb[2], bb[2] + bb[5] - 1)
-
-        return (x_range, y_range, z_range)
+        display_stats = self._get_roi_display_statistics(struct_uid, roi_number)
+        return display_stats["extents"] if display_stats is not None else None
     
     def remove_roi_from_rtstruct(self, ss_sopi: str, roi_number: int) -> None:
         """ Remove an ROI from the specified RTSTRUCT. """
@@ -1077,12 +1802,280 @@ class DataManager:
             return
         if ss_sopi in self.rtstruct_roi_metadata and roi_number in self.rtstruct_roi_metadata[ss_sopi]:
             self.rtstruct_roi_metadata[ss_sopi][roi_number]["disabled"] = True
+        self._lazy_rois.pop((ss_sopi, roi_number), None)
+        self._roi_polylines.pop((ss_sopi, roi_number), None)
         if (ss_sopi, roi_number) in self.rois:
             logger.info(f"Removing ROI number {roi_number} from RTSTRUCT with SOPInstanceUID '{ss_sopi}'.")
             del self.rois[(ss_sopi, roi_number)]
         if ("roi", ss_sopi, roi_number) in self._cached_sitk_objects:
             del self._cached_sitk_objects[("roi", ss_sopi, roi_number)]
-        # Update texture?
+            self._unpack_cached_roi(ss_sopi, roi_number)
+            self._mark_display_changed("roi")
+    
+    ### Lazy ROI Rasterization Methods ###
+    def _start_lazy_roi(self, struct_uid: str, roi_number: int) -> bool:
+        """
+        Display an ROI from a lazily rasterized mask, whose slices are filled as they are viewed and completed in the background.
+        
+        Returns:
+            False if the ROI should be built in full instead (setting disabled, already built, cached on disk,
+            non-planar contours, or a display grid that differs from the ROI's image grid).
+        """
+        if not self.conf_mgr.get_bool_lazy_roi_rasterization() or (struct_uid, roi_number) in self.rois:
+            return False
+        
+        lazy_mask = self._lazy_rois.get((struct_uid, roi_number))
+        if lazy_mask is None:
+            build_inputs = self._get_roi_build_inputs(struct_uid, roi_number)
+            if build_inputs is None:
+                return False
+            roi_ds_dict, image_params = build_inputs
+            cache_path = self._get_roi_mask_cache_path(struct_uid, roi_number, image_params)
+            if cache_path is not None and exists(cache_path):
+                return False  # Reading the cached mask is faster
+            roi_contours = self.rtstruct_roi_contours.get(struct_uid, {}).get(roi_number)
+            if roi_contours is None or not LazyROIMask.supports(roi_contours):
+                return False
+            roi_name = roi_ds_dict.get("StructureSetROI", {}).get("ROIName", "N/A")
+            lazy_mask = LazyROIMask(roi_contours, image_params, roi_name, roi_number)
+            if lazy_mask.is_complete:
+                return False  # Nothing to rasterize within the image grid
+        
+        # Lazy slices are drawn as they are, so the display grid must be the ROI's image grid
+        if self._cached_display_grid is None:
+            ref_series_uid = get_first_ref_series_uid(self.rtstruct_datasets[struct_uid])
+            self._initialize_cached_display_grid(self.images[ref_series_uid])
+        if not self._is_native_display_grid(lazy_mask.sitk_image_params):
+            self._finish_lazy_roi(struct_uid, roi_number)
+            return False
+        
+        self._lazy_rois[(struct_uid, roi_number)] = lazy_mask
+        self._start_lazy_roi_worker()
+        return True
+    
+    def _is_native_display_grid(self, image_params: Dict[str, Any]) -> bool:
+        """True if the cached display grid has the geometry of the given image parameters."""
+        grid = self._cached_display_grid
+        if grid is None or grid["size"] != (image_params["cols"], image_params["rows"], image_params["slices"]):
+            return False
+        return all(np.allclose(grid[key], image_params[key]) for key in ("spacing", "origin", "direction"))
+    
+    def _finish_lazy_roi(self, struct_uid: str, roi_number: int) -> None:
+        """Complete a lazily rasterized ROI mask, store it as a built mask, and swap it into the display cache if displayed."""
+        with self._lazy_roi_lock:
+            lazy_mask = self._lazy_rois.get((struct_uid, roi_number))
+            if lazy_mask is None:
+                return
+            
+            if (struct_uid, roi_number) not in self.rois:
+                mask_sitk = lazy_mask.to_image()
+                self.rois[(struct_uid, roi_number)] = mask_sitk
+                cache_path = self._get_roi_mask_cache_path(struct_uid, roi_number, lazy_mask.sitk_image_params)
+                if cache_path is not None:
+                    self._save_cached_roi_mask(struct_uid, cache_path, mask_sitk)
+            
+            # The packed label volume takes over before the lazy mask is dropped, so the ROI is never missing from a frame
+            display_keys = ("roi", struct_uid, roi_number)
+            if display_keys in self._cached_sitk_objects and self._cached_sitk_objects[display_keys] is None:
+                cached_roi = self._sitk_cache_process(self.rois[(struct_uid, roi_number)])
+                self._pack_cached_roi(struct_uid, roi_number, cached_roi)
+                self._cached_sitk_objects[display_keys] = self._get_packed_roi_placeholder(cached_roi)
+            self._lazy_rois.pop((struct_uid, roi_number), None)
+    
+    def _finalize_lazy_rois(self) -> None:
+        """Swap every completed lazy ROI mask into the display cache."""
+        for struct_uid, roi_number in [key for key, lazy_mask in list(self._lazy_rois.items()) if lazy_mask.is_complete]:
+            self._finish_lazy_roi(struct_uid, roi_number)
+    
+    def _get_lazy_roi(self, struct_uid: str, roi_number: int) -> Optional[LazyROIMask]:
+        """Return the lazy mask an ROI is displayed from, or None if it is displayed from the packed label volume."""
+        if self._cached_sitk_objects.get(("roi", struct_uid, roi_number), False) is not None:
+            return None
+        return self._lazy_rois.get((struct_uid, roi_number))
+    
+    def _start_lazy_roi_worker(self) -> None:
+        """Start the background thread that completes lazy ROI masks, if it is not running."""
+        with self._lazy_roi_lock:
+            if self._lazy_roi_thread is None:
+                self._lazy_roi_cancel_event.clear()
+                self._lazy_roi_thread = threading.Thread(target=self._lazy_roi_worker, daemon=True)
+                self._lazy_roi_thread.start()
+    
+    def _lazy_roi_worker(self) -> None:
+        """Fill the remaining slices of the lazy ROI masks, one slice per mask in turn, until all are complete."""
+        try:
+            while not self._is_lazy_roi_cancelled():
+                pending = [lazy_mask for lazy_mask in list(self._lazy_rois.values()) if not lazy_mask.is_complete]
+                if not pending:
+                    with self._lazy_roi_lock:
+                        if all(lazy_mask.is_complete for lazy_mask in list(self._lazy_rois.values())):
+                            self._lazy_roi_thread = None
+                            return
+                    continue
+                
+                for lazy_mask in pending:
+                    if lazy_mask.fill_next_slice() and lazy_mask.is_complete:
+                        self._mark_display_changed("roi")
+                        if self.on_lazy_roi_complete is not None:
+                            # Redraw so the completed mask is swapped in; views are only drawn from the texture thread
+                            self.ss_mgr.submit_texture_update(self.on_lazy_roi_complete, texture_action_type="update")
+        except Exception:
+            logger.exception("Failed to rasterize ROI masks in the background.", exc_info=True, stack_info=True)
+        with self._lazy_roi_lock:
+            self._lazy_roi_thread = None
+    
+    def _is_lazy_roi_cancelled(self) -> bool:
+        """True if the lazy ROI worker should stop."""
+        return self._lazy_roi_cancel_event.is_set() or self.ss_mgr.cleanup_event.is_set() or self.ss_mgr.shutdown_event.is_set()
+    
+    def _stop_lazy_roi_worker(self) -> None:
+        """Stop the lazy ROI worker, if running."""
+        thread = self._lazy_roi_thread
+        if thread is not None and thread.is_alive():
+            self._lazy_roi_cancel_event.set()
+            thread.join()
+        self._lazy_roi_thread = None
+    
+    ### ROI Mask Disk Cache Methods ###
+    def _build_roi_mask(self, struct_uid: str, roi_number: int, roi_ds_dict: Dict[str, Dataset], image_params: Dict[str, Any]) -> Optional[sitk.Image]:
+        """Return an ROI mask from the on-disk cache when enabled and valid; otherwise rasterize it and cache the result."""
+        cache_path = self._get_roi_mask_cache_path(struct_uid, roi_number, image_params)
+        if cache_path is not None:
+            mask_sitk = self._load_cached_roi_mask(struct_uid, cache_path, image_params)
+            if mask_sitk is not None:
+                return mask_sitk
+        
+        mask_sitk = build_single_mask(roi_ds_dict, image_params, self.rtstruct_roi_contours.get(struct_uid, {}).get(roi_number))
+        if mask_sitk is not None and cache_path is not None:
+            self._save_cached_roi_mask(struct_uid, cache_path, mask_sitk)
+        return mask_sitk
+    
+    def _get_roi_mask_cache_path(self, struct_uid: str, roi_number: int, image_params: Dict[str, Any]) -> Optional[str]:
+        """Return the cache file of an ROI mask, keyed by RTSTRUCT UID, ROI number and image geometry; None if caching is disabled."""
+        if not self.conf_mgr.get_bool_cache_roi_masks_on_disk():
+            return None
+        cache_dir = self.conf_mgr.get_mask_cache_dir()
+        if not cache_dir:
+            return None
+        
+        geometry = dumps(image_params, sort_keys=True)
+        cache_key = sha1(f"{ROI_MASK_CACHE_VERSION}|{struct_uid}|{roi_number}|{geometry}".encode("utf-8")).hexdigest()
+        return join(cache_dir, f"{ROI_MASK_CACHE_PREFIX}{cache_key}.npz")
+    
+    def _get_rtstruct_source_signature(self, struct_uid: str) -> str:
+        """Return the size and modification time of an RTSTRUCT file, used to invalidate its cached masks."""
+        try:
+            file_stat = stat(self.rtstruct_fpaths[struct_uid])
+        except (KeyError, OSError):
+            return ""
+        return f"{file_stat.st_size}|{file_stat.st_mtime_ns}"
+    
+    def _load_cached_roi_mask(self, struct_uid: str, cache_path: str, image_params: Dict[str, Any]) -> Optional[sitk.Image]:
+        """Read a bit-packed cropped ROI mask from disk. Returns None if missing, stale, or unreadable."""
+        if not exists(cache_path):
+            return None
+        
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                if str(cached["source_signature"]) != self._get_rtstruct_source_signature(struct_uid):
+                    logger.info(f"Cached ROI mask '{cache_path}' is outdated (RTSTRUCT file changed). Rebuilding it.")
+                    return None
+                crop_shape = tuple(int(n) for n in cached["crop_shape"])
+                crop_index = tuple(int(i) for i in cached["crop_index"])
+                full_size = tuple(int(n) for n in cached["full_size"])
+                crop_array = np.unpackbits(cached["bits"], count=int(np.prod(crop_shape))).reshape(crop_shape)
+        except Exception:
+            logger.warning(f"Failed to read cached ROI mask '{cache_path}'. Rebuilding it.", exc_info=True)
+            return None
+        
+        try:
+            utime(cache_path)  # Marks the mask as recently used, see _prune_roi_mask_cache
+        except OSError:
+            pass
+        
+        if full_size != (image_params["cols"], image_params["rows"], image_params["slices"]):
+            logger.info(f"Cached ROI mask '{cache_path}' does not match the image grid. Rebuilding it.")
+            return None
+        
+        mask_sitk = cropped_mask_from_array(
+            crop_array,
+            crop_index=crop_index,
+            full_size=full_size,
+            spacing=image_params["spacing"],
+            direction=image_params["direction"],
+            origin=image_params["origin"],
+        )
+        set_mask_statistics(mask_sitk)
+        return mask_sitk
+    
+    def _save_cached_roi_mask(self, struct_uid: str, cache_path: str, mask_sitk: sitk.Image) -> None:
+        """Write a cropped ROI mask to disk as packed bits along with its crop parameters and source signature."""
+        crop_index, full_size = get_crop_params(mask_sitk)
+        crop_array = sitk.GetArrayViewFromImage(mask_sitk)
+        saved = atomic_save(
+            filepath=cache_path,
+            write_func=lambda file: np.savez(
+                file,
+                bits=np.packbits(crop_array > 0, axis=None),
+                crop_shape=np.array(crop_array.shape),
+                crop_index=np.array(crop_index),
+                full_size=np.array(full_size),
+                source_signature=np.array(self._get_rtstruct_source_signature(struct_uid)),
+            ),
+            mode="wb",
+            error_message=f"Failed to cache ROI mask to '{cache_path}'.",
+        )
+        if saved:
+            self._prune_roi_mask_cache(cache_path)
+    
+    def _prune_roi_mask_cache(self, saved_path: str) -> None:
+        """
+        Delete cached masks of other cache versions, and the least recently used masks once the cache exceeds its size limit.
+        
+        The cache directory is scanned on the first save of a session and whenever the tracked size exceeds the limit.
+        """
+        max_bytes = int(self.conf_mgr.get_mask_cache_max_mb() * 1024 ** 2)
+        with self._mask_cache_lock:
+            if self._mask_cache_size is not None:
+                try:
+                    self._mask_cache_size += getsize(saved_path)
+                except OSError:
+                    pass
+                if self._mask_cache_size <= max_bytes:
+                    return
+            
+            try:
+                cached_files = []
+                for entry in scandir(dirname(saved_path)):
+                    if not entry.is_file() or not entry.name.endswith(".npz"):
+                        continue
+                    if entry.name.startswith(ROI_MASK_CACHE_PREFIX):
+                        entry_stat = entry.stat()
+                        cached_files.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+                        continue
+                    try:
+                        remove(entry.path)  # Written by another cache version
+                    except OSError:
+                        logger.warning(f"Failed to delete stale cached ROI mask '{entry.path}'.", exc_info=True)
+            except OSError:
+                logger.warning(f"Failed to prune the ROI mask cache of '{saved_path}'.", exc_info=True)
+                return
+            
+            cache_size = sum(size for _, size, _ in cached_files)
+            if cache_size > max_bytes:
+                target_bytes = max_bytes * ROI_MASK_CACHE_PRUNE_TARGET
+                for _, size, path in sorted(cached_files):
+                    if cache_size <= target_bytes:
+                        break
+                    if path == saved_path:
+                        continue
+                    try:
+                        remove(path)
+                        cache_size -= size
+                    except OSError:
+                        logger.warning(f"Failed to delete cached ROI mask '{path}'.", exc_info=True)
+                logger.info(f"Pruned the ROI mask cache to {cache_size / 1024 ** 2:.1f} MB.")
+            self._mask_cache_size = cache_size
     
     ### RTPLAN Data Methods ###
     def load_rtplans(self, rtplan_files: List[File]) -> None:
@@ -1093,34 +2086,46 @@ class DataManager:
         for rtplan_file in rtplan_files:
             if self.ss_mgr.cleanup_event.is_set() or self.ss_mgr.shutdown_event.is_set():
                 return
-
-            # Get file info
-            file_path = rtplan_file.path
-            modality = (rtplan_file.file_metadata.modality or "").strip().upper()
-            sop_instance_uid = (rtplan_file.file_metadata.sop_instance_uid or "").strip()
-            logger.debug(f"Loading {modality} {sop_instance_uid}: {file_path}")
             
             # Skip if already loaded
+            sop_instance_uid = (rtplan_file.file_metadata.sop_instance_uid or "").strip()
             if sop_instance_uid in self.rtplan_datasets:
-                logger.error(f"Skipping RTPLAN file '{file_path}' due to duplicate SOPInstanceUID '{sop_instance_uid}' already loaded.")
-                continue
-            
-            # Read RTPLAN dataset
-            rtplan_ds = read_dcm_file(file_path)
-            if rtplan_ds is None:
-                logger.error(f"Failed to read RTPLAN file '{file_path}'.")
+                logger.error(f"Skipping RTPLAN file '{rtplan_file.path}' due to duplicate SOPInstanceUID '{sop_instance_uid}' already loaded.")
                 continue
             
-            # Validate SOPInstanceUID
-            validate_sop_instance_uid = str(rtplan_ds.SOPInstanceUID)
-            if validate_sop_instance_uid != sop_instance_uid:
-                logger.error(f"Mismatch in SOPInstanceUID for RTPLAN file '{file_path}': metadata has '{sop_instance_uid}' but DICOM has '{validate_sop_instance_uid}'. Skipping.")
-                continue
-            
-            # Add to dictionaries
-            self.rtplan_datasets[sop_instance_uid] = rtplan_ds
-            self.rtplan_fpaths[sop_instance_uid] = file_path
-            logger.info(f"Loaded {modality} with SOPInstanceUID '{sop_instance_uid}'.")
+            rtplan_ds = self._build_rtplan(rtplan_file)
+            if rtplan_ds is not None:
+                self._add_rtplan(rtplan_file, rtplan_ds)
+    
+    def _build_rtplan(self, rtplan_file: File) -> Optional[Dataset]:
+        """Read an RTPLAN dataset and validate its SOPInstanceUID."""
+        # Get file info
+        file_path = rtplan_file.path
+        modality = (rtplan_file.file_metadata.modality or "").strip().upper()
+        sop_instance_uid = (rtplan_file.file_metadata.sop_instance_uid or "").strip()
+        logger.debug(f"Loading {modality} {sop_instance_uid}: {file_path}")
+        
+        # Read RTPLAN dataset
+        rtplan_ds = read_dcm_file(file_path)
+        if rtplan_ds is None:
+            logger.error(f"Failed to read RTPLAN file '{file_path}'.")
+            return None
+        
+        # Validate SOPInstanceUID
+        validate_sop_instance_uid = str(rtplan_ds.SOPInstanceUID)
+        if validate_sop_instance_uid != sop_instance_uid:
+            logger.error(f"Mismatch in SOPInstanceUID for RTPLAN file '{file_path}': metadata has '{sop_instance_uid}' but DICOM has '{validate_sop_instance_uid}'. Skipping.")
+            return None
+        
+        return rtplan_ds
+    
+    def _add_rtplan(self, rtplan_file: File, rtplan_ds: Dataset) -> None:
+        """Add a built RTPLAN to the internal dictionaries."""
+        modality = (rtplan_file.file_metadata.modality or "").strip().upper()
+        sop_instance_uid = (rtplan_file.file_metadata.sop_instance_uid or "").strip()
+        self.rtplan_datasets[sop_instance_uid] = rtplan_ds
+        self.rtplan_fpaths[sop_instance_uid] = rtplan_file.path
+        logger.info(f"Loaded {modality} with SOPInstanceUID '{sop_instance_uid}'.")
     
     def get_rtplan_uids(self) -> List[str]:
         """Return list of available RTPLAN SOPInstanceUIDs."""
@@ -1344,45 +2349,62 @@ class DataManager:
                 if self.ss_mgr.cleanup_event.is_set() or self.ss_mgr.shutdown_event.is_set():
                     return
                 
-                # Get file info
-                file_path = dose_file.path
-                modality = (dose_file.file_metadata.modality or "").strip().upper()
-                sop_instance_uid = (dose_file.file_metadata.sop_instance_uid or "").strip()
-                dose_summation_type = (dose_file.file_metadata.dose_summation_type or "").strip().upper()
-                logger.debug(f"Loading {modality} {sop_instance_uid}: {file_path}")
-                
                 # Skip if already loaded
+                sop_instance_uid = (dose_file.file_metadata.sop_instance_uid or "").strip()
                 if sop_instance_uid in self.rtdoses:
-                    logger.error(f"Skipping RTDOSE file '{file_path}' due to duplicate SOPInstanceUID '{sop_instance_uid}' already loaded.")
+                    logger.error(f"Skipping RTDOSE file '{dose_file.path}' due to duplicate SOPInstanceUID '{sop_instance_uid}' already loaded.")
                     continue
                 
-                # Construct SITK dose
-                sitk_dose = construct_dose(file_path, self.ss_mgr)
-                
-                # Validate SOPInstanceUID
-                validate_sop_instance_uid = str(sitk_dose.GetMetaData("SOPInstanceUID")).strip()
-                if validate_sop_instance_uid != sop_instance_uid:
-                    logger.error(f"Mismatch in SOPInstanceUID for RTDOSE file '{file_path}': metadata has '{sop_instance_uid}' but DICOM has '{validate_sop_instance_uid}'. Skipping.")
-                    continue
-                
-                # If RTP is loaded, enhance the dose metadata
-                ref_rtp_sopiuid = sitk_dose.GetMetaData("ReferencedRTPlanSOPInstanceUID")
-                if self.rtplan_datasets and ref_rtp_sopiuid in self.rtplan_datasets:
-                    ds_rtplan = self.rtplan_datasets[ref_rtp_sopiuid]
-                    
-                    num_fxns_planned = get_first_num_fxns_planned(ds_rtplan)
-                    if num_fxns_planned is not None:
-                        sitk_dose.SetMetaData("NumberOfFractionsPlanned", str(num_fxns_planned))
-                    
-                    dose_summation_type = sitk_dose.GetMetaData("DoseSummationType").strip().upper() # Re-read from SITK to ensure accuracy
-                    if dose_summation_type.strip().upper() == "BEAM":
-                        beam_number = get_first_ref_beam_number(ds_rtplan)
-                        if beam_number is not None:
-                            sitk_dose.SetMetaData("ReferencedRTPlanBeamNumber", str(beam_number))
-                
-                # Add the dose to the dictionaries
-                self.rtdoses[sop_instance_uid] = sitk_dose
-                self.rtdose_fpaths[sop_instance_uid] = file_path
+                sitk_dose = self._build_rtdose(dose_file)
+                if sitk_dose is not None:
+                    self._add_rtdose(dose_file, sitk_dose)
+    
+    def _build_rtdose(self, dose_file: File) -> Optional[sitk.Image]:
+        """Construct (or adopt a prefetched) RTDOSE and validate its SOPInstanceUID."""
+        # Get file info
+        file_path = dose_file.path
+        modality = (dose_file.file_metadata.modality or "").strip().upper()
+        sop_instance_uid = (dose_file.file_metadata.sop_instance_uid or "").strip()
+        logger.debug(f"Loading {modality} {sop_instance_uid}: {file_path}")
+        
+        # Construct SITK dose, unless it was already prefetched
+        sitk_dose = self._take_prefetched("dose", sop_instance_uid, [file_path])
+        if sitk_dose is None:
+            sitk_dose = construct_dose(file_path, self.ss_mgr, native_pixel_type=self.conf_mgr.get_bool_store_native_pixel_types())
+        if sitk_dose is None:
+            logger.error(f"Failed to load RTDOSE file '{file_path}'.")
+            return None
+        
+        # Validate SOPInstanceUID
+        validate_sop_instance_uid = str(sitk_dose.GetMetaData("SOPInstanceUID")).strip()
+        if validate_sop_instance_uid != sop_instance_uid:
+            logger.error(f"Mismatch in SOPInstanceUID for RTDOSE file '{file_path}': metadata has '{sop_instance_uid}' but DICOM has '{validate_sop_instance_uid}'. Skipping.")
+            return None
+        
+        return sitk_dose
+    
+    def _add_rtdose(self, dose_file: File, sitk_dose: sitk.Image) -> None:
+        """Enhance a built RTDOSE with loaded RTPLAN info and add it to the internal dictionaries."""
+        sop_instance_uid = (dose_file.file_metadata.sop_instance_uid or "").strip()
+        
+        # If RTP is loaded, enhance the dose metadata
+        ref_rtp_sopiuid = sitk_dose.GetMetaData("ReferencedRTPlanSOPInstanceUID")
+        if self.rtplan_datasets and ref_rtp_sopiuid in self.rtplan_datasets:
+            ds_rtplan = self.rtplan_datasets[ref_rtp_sopiuid]
+            
+            num_fxns_planned = get_first_num_fxns_planned(ds_rtplan)
+            if num_fxns_planned is not None:
+                sitk_dose.SetMetaData("NumberOfFractionsPlanned", str(num_fxns_planned))
+            
+            dose_summation_type = sitk_dose.GetMetaData("DoseSummationType").strip().upper() # Re-read from SITK to ensure accuracy
+            if dose_summation_type.strip().upper() == "BEAM":
+                beam_number = get_first_ref_beam_number(ds_rtplan)
+                if beam_number is not None:
+                    sitk_dose.SetMetaData("ReferencedRTPlanBeamNumber", str(beam_number))
+        
+        # Add the dose to the dictionaries
+        self.rtdoses[sop_instance_uid] = sitk_dose
+        self.rtdose_fpaths[sop_instance_uid] = dose_file.path
     
     def get_rtdose_metadata_by_uid_and_key(self, rtdose_uid: str, metadata_key: str, default: Any = None, return_deepcopy: bool = True) -> Any:
         """
@@ -1536,68 +2558,97 @@ class DataManager:
     
     def get_current_data_params(self) -> Dict[str, Any]:
         
-        if self._cached_sitk_reference is None:
+        if self._cached_display_grid is None:
             return self.get_raw_data_params()
         return {
-            "size": self._cached_sitk_reference.GetSize(),
-            "spacing": self._cached_sitk_reference.GetSpacing(),
-            "direction": self._cached_sitk_reference.GetDirection(),
-            "origin": self._cached_sitk_reference.GetOrigin(),
+            "size": self._cached_display_grid["size"],
+            "spacing": self._cached_display_grid["spacing"],
+            "direction": self._cached_display_grid["direction"],
+            "origin": self._cached_display_grid["origin"],
         }
     
-    def _initialize_cached_sitk_reference(self, sitk_data: sitk.Image) -> sitk.Image:
+    def _initialize_cached_display_grid(self, sitk_data: sitk.Image) -> None:
         """
-        Initialize the cached reference SimpleITK image if none exists.
+        Initialize the cached display grid if none exists.
 
-        The reference is created by resampling `sitk_data` according to
-        parameters stored in `_cached_texture_param_dict` (voxel spacing,
-        rotation, flips). The resulting image is cached and augmented with
-        metadata recording the original spacing, size, and direction.
+        The grid is the geometry that `sitk_data` (its full grid, if it is a cropped
+        mask) would be resampled onto according to the parameters stored in
+        `_cached_texture_param_dict` (voxel spacing, rotation, flips). Only the
+        geometry is computed; no voxels are resampled.
 
         Args:
-            sitk_data: Input SimpleITK image to serve as the basis for the reference.
-
-        Returns:
-            The cached reference image if it was created, otherwise the
-            provided `sitk_data` unchanged.
+            sitk_data: Input SimpleITK image to serve as the basis for the grid.
         """
-        if self._cached_sitk_reference is None:
+        if self._cached_display_grid is None:
             voxel_spacing = self._cached_texture_param_dict.get("voxel_spacing", sitk_data.GetSpacing())
             rotation = self._cached_texture_param_dict.get("rotation", None)
             flips = self._cached_texture_param_dict.get("flips", None)
-            self._cached_sitk_reference = resample_sitk_data_with_params(
-                sitk_data=sitk_data,
+            self._cached_display_grid = get_resampled_grid(
+                get_image_grid(sitk_data),  # The display grid spans the full image grid
                 set_spacing=voxel_spacing,
                 set_rotation=rotation,
                 set_flip=flips,
-                interpolator=sitk.sitkLinear,
             )
-            return self._cached_sitk_reference
-        return sitk_data
     
     def _sitk_cache_process(self, sitk_data: sitk.Image) -> sitk.Image:
-        """ Process and cache SITK data for given display keys."""
-        sitk_data = self._initialize_cached_sitk_reference(sitk_data)
-        
-        ref = self._cached_sitk_reference
-        if sitk_data is ref:
-            return sitk_data  # Already the same object
-        
-        # Check if geometry already matches reference
-        same_spacing = sitk_data.GetSpacing() == ref.GetSpacing()
-        same_origin = sitk_data.GetOrigin() == ref.GetOrigin()
-        same_direction = sitk_data.GetDirection() == ref.GetDirection()
-        same_size = sitk_data.GetSize() == ref.GetSize()
-        if all((same_spacing, same_origin, same_direction, same_size)):
-            return sitk_data  # No resample needed
-        
-        # Otherwise, resample to match reference
-        return sitk_resample_to_reference(
-            sitk_data, 
-            self._cached_sitk_reference, 
-            interpolator=sitk.sitkLinear, 
-            default_pixel_val_outside_image=0.0
-        )
+        """
+        Prepare SITK data for display on the cached display grid.
+        
+        Cropped masks are resampled onto the display grid within their bounding boxes, so they can be packed.
+        Images and doses stay on their own grids; only the viewed planes are resampled, see _get_display_plane.
+        """
+        self._initialize_cached_display_grid(sitk_data)
+        if is_cropped_image(sitk_data):
+            return resample_cropped_mask_to_grid(sitk_data, self._cached_display_grid, interpolator=self._get_interpolator("roi"))
+        return sitk_data
+    
+    def _get_interpolator(self, data_type: Literal["image", "roi", "dose"]) -> int:
+        """
+        Return the SimpleITK interpolator used to resample data of a type onto the display grid.
+        
+        Masks use a label interpolator so they stay binary uint8, images use linear, and doses use the configured one.
+        """
+        if data_type == "roi":
+            return INTERPOLATORS[self.conf_mgr.get_roi_interpolation()]
+        if data_type == "dose":
+            return INTERPOLATORS[self.conf_mgr.get_dose_interpolation()]
+        return sitk.sitkLinear
+    
+    def _get_display_plane(
+        self,
+        sitk_data: sitk.Image,
+        slicer: Tuple[Union[slice, int], ...],
+        interpolator: int = sitk.sitkLinear
+    ) -> Tuple[Optional[np.ndarray], Optional[Tuple[slice, ...]]]:
+        """
+        Return the stored values of an image within a (z, y, x) slicer of the display grid, and their destination slices.
+        
+        Images on the display grid are sliced directly, and grids that only flip, rotate by 90 degrees or shift
+        the image's voxels read a strided view of them. Otherwise only the requested plane is resampled,
+        rather than the whole image being resampled onto the display grid whenever the grid changes.
+        """
+        grid = self._cached_display_grid
+        if grid is None or is_same_grid(get_image_grid(sitk_data), grid):
+            view = sitk.GetArrayViewFromImage(sitk_data)
+            valid_slicer, dest_2d = self._get_valid_slicer_and_dest(slicer, view.shape)
+            if valid_slicer is None:
+                return None, None
+            return view[valid_slicer], dest_2d
+        
+        valid_slicer, dest_2d = self._get_valid_slicer_and_dest(slicer, grid["size"][::-1])
+        if valid_slicer is None:
+            return None, None
+        start = tuple(s.start if isinstance(s, slice) else s for s in valid_slicer)[::-1]  # (x, y, z)
+        size = tuple(s.stop - s.start if isinstance(s, slice) else 1 for s in valid_slicer)[::-1]
+        plane_index = tuple(slice(None) if isinstance(s, slice) else 0 for s in valid_slicer)
+        
+        mapping = get_axis_aligned_mapping(get_image_grid(sitk_data), grid)
+        if mapping is not None:
+            box = sample_axis_aligned(sitk.GetArrayViewFromImage(sitk_data), mapping, start, size)
+            return box[plane_index], dest_2d
+        
+        plane = sitk.GetArrayFromImage(resample_to_grid(sitk_data, grid, start=start, size=size, interpolator=interpolator))
+        return plane[plane_index], dest_2d
     
     def update_cached_data(self, load_data: bool, display_keys: Union[Tuple[str, str], Tuple[str, str, int]]) -> None:
         """
@@ -1614,15 +2665,21 @@ class DataManager:
         # Handle data removal
         if not load_data:
             if display_keys in self._cached_sitk_objects:
-                del self._cached_sitk_objects[display_keys]
+                self._mark_display_changed(display_keys[0])
+                removed_data = self._cached_sitk_objects.pop(display_keys)
+                if display_keys[0] == "roi":
+                    self._unpack_cached_roi(*display_keys[1:])
+                elif display_keys[0] == "dose":
+                    self._remove_dose_from_sum(display_keys, removed_data)
                 if not self._cached_sitk_objects:
-                    self._cached_sitk_reference = None
-            self._update_dose_sum_cache()
+                    self._cached_display_grid = None
+                    self._cached_roi_stats.clear()
             return
         
         # Check if already loaded
         if display_keys in self._cached_sitk_objects:
             return
+        self._mark_display_changed(display_keys[0])
         
         # Load the appropriate data
         if display_keys[0] == "image":
@@ -1634,6 +2691,9 @@ class DataManager:
         
         elif display_keys[0] == "roi":
             struct_uid, roi_number = display_keys[1:]
+            if self._start_lazy_roi(struct_uid, roi_number):
+                self._cached_sitk_objects[display_keys] = None  # Drawn from the lazy mask until it is complete
+                return
             self.build_rtstruct_roi(struct_uid, roi_number)  # Checks and only builds if needed
             if (struct_uid, roi_number) not in self.rois:
                 logger.error(f"Cannot update active ROI data: ROI number {roi_number} in RTSTRUCT with SOPInstanceUID '{struct_uid}' not found or failed to build.")
@@ -1647,24 +2707,211 @@ class DataManager:
                 return
             sitk_data = self.rtdoses[dose_uid]
 
-        self._cached_sitk_objects[display_keys] = self._sitk_cache_process(sitk_data)
-        self._update_dose_sum_cache()
-    
-    def _update_dose_sum_cache(self) -> None:
-        """Update the dose sum cache based on current active dose data."""
-        dose_keys = [k for k in self._cached_sitk_objects.keys() if k[0] == "dose"]
-        if dose_keys:
-            dose_objects = [self._cached_sitk_objects[k] for k in dose_keys]
-            dose_sum = dose_objects[0]
-            for dose in dose_objects[1:]:
-                dose_sum = sitk.Add(dose_sum, dose)
-            # Normalize the sum so that max is 1.0
-            stats = sitk.StatisticsImageFilter()
-            stats.Execute(dose_sum)
-            max_val = stats.GetMaximum()
-            self._cached_dose_sum = sitk.Divide(dose_sum, max_val + 1e-4)
+        cached_data = self._sitk_cache_process(sitk_data)
+        if display_keys[0] == "roi":
+            # Only the packed label bits hold the voxels of a cached ROI
+            self._pack_cached_roi(*display_keys[1:], cached_data)
+            self._cached_sitk_objects[display_keys] = self._get_packed_roi_placeholder(cached_data)
+            return
+        self._cached_sitk_objects[display_keys] = cached_data
+        if display_keys[0] == "dose":
+            self._add_dose_to_sum(display_keys, cached_data)
+    
+    ### Dose Sum Methods ###
+    def _reset_dose_sum(self) -> None:
+        """Clear the dose sum."""
+        self._cached_dose_sum = None
+        self._dose_sum_array = None
+        self._dose_sum_counts = None
+        self._dose_sum_keys = []
+        self._dose_sum_max = None
+    
+    def _get_dose_sum_term(self, dose_sitk: sitk.Image) -> sitk.Image:
+        """Return a dose as a float32 image on the dose sum grid."""
+        dose = sitk_to_float_image(dose_sitk)
+        if not is_same_grid(get_image_grid(dose), get_image_grid(self._cached_dose_sum)):
+            dose = resample_to_grid(dose, get_image_grid(self._cached_dose_sum), interpolator=self._get_interpolator("dose"))
+        return dose
+    
+    def _add_dose_to_sum(self, dose_keys: Tuple[str, str], dose_sitk: sitk.Image) -> None:
+        """Add a cached dose to the dose sum; the first dose defines the grid that doses are summed, and resliced per view, on."""
+        if self._cached_dose_sum is None:
+            dose = sitk_to_float_image(dose_sitk)
+            self._dose_sum_array = sitk.GetArrayFromImage(dose)
+            self._dose_sum_counts = (self._dose_sum_array != 0).astype(np.uint16)
+            self._cached_dose_sum = dose
         else:
-            self._cached_dose_sum = None
+            dose_term = self._get_dose_sum_term(dose_sitk)
+            dose_term_array = sitk.GetArrayViewFromImage(dose_term)
+            self._dose_sum_array += dose_term_array
+            self._dose_sum_counts += dose_term_array != 0
+        self._dose_sum_keys.append(dose_keys)
+        self._update_dose_sum_image()
+    
+    def _remove_dose_from_sum(self, dose_keys: Tuple[str, str], dose_sitk: sitk.Image) -> None:
+        """Subtract a dose from the dose sum, or re-add the remaining doses if it defined the sum grid."""
+        if dose_keys not in self._dose_sum_keys:
+            return
+        if dose_keys == self._dose_sum_keys[0]:
+            remaining_keys = self._dose_sum_keys[1:]
+            self._reset_dose_sum()
+            for keys in remaining_keys:
+                self._add_dose_to_sum(keys, self._cached_sitk_objects[keys])
+            return
+        
+        # Voxels where no remaining dose is non-zero only hold rounding residue, and are zeroed so no dose is shown there
+        dose_term = self._get_dose_sum_term(dose_sitk)
+        dose_term_array = sitk.GetArrayViewFromImage(dose_term)
+        self._dose_sum_array -= dose_term_array
+        self._dose_sum_counts -= dose_term_array != 0
+        self._dose_sum_array[self._dose_sum_counts == 0] = 0
+        self._dose_sum_keys.remove(dose_keys)
+        self._update_dose_sum_image()
+    
+    def _update_dose_sum_image(self) -> None:
+        """Replace the dose sum image with the accumulator values; images already being rendered are left unchanged."""
+        dose_sum = sitk.GetImageFromArray(self._dose_sum_array)
+        dose_sum.CopyInformation(self._cached_dose_sum)
+        self._cached_dose_sum = dose_sum
+    
+    def _get_dose_sum_max(self, dose_sum: sitk.Image) -> float:
+        """Return the maximum of a dose sum, computed once per dose sum."""
+        cached = self._dose_sum_max
+        if cached is None or cached[0] is not dose_sum:
+            cached = (dose_sum, sitk.GetArrayViewFromImage(dose_sum).max())
+            self._dose_sum_max = cached
+        return cached[1]
+    
+    ### Packed ROI Label Methods ###
+    def _get_roi_label_index(self, struct_uid: str, roi_number: int) -> Optional[int]:
+        """Return the bit index of an ROI within its RTSTRUCT's packed label volume."""
+        roi_numbers = list(self.rtstruct_roi_ds_dicts.get(struct_uid, {}).keys())
+        return roi_numbers.index(roi_number) if roi_number in roi_numbers else None
+    
+    def _pack_cached_roi(self, struct_uid: str, roi_number: int, roi_sitk: sitk.Image) -> None:
+        """Set the bits of a cached ROI in its RTSTRUCT's packed label volume, growing the volume to cover the mask."""
+        label_index = self._get_roi_label_index(struct_uid, roi_number)
+        if label_index is None:
+            logger.error(f"Cannot pack ROI number {roi_number}: not found in RTSTRUCT with SOPInstanceUID '{struct_uid}'.")
+            return
+        
+        crop_index, _ = get_crop_params(roi_sitk)
+        mask = sitk.GetArrayViewFromImage(roi_sitk) > 0
+        start = np.array(crop_index[::-1])  # (z, y, x)
+        stop = start + mask.shape
+        
+        # The volume spans the union of the packed bounding boxes; it is only reallocated when it has to grow
+        with self._texture_cache_lock:
+            volume = self._cached_label_volumes.get(struct_uid)
+            if volume is None:
+                planes = allocate_label_planes(len(self.rtstruct_roi_ds_dicts[struct_uid]), tuple(stop - start))
+                volume = {"planes": planes, "start": start, "labels": {}}
+                self._cached_label_volumes[struct_uid] = volume
+            else:
+                old_start = volume["start"]
+                old_stop = old_start + volume["planes"].shape[1:]
+                new_start = np.minimum(old_start, start)
+                new_stop = np.maximum(old_stop, stop)
+                if np.any(new_start != old_start) or np.any(new_stop != old_stop):
+                    planes = np.zeros((volume["planes"].shape[0], *(new_stop - new_start)), dtype=volume["planes"].dtype)
+                    planes[(slice(None),) + tuple(slice(a, b) for a, b in zip(old_start - new_start, old_stop - new_start))] = volume["planes"]
+                    volume["planes"], volume["start"] = planes, new_start
+            
+            set_label_bits(volume["planes"], label_index, mask, tuple(start - volume["start"]))
+            volume["labels"][roi_number] = label_index
+    
+    def _unpack_cached_roi(self, struct_uid: str, roi_number: int) -> None:
+        """Clear the bits of an ROI from its RTSTRUCT's packed label volume, dropping the volume once empty."""
+        with self._texture_cache_lock:
+            volume = self._cached_label_volumes.get(struct_uid)
+            if volume is None or roi_number not in volume["labels"]:
+                return
+            label_index = volume["labels"].pop(roi_number)
+            if not volume["labels"]:
+                del self._cached_label_volumes[struct_uid]
+            else:
+                clear_label_bits(volume["planes"], label_index)
+    
+    @staticmethod
+    def _get_packed_roi_placeholder(roi_sitk: sitk.Image) -> Dict[str, Any]:
+        """Return the display cache entry of a packed ROI: the crop parameters and metadata of its mask, without its voxels."""
+        crop_index, full_size = get_crop_params(roi_sitk)
+        return {
+            "crop_index": crop_index,
+            "crop_size": roi_sitk.GetSize(),
+            "full_size": full_size,
+            "metadata": {key: roi_sitk.GetMetaData(key) for key in roi_sitk.GetMetaDataKeys()},
+        }
+    
+    def _get_packed_roi_image(self, struct_uid: str, roi_number: int) -> Optional[sitk.Image]:
+        """Rebuild the cropped mask of a cached ROI on the display grid from its packed label bits, or None if it is not packed."""
+        placeholder = self._cached_sitk_objects.get(("roi", struct_uid, roi_number))
+        with self._texture_cache_lock:
+            volume = self._cached_label_volumes.get(struct_uid)
+            if placeholder is None or volume is None or roi_number not in volume["labels"]:
+                return None
+            start = np.array(placeholder["crop_index"][::-1]) - volume["start"]  # (z, y, x) within the volume
+            stop = start + placeholder["crop_size"][::-1]
+            planes = volume["planes"][(slice(None),) + tuple(slice(a, b) for a, b in zip(start, stop))]
+            roi_mask = get_label_mask(planes, volume["labels"][roi_number]).astype(np.uint8)
+        
+        grid = self._cached_display_grid
+        roi_sitk = cropped_mask_from_array(
+            roi_mask,
+            crop_index=placeholder["crop_index"],
+            full_size=placeholder["full_size"],
+            spacing=grid["spacing"],
+            direction=grid["direction"],
+            origin=grid["origin"],
+        )
+        for key, value in placeholder["metadata"].items():
+            roi_sitk.SetMetaData(key, value)
+        return roi_sitk
+    
+    def _get_roi_polylines(self, struct_uid: str, roi_number: int) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[int, Tuple[List[np.ndarray], List[np.ndarray]]]]]:
+        """Return (image parameters, polylines per slice) of an ROI on its referenced image grid; polylines are None if unavailable."""
+        key = (struct_uid, roi_number)
+        if key not in self._roi_polylines:
+            image_params, slice_polylines = None, None
+            roi_contours = self.rtstruct_roi_contours.get(struct_uid, {}).get(roi_number)
+            if roi_contours is not None and struct_uid in self.rtstruct_datasets:
+                image_params = self.images_params.get(get_first_ref_series_uid(self.rtstruct_datasets[struct_uid]))
+                if image_params:
+                    slice_polylines = build_roi_slice_polylines(roi_contours, image_params)
+            self._roi_polylines[key] = (image_params, slice_polylines)
+        return self._roi_polylines[key]
+    
+    def _get_label_volume_slice(
+        self, struct_uid: str, slicer: Tuple[Union[slice, int], ...]
+    ) -> Tuple[Optional[np.ndarray], Optional[Tuple[slice, ...]], Dict[int, int]]:
+        """
+        Return a copy of the (planes, rows, cols) words of an RTSTRUCT's packed label volume within a (z, y, x) slicer,
+        their destination slices and the label index of each packed ROI. The words are None if the slice holds no ROI.
+        """
+        with self._texture_cache_lock:
+            volume = self._cached_label_volumes.get(struct_uid)
+            if volume is None:
+                return None, None, {}
+            planes = volume["planes"]
+            full_shape = self._cached_display_grid["size"][::-1] if self._cached_display_grid is not None else planes.shape[1:]
+            local_slicer = self._get_local_slicer(slicer, volume["start"], full_shape)
+            valid_slicer, dest_2d = self._get_valid_slicer_and_dest(local_slicer, planes.shape[1:])
+            if valid_slicer is None:
+                return None, None, dict(volume["labels"])
+            label_slice = planes[(slice(None),) + valid_slicer].copy()
+            return (label_slice if label_slice.any() else None), dest_2d, dict(volume["labels"])
+    
+    def _get_label_volume_voxel(self, struct_uid: str, index: Tuple[int, int, int]) -> Tuple[Set[int], Dict[int, int]]:
+        """Return the labels set at a (z, y, x) voxel of an RTSTRUCT's packed label volume and the label index of each packed ROI."""
+        with self._texture_cache_lock:
+            volume = self._cached_label_volumes.get(struct_uid)
+            if volume is None:
+                return set(), {}
+            planes = volume["planes"]
+            local_index = tuple(int(idx - offset) for idx, offset in zip(index, volume["start"]))
+            if not all(0 <= idx < dim for idx, dim in zip(local_index, planes.shape[1:])):
+                return set(), dict(volume["labels"])  # Voxel is outside the packed volume
+            return set(get_labels_from_words(planes[(slice(None),) + local_index])), dict(volume["labels"])
     
     ### Texture Methods ###
     def return_texture_from_active_data(self, texture_params: Dict[str, Any]) -> np.ndarray:
@@ -1699,30 +2946,67 @@ class DataManager:
             return np.zeros(texture_RGB_size, dtype=np.float32)
         
         try:
-            # Rebuild cache if texture parameters have changed
-            if self._check_for_texture_param_changes(texture_params, ignore_keys=["view_type", "slicer", "xyz_slices", "xyz_ranges"]):
-                # Store current keys before clearing cache
-                cached_keys = list(self._cached_sitk_objects.keys())
-                
-                self._clear_cache()
-                self._cached_texture_param_dict = texture_params
+            with self._texture_cache_lock:
+                # Rebuild cache if the display grid or interpolation parameters have changed; other parameters only change texture layers
+                texture_params = {
+                    **texture_params,
+                    "roi_interpolation": self.conf_mgr.get_roi_interpolation(),
+                    "dose_interpolation": self.conf_mgr.get_dose_interpolation(),
+                }
+                if self._check_for_texture_param_changes(texture_params, ignore_keys=[key for key in texture_params if key not in CACHE_REBUILD_PARAM_KEYS]):
+                    # Store current keys before clearing cache
+                    cached_keys = list(self._cached_sitk_objects.keys())
+                    display_version = self._display_version
+                    
+                    self._clear_cache()
+                    self._cached_texture_param_dict = texture_params
+                    
+                    # Reload data using the stored keys
+                    for key in cached_keys:
+                        self.update_cached_data(True, key)
+                    
+                    # The same data is shown on the new grid; views already track the parameters that changed
+                    self._display_version = display_version
                 
-                # Reload data using the stored keys
-                for key in cached_keys:
-                    self.update_cached_data(True, key)
-
-            # Determine base layer shape based on slicer dimensions and create base layer
+                # Swap completed lazy ROI masks into the packed label volumes
+                self._finalize_lazy_rois()
+            
+            # Determine base layer shape based on slicer dimensions
             shape_RGB = tuple(s.stop - s.start for s in slicer if isinstance(s, slice)) + (3,)
-            base_layer = np.zeros(shape_RGB, dtype=np.float32)
-
-            # Blend images, masks, and doses if display alphas are provided
+            
+            # Image, mask and dose layers are cached per view, keyed by exactly what each is drawn from, and
+            # blended into an 8-bit base layer that is cached until a layer or an alpha changes
             alphas = texture_params.get("display_alphas")
             if alphas and len(alphas) == 3:
-                self._blend_images_RGB(base_layer, slicer, texture_params["image_window_level"], texture_params["image_window_width"], alphas[0])
-                self._blend_masks_RGB(base_layer, slicer, texture_params["contour_thickness"], alphas[1])
-                self._blend_doses_RGB(base_layer, slicer, texture_params["dose_thresholds"], alphas[2])
+                config_version = self.conf_mgr.get_user_config_version()
+                window_level, window_width = texture_params["image_window_level"], texture_params["image_window_width"]
+                contour_thickness, dose_thresholds = texture_params["contour_thickness"], tuple(texture_params["dose_thresholds"])
+                layer_keys = (
+                    (self._layer_versions["image"], config_version, slicer, window_level, window_width),
+                    (self._layer_versions["roi"], config_version, slicer, contour_thickness),
+                    (self._layer_versions["dose"], config_version, slicer, dose_thresholds),
+                )
+                layer_builders = (
+                    lambda: self._get_image_layer_RGB(shape_RGB, slicer, window_level, window_width),
+                    lambda: self._get_mask_layer_RGB(shape_RGB, slicer, contour_thickness),
+                    lambda: self._get_dose_layer_RGB(shape_RGB, slicer, dose_thresholds),
+                )
+                
+                def blend_cached_layers() -> np.ndarray:
+                    blended_layer = np.zeros(shape_RGB, dtype=np.uint8)
+                    for layer_type, layer_key, build_layer, alpha in zip(("image", "roi", "dose"), layer_keys, layer_builders, alphas):
+                        if not alpha:
+                            continue  # A transparent layer is not drawn at all
+                        layer = self._get_cached_layer(view_type, layer_type, layer_key, build_layer)
+                        if layer is not None:
+                            self._blend_layers(blended_layer, layer[0], alpha, layer[1])
+                    return blended_layer
+                
+                # Copied, since crosshairs are drawn in place
+                base_layer = self._get_cached_layer(view_type, "blended", layer_keys + (tuple(alphas),), blend_cached_layers).copy()
             else:
                 logger.error(f"Data textures could not be blended: 'display_alphas' are missing or invalid: {alphas}")
+                base_layer = np.zeros(shape_RGB, dtype=np.uint8)
             
             # Add crosshairs to the base layer
             self._draw_slice_crosshairs(
@@ -1739,24 +3023,22 @@ class DataManager:
             elif view_type == "sagittal":
                 base_layer = base_layer[::-1, ::-1, :]  # Flip z and x axes
             
-            # Normalize and clip to [0, 1]
-            np.clip(base_layer, 0, 255, out=base_layer)
-            base_layer /= 255.0
-            
             # Resize to the desired image dimensions
-            base_layer = cv2.resize(src=base_layer, dsize=(image_length, image_length), interpolation=cv2.INTER_LINEAR)
+            base_layer = cv2.resize(src=np.ascontiguousarray(base_layer), dsize=(image_length, image_length), interpolation=cv2.INTER_LINEAR)
             
             # Add orientation labels after resizing to avoid text distortion
-            self._draw_orientation_labels(
-                base_layer, 
-                texture_params["show_orientation_labels"], 
-                view_type, 
-                texture_params["rotation"], 
-                texture_params["flips"]
-            )
+            if texture_params["show_orientation_labels"]:
+                rotation, flips = texture_params["rotation"], tuple(texture_params["flips"] or ())
+                label_key = (image_length, rotation, flips, self.original_direction, self.conf_mgr.get_user_config_version())
+                label_layer = self._get_cached_layer(
+                    view_type, "orientation_labels", label_key, 
+                    lambda: self._get_orientation_label_layer(base_layer.shape, view_type, rotation, flips)
+                )
+                if label_layer is not None:
+                    self._blend_layers(base_layer, *label_layer)
             
-            # Resize to the desired image dimensions and flatten to a 1D texture
-            return base_layer.ravel()
+            # Map bytes to the [0, 1] floats of the texture and flatten to a 1D texture
+            return cv2.LUT(base_layer, self._texture_lut).ravel()
         except Exception as e:
             logger.exception("Failed to generate a texture.", exc_info=True, stack_info=True)
             return np.zeros(texture_RGB_size, dtype=np.float32)
@@ -1776,7 +3058,7 @@ class DataManager:
         Returns:
             True if differences are detected; otherwise, False.
         """
-        if self._cached_texture_param_dict is None:
+        if not self._cached_texture_param_dict:
             return True
         
         for key, value in texture_params.items():
@@ -1792,26 +3074,41 @@ class DataManager:
         return False
     
     ### Texture Blending Methods ###
-    def _blend_layers(self, base_layer: np.ndarray, overlay: np.ndarray, alpha: float) -> None:
+    def _get_cached_layer(self, view_type: str, layer_type: str, layer_key: Tuple[Any, ...], build_layer: Callable[[], Any]) -> Any:
+        """Return a view's cached texture layer, building it only if it was last built from a different key."""
+        cached = self._cached_layers.get((view_type, layer_type))
+        if cached is None or cached[0] != layer_key:
+            cached = (layer_key, build_layer())
+            self._cached_layers[(view_type, layer_type)] = cached
+        return cached[1]
+    
+    def _get_overlay_layer(self, overlay: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Return an 8-bit RGB overlay with the mask of its non-zero pixels, or None if it has none."""
+        overlay_mask = overlay[..., 0] | overlay[..., 1] | overlay[..., 2]
+        if not overlay_mask.any():
+            return None
+        return overlay, overlay_mask
+    
+    def _blend_layers(self, base_layer: np.ndarray, overlay: np.ndarray, alpha: float, overlay_mask: Optional[np.ndarray] = None) -> None:
         """
-        Blend an overlay onto the base layer using the specified alpha value.
+        Blend an 8-bit overlay onto the 8-bit base layer using the specified alpha value, where the overlay is non-zero.
 
         This function modifies the base_layer in place.
 
         Args:
-            base_layer: The base image layer.
-            overlay: The overlay image layer.
+            base_layer: The base image layer (uint8 RGB).
+            overlay: The overlay image layer (uint8 RGB).
             alpha: The blending alpha value (0-100).
+            overlay_mask: The mask of non-zero overlay pixels, if already known.
         """
-        overlay_indices = overlay.any(axis=-1)
-        if not overlay_indices.any():  # Skip if no overlay pixels
+        if overlay_mask is None:
+            overlay_mask = overlay[..., 0] | overlay[..., 1] | overlay[..., 2]
+        if not overlay_mask.any():  # Skip if no overlay pixels
             return
         
         alpha_ratio = alpha / 100.0
-        inv_alpha = 1.0 - alpha_ratio
-        
-        base_layer[overlay_indices] *= inv_alpha
-        base_layer[overlay_indices] += overlay[overlay_indices] * alpha_ratio
+        blended = cv2.addWeighted(base_layer, 1.0 - alpha_ratio, overlay, alpha_ratio, 0.0)
+        cv2.copyTo(blended, overlay_mask, base_layer)
     
     def _get_valid_slicer_and_dest(self, slicer: Tuple[Union[slice, int], ...], data_shape: Tuple[int, ...]) -> Tuple[Tuple, Tuple[slice, ...]]:
         """
@@ -1863,112 +3160,174 @@ class DataManager:
         
         return tuple(valid_slicer), dest_2d
     
-    def _blend_images_RGB(
+    def _get_local_slicer(self, slicer: Tuple[Union[slice, int], ...], offset: Tuple[int, ...], full_shape: Tuple[int, ...]) -> Tuple[Union[slice, int], ...]:
+        """Shift a (z, y, x) slicer of the full grid into the index space of a sub-volume starting at the (z, y, x) offset."""
+        local_slicer = []
+        for s, dim_offset, dim_size in zip(slicer, offset, full_shape):
+            dim_offset = int(dim_offset)
+            if isinstance(s, slice):
+                start = s.start if s.start is not None else 0
+                stop = s.stop if s.stop is not None else dim_size
+                local_slicer.append(slice(start - dim_offset, stop - dim_offset))
+            else:
+                local_slicer.append(s - dim_offset)
+        return tuple(local_slicer)
+    
+    def _get_image_layer_RGB(
         self,
-        base_layer: np.ndarray,
+        shape_RGB: Tuple[int, int, int],
         slicer: Tuple[Union[slice, int], ...],
         image_window_level: float,
-        image_window_width: float,
-        alpha: float
-    ) -> None:
+        image_window_width: float
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """
-        Blend active image slices into the base layer using specified window level, window width, and blending alpha.
+        Return the layer of active image slices using specified window level and window width.
 
         Args:
-            base_layer: The base layer for image blending.
+            shape_RGB: The (rows, columns, 3) shape of the layer.
             slicer: A tuple defining the slicing of the image.
             image_window_level: The window level value.
             image_window_width: The window width value.
-            alpha: The blending alpha (0-100).
+        
+        Returns:
+            The layer as (uint8 RGB overlay, mask of its non-zero pixels), or None if it is empty.
         """
         sitk_images = self.find_active_sitk_images()
         if not sitk_images:
-            return
+            return None
 
-        if image_window_level is None or image_window_width is None or alpha is None:
-            logger.error(f"Image blending failed: Missing parameters (level: {image_window_level}, width: {image_window_width}, alpha: {alpha}).")
-            return
+        if image_window_level is None or image_window_width is None:
+            logger.error(f"Image blending failed: Missing parameters (level: {image_window_level}, width: {image_window_width}).")
+            return None
 
         lower_bound = image_window_level - (image_window_width / 2)
         upper_bound = image_window_level + (image_window_width / 2)
-        scale_factor = 255.0 / (upper_bound - lower_bound + 1e-4)
         
-        # Initialize image slice accumulator
-        composite_image = np.zeros((*base_layer.shape[:2], 3), dtype=np.float32)
+        # Initialize gray level accumulator (wide enough to sum several images)
+        num_images = len(sitk_images)
+        composite_image = np.zeros(shape_RGB[:2], dtype=np.uint8 if num_images == 1 else np.uint16)
         
         for sitk_image in sitk_images:
-            # Convert the needed slice to numpy
-            view = sitk.GetArrayViewFromImage(sitk_image)
-            
-            valid_slicer, dest_2d = self._get_valid_slicer_and_dest(slicer, view.shape)
-            if valid_slicer is None:
+            # Get the needed slice as numpy
+            stored_slice, dest_2d = self._get_display_plane(sitk_image, slicer, self._get_interpolator("image"))
+            if stored_slice is None:
                 continue  # Skip if slice is out of bounds
             
-            image_slice = view[valid_slicer].astype(np.float32)  # 2D slice
-            
-            np.clip(image_slice, lower_bound, upper_bound, out=image_slice)
-            image_slice -= lower_bound
-            image_slice *= scale_factor
+            # Integer pixels are windowed by a table lookup; other types are rescaled and windowed directly
+            slope, intercept = get_rescale_params(sitk_image)
+            lut = self._get_window_level_lut(stored_slice.dtype, slope, intercept, lower_bound, upper_bound)
+            if lut is not None:
+                gray_slice = apply_window_level_lut(lut, stored_slice)
+            else:
+                gray_slice = window_level_to_uint8(rescale_array_to_float(stored_slice, slope, intercept), lower_bound, upper_bound)
             
-            # Add to RGB channels
-            composite_image[dest_2d[0], dest_2d[1], 0] += image_slice
-            composite_image[dest_2d[0], dest_2d[1], 1] += image_slice
-            composite_image[dest_2d[0], dest_2d[1], 2] += image_slice
-
-        composite_image /= len(sitk_images) # Average of images
+            composite_image[dest_2d[0], dest_2d[1]] += gray_slice
 
-        self._blend_layers(base_layer, composite_image, alpha)
+        if num_images > 1:
+            composite_image = ((composite_image + num_images // 2) // num_images).astype(np.uint8)  # Average of images
+        
+        composite_image_RGB = cv2.cvtColor(composite_image, cv2.COLOR_GRAY2RGB)
+        return self._get_overlay_layer(composite_image_RGB)
     
-    def _blend_masks_RGB(
+    def _get_window_level_lut(
         self,
-        base_layer: np.ndarray,
+        dtype: np.dtype,
+        slope: float,
+        intercept: float,
+        lower_bound: float,
+        upper_bound: float
+    ) -> Optional[np.ndarray]:
+        """Return the cached window/level lookup table of a stored pixel type, rebuilding tables only when the window changes."""
+        key = (np.dtype(dtype).str, slope, intercept, lower_bound, upper_bound)
+        lut = self._window_level_luts.get(key, False)  # Read once, since other views may clear the tables meanwhile
+        if lut is False:
+            if any(cached_key[3:] != key[3:] for cached_key in list(self._window_level_luts)):
+                self._window_level_luts.clear()  # Tables of a previous window are no longer needed
+            lut = get_window_level_lut(dtype, slope, intercept, lower_bound, upper_bound)
+            self._window_level_luts[key] = lut
+        return lut
+    
+    def _get_mask_layer_RGB(
+        self,
+        shape_RGB: Tuple[int, int, int],
         slicer: Tuple[Union[slice, int], ...],
-        contour_thickness: int,
-        alpha: float
-    ) -> None:
+        contour_thickness: int
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """
-        Blend mask overlays into the base layer using specified contour thickness and blending alpha.
+        Return the layer of mask contours using specified contour thickness.
 
         Args:
-            base_layer: The base image layer.
+            shape_RGB: The (rows, columns, 3) shape of the layer.
             slicer: A tuple defining the slice of the mask.
             contour_thickness: The thickness of the mask contour.
-            alpha: The blending alpha (0-100).
+        
+        Returns:
+            The layer as (uint8 RGB overlay, mask of its non-zero pixels), or None if it is empty.
         """
         roi_keys_list = [k for k in self._cached_sitk_objects.keys() if k[0] == "roi"]
         if not roi_keys_list:
-            return
+            return None
 
-        if not contour_thickness or not alpha:
-            logger.error(f"Mask blending failed: 'contour_thickness' ({contour_thickness}) or 'alpha' ({alpha}) is missing or invalid.")
-            return
+        if not contour_thickness:
+            logger.error(f"Mask blending failed: 'contour_thickness' ({contour_thickness}) is missing or invalid.")
+            return None
 
         # If contour_thickness is 0, fill the contour (0 has no utility)
         if contour_thickness == 0:
             contour_thickness = -1
 
-        composite_masks_RGB = np.zeros_like(base_layer, dtype=np.uint8)
+        composite_masks_RGB = np.zeros(shape_RGB, dtype=np.uint8)
+        
+        # Each RTSTRUCT's packed label volume is sliced once and the ROI bits are read from it
+        label_slices: Dict[str, Tuple[Optional[np.ndarray], Optional[Tuple[slice, ...]], Dict[int, int]]] = {}
+        
+        # Axial slices of an ROI's native grid are outlined straight from its contour polygons
+        draw_polylines = (
+            contour_thickness > 0 and 
+            isinstance(slicer[0], (int, np.integer)) and 
+            all(isinstance(s, slice) for s in slicer[1:]) and 
+            self.conf_mgr.get_bool_vector_contour_overlay()
+        )
+        polyline_offset = np.array([slicer[2].start or 0, slicer[1].start or 0], dtype=np.int32) << CONTOUR_FILL_SHIFT if draw_polylines else None
+        native_structs: Dict[str, bool] = {}
         
         for roi_keys in roi_keys_list:
-            roi_sitk = self._cached_sitk_objects[roi_keys]
-            roi_view = sitk.GetArrayViewFromImage(roi_sitk)
+            struct_uid, roi_number = roi_keys[1], roi_keys[2]
             
-            valid_slicer, dest_2d = self._get_valid_slicer_and_dest(slicer, roi_view.shape)
-            if valid_slicer is None:
-                continue  # Skip if slice is out of bounds
+            if draw_polylines:
+                image_params, slice_polylines = self._get_roi_polylines(struct_uid, roi_number)
+                if slice_polylines is not None:
+                    if struct_uid not in native_structs:
+                        native_structs[struct_uid] = self._is_native_display_grid(image_params)
+                    if native_structs[struct_uid]:
+                        self._draw_roi_polylines(composite_masks_RGB, slice_polylines.get(int(slicer[0])), polyline_offset, struct_uid, roi_number, contour_thickness)
+                        continue
             
-            roi_slice = roi_view[valid_slicer]
+            # ROIs still being rasterized are drawn from their lazy masks, filling only the viewed slice
+            lazy_mask = self._get_lazy_roi(struct_uid, roi_number)
+            if lazy_mask is not None:
+                valid_slicer, dest_2d = self._get_valid_slicer_and_dest(slicer, lazy_mask.shape)
+                if valid_slicer is None:
+                    continue
+                roi_slice = lazy_mask.get_plane(valid_slicer)
+            else:
+                if struct_uid not in label_slices:
+                    label_slices[struct_uid] = self._get_label_volume_slice(struct_uid, slicer)
+                label_slice, dest_2d, labels = label_slices[struct_uid]
+                if label_slice is None or roi_number not in labels:
+                    continue  # Skip if the ROI is not packed, or the slice is out of bounds or holds no ROI
+                
+                roi_slice = get_label_mask(label_slice, labels[roi_number])
             if not np.any(roi_slice):
                 continue
             
-            struct_uid, roi_number = roi_keys[1], roi_keys[2]
             roi_display_color = self.rtstruct_roi_metadata.get(struct_uid, {}).get(roi_number, {}).get("ROIDisplayColor", (0, 255, 0))
             
             # Get offset from dest_2d
             y_offset = dest_2d[0].start if dest_2d[0].start else 0  # 'y' w.r.t. texture, not anatomy
             x_offset = dest_2d[1].start if dest_2d[1].start else 0  # 'x' w.r.t. texture, not anatomy
             
-            roi_contour_input = np.ascontiguousarray(roi_slice, dtype=np.uint8)
+            roi_contour_input = roi_slice.view(np.uint8) if roi_slice.dtype == bool else roi_slice
             contours, _ = cv2.findContours(
                 image=roi_contour_input,
                 mode=cv2.RETR_EXTERNAL,
@@ -1983,57 +3342,85 @@ class DataManager:
                 thickness=contour_thickness
             )
             
-        composite_masks_RGB = composite_masks_RGB.astype(np.float32)
-        self._blend_layers(base_layer, composite_masks_RGB, alpha)
+        return self._get_overlay_layer(composite_masks_RGB)
     
-    def _blend_doses_RGB(
+    def _draw_roi_polylines(
         self,
-        base_layer: np.ndarray,
-        slicer: Tuple[Union[slice, int], ...],
-        dose_thresholds: Union[Tuple[float, float], List[float]],
-        alpha: float
+        composite_masks_RGB: np.ndarray,
+        polylines: Optional[Tuple[List[np.ndarray], List[np.ndarray]]],
+        polyline_offset: np.ndarray,
+        struct_uid: str,
+        roi_number: int,
+        contour_thickness: int
     ) -> None:
+        """Draw the (closed, open) fixed-point polylines of an ROI slice, shifted by the (x, y) texture offset, in its display color."""
+        if not polylines:
+            return
+        
+        roi_display_color = self.rtstruct_roi_metadata.get(struct_uid, {}).get(roi_number, {}).get("ROIDisplayColor", (0, 255, 0))
+        for contours, is_closed in zip(polylines, (True, False)):
+            if not contours:
+                continue
+            cv2.polylines(
+                img=composite_masks_RGB,
+                pts=[points - polyline_offset for points in contours],
+                isClosed=is_closed,
+                color=roi_display_color,
+                thickness=contour_thickness,
+                lineType=cv2.LINE_8,
+                shift=CONTOUR_FILL_SHIFT
+            )
+    
+    def _get_dose_layer_RGB(
+        self,
+        shape_RGB: Tuple[int, int, int],
+        slicer: Tuple[Union[slice, int], ...],
+        dose_thresholds: Union[Tuple[float, float], List[float]]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """
-        Blend dose overlays into the base layer using specified dose thresholds and blending alpha.
+        Return the dose wash layer using specified dose thresholds.
 
         Args:
-            base_layer: The base image layer.
+            shape_RGB: The (rows, columns, 3) shape of the layer.
             slicer: A tuple defining the slice of the dose data.
             dose_thresholds: A tuple or list with lower and upper dose thresholds.
-            alpha: The blending alpha (0-100).
+        
+        Returns:
+            The layer as (uint8 RGB overlay, mask of its non-zero pixels), or None if it is empty.
         """
-        if self._cached_dose_sum is None:
-            return
+        dose_sum = self._cached_dose_sum
+        if dose_sum is None:
+            return None
 
         if (
             not dose_thresholds or 
             not isinstance(dose_thresholds, (tuple, list)) or
-            len(dose_thresholds) != 2 or 
-            not alpha
+            len(dose_thresholds) != 2
         ):
-            logger.error(f"Dose blending failed: 'dose_thresholds' ({dose_thresholds}) or 'alpha' ({alpha}) is missing or invalid.")
-            return
+            logger.error(f"Dose blending failed: 'dose_thresholds' ({dose_thresholds}) is missing or invalid.")
+            return None
 
         min_threshold_p, max_threshold_p = dose_thresholds
         min_thresh = min_threshold_p / 100
         max_thresh = max_threshold_p / 100
         
-        total_dose_view = sitk.GetArrayViewFromImage(self._cached_dose_sum)
+        total_dose_slice, dest_2d = self._get_display_plane(dose_sum, slicer, self._get_interpolator("dose"))
+        if total_dose_slice is None:
+            return None  # Skip if slice is out of bounds
         
-        valid_slicer, dest_2d = self._get_valid_slicer_and_dest(slicer, total_dose_view.shape)
-        if valid_slicer is None:
-            return  # Skip if slice is out of bounds
-        
-        total_dose_slice = total_dose_view[valid_slicer]
+        # Normalize the slice so that the max of the dose sum is 1.0
+        total_dose_slice = total_dose_slice / np.float32(self._get_dose_sum_max(dose_sum) + 1e-4)
+
         dose_mask = (total_dose_slice > min_thresh) & (total_dose_slice < max_thresh)
         if not np.any(dose_mask):
-            return  # No dose in range to display
+            return None  # No dose in range to display
 
         # Create a color map for the base layer size
-        cmap_data = np.zeros((*base_layer.shape[:2], 3), dtype=np.float32)
+        cmap_data = np.zeros(shape_RGB, dtype=np.uint8)
         
-        # Apply colormap only to the valid dose region at the correct position
-        dose_colors = self._dosewash_colormap(total_dose_slice[dose_mask]) * 255.0  # Scale to [0, 255] for blending
+        # Look up colors only for the valid dose region, to place at the correct position
+        dose_lut_index = np.rint(np.clip(total_dose_slice[dose_mask], 0.0, 1.0) * (DOSE_LUT_SIZE - 1)).astype(np.intp)
+        dose_colors = self._dose_lut[dose_lut_index]
         
         # Get indices where dose_mask is True
         y_indices, x_indices = np.where(dose_mask)
@@ -2045,7 +3432,7 @@ class DataManager:
         # Place colors directly at offset positions
         cmap_data[y_indices + y_offset, x_indices + x_offset] = dose_colors
         
-        self._blend_layers(base_layer, cmap_data, alpha)
+        return self._get_overlay_layer(cmap_data)
     
     ### Texture Helper Methods ###
     def _dosewash_colormap(self, value_array: np.ndarray) -> np.ndarray:
@@ -2135,31 +3522,29 @@ class DataManager:
             if 0 <= xyz_slices[1] < base_layer.shape[1]:  # Vertical line = y location
                 base_layer[:, max(0, xyz_slices[1] - thickness_y // 2) : min(base_layer.shape[1], xyz_slices[1] + thickness_y // 2 + 1), :] = crosshair_color
 
-    def _draw_orientation_labels(
+    def _get_orientation_label_layer(
         self,
-        base_layer: np.ndarray,
-        show_orientation_labels: bool,
+        shape_RGB: Tuple[int, int, int],
         view_type: str,
         rotation: int,
-        flips: List[bool]
-    ) -> None:
+        flips: Union[Tuple[bool, ...], List[bool]]
+    ) -> Optional[Tuple[np.ndarray, float, np.ndarray]]:
         """
-        Draw orientation labels (L/R, A/P, S/I) on the base image and blend them onto it.
+        Return the layer of orientation labels (L/R, A/P, S/I) to blend onto the resized base image.
 
         Args:
-            base_layer: The image layer on which to draw labels.
-            show_orientation_labels: Whether orientation labels should be drawn.
+            shape_RGB: The (rows, columns, 3) shape of the resized base image.
             view_type: One of 'axial', 'coronal', or 'sagittal'.
             rotation: The rotation angle in degrees.
-            flips: A list of booleans indicating flip status for each axis.
+            flips: Booleans indicating flip status for each axis.
+        
+        Returns:
+            The layer as (uint8 RGB overlay, blending alpha, mask of its non-zero pixels), or None if it is empty.
         """
-        if not show_orientation_labels:
-            return
-
         # Do not draw orientation labels if the image is too small
-        h, w = base_layer.shape[:2]
+        h, w = shape_RGB[:2]
         if h < 50 or w < 50:
-            return
+            return None
         
         dicom_direction = self.original_direction or tuple(np.eye(3).flatten().tolist())
         rotation_angle = int(rotation) or 0
@@ -2168,7 +3553,7 @@ class DataManager:
         orientation_labels = get_orientation_labels(dicom_direction, rotation_angle, flips)
         if not orientation_labels:
             logger.error(f"Orientation labels are invalid; cannot draw labels.")
-            return
+            return None
         
         # Define label properties
         font = cv2.FONT_HERSHEY_COMPLEX
@@ -2180,7 +3565,7 @@ class DataManager:
         alpha = min(max(text_RGBA[3] / 2.55, 0), 100)  # Convert 0-255 to 0-100
         
         # Create an overlay for text
-        overlay = np.zeros_like(base_layer, dtype=np.uint8)
+        overlay = np.zeros(shape_RGB, dtype=np.uint8)
         
         # Define a small buffer based on image size (1% of width/height)
         buffer_x = max(1, int(0.01 * w))  # At least 1 pixel
@@ -2214,8 +3599,8 @@ class DataManager:
 
             cv2.putText(img=overlay, text=label_text, org=(text_x, text_y), fontFace=font, fontScale=font_scale, color=text_RGB, thickness=font_thickness, lineType=cv2.LINE_AA)
         
-        overlay = overlay.astype(np.float32)
-        self._blend_layers(base_layer, overlay, alpha)
+        overlay_layer = self._get_overlay_layer(overlay)
+        return (overlay_layer[0], alpha, overlay_layer[1]) if overlay_layer is not None else None
     
     ### GUI Data Retrieval Methods ###
     def find_active_sitk_images(self) -> List[sitk.Image]:
@@ -2236,9 +3621,9 @@ class DataManager:
         Returns:
             A list of SITK images for active RTSTRUCT data.
         """
-        # Copy the keys to avoid error due to dictionary change during iteration
+        # Copy the keys to avoid error due to dictionary change during iteration; masks are rebuilt from the packed label volumes
         cached_rts_keys = [k for k in self._cached_sitk_objects.keys() if k[0] == "roi"]
-        return [sitk_data for key in cached_rts_keys if (sitk_data := self._cached_sitk_objects.get(key)) is not None]
+        return [sitk_data for key in cached_rts_keys if (sitk_data := self._get_packed_roi_image(*key[1:])) is not None]
     
     def find_active_sitk_doses(self) -> List[sitk.Image]:
         """
@@ -2264,21 +3649,25 @@ class DataManager:
         # Get ROI information from active cached data
         result = []
         roi_keys = [k for k in self._cached_sitk_objects.keys() if k[0] == "roi"]
+        voxel_labels: Dict[str, Tuple[Set[int], Dict[int, int]]] = {}  # Labels set at the voxel and packed ROI labels, read once per RTSTRUCT
         for key in roi_keys:
             struct_uid, roi_number = key[1], key[2]
             
-            # Check if ROI has data at this slice by getting the SITK object
-            roi_sitk = self._cached_sitk_objects.get(key)
-            if roi_sitk is None:
-                continue
-            
-            # Skip if slicer is out of bounds
-            if not all(0 <= idx < dim for idx, dim in zip(slicer, list(roi_sitk.GetSize())[::-1])):
+            lazy_mask = self._get_lazy_roi(struct_uid, roi_number)
+            if lazy_mask is not None:
+                if not all(0 <= idx < dim for idx, dim in zip(slicer, lazy_mask.shape)) or not lazy_mask.get_value(slicer):
+                    continue
+                display_name = self.get_roi_gui_metadata_value_by_uid_and_key(struct_uid, roi_number, "display_name", "Unknown")
+                color = self.get_roi_gui_metadata_value_by_uid_and_key(struct_uid, roi_number, "ROIDisplayColor", [255, 255, 255])
+                if color:
+                    result.append((str(roi_number), display_name, tuple(color)))
                 continue
             
-            view = sitk.GetArrayViewFromImage(roi_sitk)
-            if not np.any(view[slicer]):
-                continue  # Skip if no ROI data at this slice
+            if struct_uid not in voxel_labels:
+                voxel_labels[struct_uid] = self._get_label_volume_voxel(struct_uid, slicer)
+            labels_at_voxel, labels = voxel_labels[struct_uid]
+            if labels.get(roi_number) not in labels_at_voxel:
+                continue  # Skip if the ROI is not packed or has no data at this voxel
             
             # Get ROI display name
             display_name = self.get_roi_gui_metadata_value_by_uid_and_key(struct_uid, roi_number, "display_name", "Unknown")
@@ -2298,7 +3687,10 @@ class DataManager:
         Returns:
             A list of image slices as NumPy arrays.
         """
-        return [sitk.GetArrayViewFromImage(img)[slicer] for img in self.find_active_sitk_images() if all(0 <= idx < dim for idx, dim in zip(slicer, list(img.GetSize())[::-1]))]
+        return [
+            rescale_array_to_float(voxel, *get_rescale_params(img))[0, 0]
+            for img in self.find_active_sitk_images() if (voxel := self._get_display_voxel(img, slicer, self._get_interpolator("image"))) is not None
+        ]
 
     def return_dose_value_list_at_slice(self,  slicer: Tuple[int, int, int]) -> List[np.ndarray]:
         """
@@ -2310,7 +3702,16 @@ class DataManager:
         Returns:
             A list of dose slices as NumPy arrays.
         """
-        return [sitk.GetArrayViewFromImage(dose)[slicer] for dose in self.find_active_sitk_doses() if all(0 <= idx < dim for idx, dim in zip(slicer, list(dose.GetSize())[::-1]))]
+        return [
+            rescale_array_to_float(voxel, *get_rescale_params(dose))[0, 0]
+            for dose in self.find_active_sitk_doses() if (voxel := self._get_display_voxel(dose, slicer, self._get_interpolator("dose"))) is not None
+        ]
+    
+    def _get_display_voxel(self, sitk_data: sitk.Image, slicer: Tuple[int, int, int], interpolator: int = sitk.sitkLinear) -> Optional[np.ndarray]:
+        """Return the stored value of an image at a (z, y, x) voxel of the display grid as a (1, 1) array, or None if outside."""
+        z, y, x = slicer
+        voxel, _ = self._get_display_plane(sitk_data, (z, slice(y, y + 1), slice(x, x + 1)), interpolator)
+        return voxel if voxel is not None and voxel.size else None
         
     def return_is_any_data_active(self) -> bool:
         """
@@ -2343,13 +3744,14 @@ class DataManager:
             if modality != "CT" or not convert_ct_hu_to_red:
                 if roi_overrides:
                     logger.warning("An image is saving, but note that ROI overrides were ignored - only applied with HU→RED conversion")
-                # Save the original image without modification
-                sitk.WriteImage(ct_image, output_path)
+                # Save the original image without modification (physical values if stored natively with a non-unit rescale)
+                slope, intercept = get_rescale_params(ct_image)
+                sitk.WriteImage(ct_image if (slope, intercept) == (1.0, 0.0) else sitk_to_float_image(ct_image), output_path)
                 logger.info(f"An image was saved to: {output_path}")
                 return
             
             # Get the CT image as a NumPy array
-            ct_array = sitk.GetArrayFromImage(ct_image).astype(np.float32)
+            ct_array = rescale_array_to_float(sitk.GetArrayViewFromImage(ct_image), *get_rescale_params(ct_image))
             
             # Convert HU to RED
             ct_red_array: np.ndarray = self.HU_to_RED_map(ct_array)
@@ -2361,13 +3763,19 @@ class DataManager:
                     logger.warning(f"ROI not found for override: {roi_key}. Skipping this override.")
                     continue
                 
-                roi_array = sitk.GetArrayFromImage(roi_image) > 0  # Binary mask
-                ct_red_array[roi_array] = red_value
+                # Apply within the mask's bounding box only
+                (x0, y0, z0), _ = get_crop_params(roi_image)
+                roi_array = sitk.GetArrayViewFromImage(roi_image) > 0  # Binary mask
+                nz, ny, nx = roi_array.shape
+                ct_red_array[z0:z0 + nz, y0:y0 + ny, x0:x0 + nx][roi_array] = red_value
             
             # Create a new SITK image from the RED array and copy metadata
             ct_red_image = sitk.GetImageFromArray(ct_red_array)
             ct_red_image.CopyInformation(ct_image)  # Copy origin, spacing, direction
             copy_all_metadata(src=self.images.get(series_uid), dst=ct_red_image, copy_spatial=False)  # Copy all metadata from original
+            for key in (RESCALE_SLOPE_KEY, RESCALE_INTERCEPT_KEY):
+                if ct_red_image.HasMetaDataKey(key):
+                    ct_red_image.EraseMetaData(key)  # RED values are stored directly as float
             
             # Set filepath metadata
             ct_filepaths = self.get_image_filepaths_by_series_uid(series_uid)
@@ -2379,36 +3787,66 @@ class DataManager:
         except Exception as e:
             logger.exception(f"Failed to save image for series UID '{series_uid}' to: {output_path}", exc_info=True, stack_info=True)
 
-    def save_roi(self, struct_uid: str, roi_numbers: Union[int, List[int]], output_path: str, use_cached_data: bool = False) -> None:
-        """ Save ROI(s) as binary mask. Multiple ROI numbers will be merged. """
+    def save_roi(self, struct_uid: str, roi_numbers: Union[int, List[int]], output_path: str, use_cached_data: bool = False, crop_to_bbox: bool = False) -> None:
+        """ Save ROI(s) as binary mask. Multiple ROI numbers will be merged. Saved full-size unless crop_to_bbox is True. """
         roi_numbers = [roi_numbers] if isinstance(roi_numbers, int) else roi_numbers
         try:
-            # Collect all ROI masks
-            roi_arrays = []
-            reference_roi = None
-            
+            # Collect all (cropped) ROI masks keyed by ROI number
+            roi_images: Dict[int, sitk.Image] = {}
             for roi_num in roi_numbers:
                 roi_image = self._get_data("roi", (struct_uid, roi_num), use_cached=use_cached_data)
                 if roi_image is None:
                     logger.warning(f"ROI #{roi_num} not found in RTSTRUCT {struct_uid}, skipping saving it")
                     continue
-                
-                if reference_roi is None:
-                    reference_roi = roi_image  # Keep first as reference for metadata/spacing
-                
-                roi_array = sitk.GetArrayFromImage(roi_image) > 0  # Binary mask
-                roi_arrays.append(roi_array)
+                roi_images[roi_num] = roi_image
             
-            if not roi_arrays:
+            if not roi_images:
                 logger.error(f"No valid ROIs found for RTSTRUCT {struct_uid} with numbers {roi_numbers}")
                 return
-            
-            # Merge masks
-            merged_mask = np.logical_or.reduce(roi_arrays).astype(np.uint8)
+            reference_roi = next(iter(roi_images.values()))  # Keep first as reference for metadata/spacing
+            
+            # (z, y, x) bounding boxes of the masks in the full grid
+            roi_regions = []
+            for roi_image in roi_images.values():
+                crop_index, _ = get_crop_params(roi_image)
+                roi_regions.append((np.array(crop_index[::-1]), np.array(crop_index[::-1]) + roi_image.GetSize()[::-1]))
+            bbox_start = np.min([start for start, _ in roi_regions], axis=0)
+            bbox_stop = np.max([stop for _, stop in roi_regions], axis=0)
+            
+            # Cached ROIs are merged straight from the RTSTRUCT's packed label volume; otherwise OR the individual masks
+            bbox_mask = None
+            with self._texture_cache_lock:
+                volume = self._cached_label_volumes.get(struct_uid) if use_cached_data else None
+                if volume is not None and all(roi_num in volume["labels"] for roi_num in roi_images):
+                    local_start = bbox_start - volume["start"]
+                    local_stop = bbox_stop - volume["start"]
+                    planes = volume["planes"][(slice(None),) + tuple(slice(a, b) for a, b in zip(local_start, local_stop))]
+                    bbox_mask = merge_label_masks(planes, [volume["labels"][roi_num] for roi_num in roi_images])
+            if bbox_mask is None:
+                bbox_mask = np.zeros(tuple(bbox_stop - bbox_start), dtype=bool)
+                for (start, stop), roi_image in zip(roi_regions, roi_images.values()):
+                    region = tuple(slice(a, b) for a, b in zip(start - bbox_start, stop - bbox_start))
+                    bbox_mask[region] |= sitk.GetArrayViewFromImage(roi_image) > 0
+            
+            # Place the merged mask in the full grid, or keep the union of the bounding boxes
+            _, full_size = get_crop_params(reference_roi)
+            if crop_to_bbox:
+                region_start = bbox_start
+                merged_mask = bbox_mask.astype(np.uint8)
+            else:
+                region_start = np.zeros(3, dtype=int)
+                merged_mask = np.zeros(full_size[::-1], dtype=np.uint8)
+                merged_mask[tuple(slice(a, b) for a, b in zip(bbox_start, bbox_stop))] = bbox_mask
             
             # Create new image from merged mask
             merged_roi = sitk.GetImageFromArray(merged_mask)
-            merged_roi.CopyInformation(reference_roi)
+            merged_roi.SetSpacing(reference_roi.GetSpacing())
+            merged_roi.SetDirection(reference_roi.GetDirection())
+            merged_roi.SetOrigin(reference_roi.TransformContinuousIndexToPhysicalPoint(
+                [float(v) for v in np.subtract(region_start, get_crop_params(reference_roi)[0][::-1])[::-1]]
+            ))
+            if crop_to_bbox:
+                set_crop_params(merged_roi, tuple(region_start[::-1].tolist()), full_size)
             
             # Set RTSTRUCT metadata
             merged_roi.SetMetaData("SOPInstanceUID", str(struct_uid))
@@ -2487,7 +3925,7 @@ class DataManager:
                 if reference_dose is None:
                     reference_dose = dose_image  # Keep first as reference for metadata/spacing
                 
-                dose_array = sitk.GetArrayFromImage(dose_image).astype(np.float32)
+                dose_array = rescale_array_to_float(sitk.GetArrayViewFromImage(dose_image), *get_rescale_params(dose_image))
                 dose_arrays.append(dose_array)
             
             if not dose_arrays:
@@ -6,7 +6,7 @@ import queue
 import threading
 import concurrent.futures
 from os import cpu_count
-from time import sleep
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 
@@ -20,9 +20,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def should_exit(ss_mgr: SharedStateManager, msg: str = "Aborting task due to cleanup/shutdown event.") -> bool:
-    """Check if task should terminate due to cleanup/shutdown events."""
-    if ss_mgr and (ss_mgr.cleanup_event.is_set() or ss_mgr.shutdown_event.is_set()):
+def should_exit(
+    ss_mgr: SharedStateManager, msg: str = "Aborting task due to cleanup/shutdown event.", cancel_event: Optional[threading.Event] = None
+) -> bool:
+    """Check if task should terminate due to cleanup/shutdown events, or due to its own cancel event if given."""
+    if (ss_mgr and (ss_mgr.cleanup_event.is_set() or ss_mgr.shutdown_event.is_set())) or (cancel_event is not None and cancel_event.is_set()):
         logger.info(msg)
         return True
     return False
@@ -31,6 +33,9 @@ def should_exit(ss_mgr: SharedStateManager, msg: str = "Aborting task due to cle
 class SharedStateManager:
     """Manages threading and multiprocessing."""
     RESERVED_LC_COUNT = 4 # Withhold logical cores from the executor for the main process and threads
+    RENDER_THREAD_COUNT = 3 # One texture render thread per view (axial, coronal, sagittal)
+    TEXTURE_FRAME_BUDGET = 1 / 60 # Target seconds per texture frame; updates within a frame are rendered once
+    TEXTURE_FRAME_TIME_SMOOTHING = 0.2 # Weight of the latest frame in the moving average of frame times
     
     def __init__(self) -> None:
         """Initialize shared state manager."""
@@ -66,9 +71,15 @@ class SharedStateManager:
         # Executor
         self._executor: Optional[concurrent.futures.Executor] = None
         
-        # Persistent texture thread; it will continuously wait for and execute texture updates.
+        # Persistent render pool: it renders the views of a texture update concurrently.
+        self.num_render_workers = max(1, min(self.RENDER_THREAD_COUNT, total_logical_cores))
+        self._render_executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.num_render_workers, thread_name_prefix="texture_render")
+        
+        # Persistent texture thread; it sleeps until texture updates are submitted and renders them as frames.
         self._texture_pending: dict[int, tuple[Callable, tuple, dict]] = {}
         self._texture_lock = threading.Lock()
+        self._texture_condition = threading.Condition(self._texture_lock)
+        self.texture_frame_time = 0.0 # Moving average of seconds per full texture frame
         self._texture_thread = threading.Thread(target=self._persistent_texture_loop, daemon=True)
         self._texture_thread.start()
         
@@ -96,28 +107,63 @@ class SharedStateManager:
                 self._action_queue.task_done()
     
     def _persistent_texture_loop(self) -> None:
-        """Render textures from queue in persistent loop."""
+        """
+        Render texture updates as frames in persistent loop.
+        
+        Updates submitted before a frame starts are coalesced, so at most one (the highest priority, latest one) is
+        rendered per frame. While updates keep arriving and full frames take longer than the frame budget, updates are
+        rendered as previews, and the last preview is rendered in full once updates settle. The loop sleeps while idle.
+        """
+        next_frame_start = 0.0
+        last_frame_end = 0.0
+        refine_task: Optional[tuple[Callable, tuple, dict]] = None # Update last rendered as a preview
         while not self.shutdown_event.is_set():
-            # Wait to render if cleanup is in progress
-            if self.cleanup_event.is_set():
-                continue
-            
-            task = None
-            with self._texture_lock:
+            with self._texture_condition:
+                # Wait for an update, or for updates to settle a frame after a preview
+                refine_time = last_frame_end + self.TEXTURE_FRAME_BUDGET if refine_task is not None else None
+                while not self.shutdown_event.is_set() and (self.cleanup_event.is_set() or not self._texture_pending):
+                    if self.cleanup_event.is_set():
+                        timeout = 0.1 # Clearing the cleanup event does not notify the condition
+                    elif refine_time is not None:
+                        timeout = refine_time - perf_counter()
+                        if timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+                    self._texture_condition.wait(timeout=timeout)
+                
+                # Wait out the rest of the frame, so that updates submitted meanwhile replace pending ones
+                delay = next_frame_start - perf_counter()
+                if delay > 0 and self._texture_pending:
+                    self._texture_condition.wait_for(self.shutdown_event.is_set, timeout=delay)
+                if self.shutdown_event.is_set() or self.cleanup_event.is_set():
+                    continue
+                
                 if self._texture_pending:
                     # Get the highest priority pending task
-                    priority = min(self._texture_pending.keys())
-                    task = self._texture_pending.pop(priority)
-            
-            if task is None:
-                sleep(1/60)
-                continue
+                    task = self._texture_pending.pop(min(self._texture_pending.keys()))
+                    preview = (
+                        task[2].get("texture_action_type", "update") == "update" and 
+                        perf_counter() - last_frame_end < 2 * self.TEXTURE_FRAME_BUDGET and 
+                        self.texture_frame_time > self.TEXTURE_FRAME_BUDGET
+                    )
+                elif refine_task is not None:
+                    task, preview = refine_task, False
+                else:
+                    continue
             
             func, args, kwargs = task
+            frame_start = perf_counter()
+            next_frame_start = frame_start + self.TEXTURE_FRAME_BUDGET
             try:
-                func(*args, **kwargs)
+                func(*args, **({**kwargs, "texture_preview": True} if preview else kwargs))
             except Exception as e:
                 logger.exception(f"Failed to render the texture using '{get_callable_name(func)}'.", exc_info=True, stack_info=True)
+            last_frame_end = perf_counter()
+            
+            refine_task = task if preview else None
+            if not preview:
+                self.texture_frame_time += self.TEXTURE_FRAME_TIME_SMOOTHING * (last_frame_end - frame_start - self.texture_frame_time)
     
     def submit_action(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
         """Submit action for execution."""
@@ -141,8 +187,9 @@ class SharedStateManager:
         action_type = kwargs.get("texture_action_type", "update")
         priority = {"reset": 0, "initialize": 1, "update": 2}.get(action_type, 2)
 
-        with self._texture_lock:
+        with self._texture_condition:
             self._texture_pending[priority] = (func, args, kwargs)
+            self._texture_condition.notify()
     
     def submit_executor_action(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Optional[concurrent.futures.Future]:
         """Submit action to executor pool."""
@@ -157,6 +204,17 @@ class SharedStateManager:
                 logger.exception(f"Submission failed for executor '{get_callable_name(func)}'.", exc_info=True, stack_info=True)
         return None
     
+    def submit_render_action(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Optional[concurrent.futures.Future]:
+        """Submit view rendering to the render pool."""
+        if self.shutdown_event.is_set():
+            logger.info(f"Skipped render '{get_callable_name(func)}' - shutting down")
+            return None
+        try:
+            return self._render_executor.submit(func, *args, **kwargs)
+        except Exception as e:
+            logger.exception(f"Submission failed for render '{get_callable_name(func)}'.", exc_info=True, stack_info=True)
+        return None
+    
     def startup_executor(self, use_process_pool: bool = False, max_workers: Optional[int] = None) -> None:
         """Start executor pool (thread or process)."""
         if self._executor is not None:
@@ -185,11 +243,14 @@ class SharedStateManager:
     def shutdown_manager(self, timeout=5.0) -> None:
         """Shutdown shared state manager."""
         self.shutdown_event.set()
+        with self._texture_condition:
+            self._texture_condition.notify_all()
         
         # Kill the threads
         for thread in [self._action_thread, self._texture_thread]:
             if thread is not None and thread.is_alive():
                 thread.join(timeout=timeout)
         
-        # Shutdown the executor
+        # Shutdown the executors
         self.shutdown_executor()
+        self._render_executor.shutdown(wait=True, cancel_futures=True)
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 
 import logging
-from typing import TYPE_CHECKING, Dict, Optional, Union
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 
+import numpy as np
 import pydicom
 from pydicom.datadict import keyword_for_tag
+from pydicom.multival import MultiValue
 
 
 if TYPE_CHECKING:
@@ -79,6 +82,24 @@ def safe_keyword_for_tag(tag: Union[str, int]) -> Optional[str]:
         return None
 
 
+def get_read_only_value(value: Any) -> Any:
+    """
+    Return a DICOM value that can be shared without copying.
+    
+    Multi-values become tuples and arrays become read-only views. Sequences and datasets have no
+    read-only form, so they are deep copied.
+    """
+    if isinstance(value, (pydicom.Dataset, pydicom.Sequence, dict, set)):
+        return deepcopy(value)
+    if isinstance(value, (MultiValue, list)):
+        return tuple(value)
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    return value
+
+
 def get_first_ref_series_uid(ds: pydicom.Dataset) -> str:
     """Retrieve the first Referenced Series Instance UID from the dataset."""
     matched_ref_series_uid = ""
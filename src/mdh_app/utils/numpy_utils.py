@@ -2,7 +2,7 @@ from __future__ import annotations
 
 
 import logging
-from typing import TYPE_CHECKING, Callable, List, Tuple, Union
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
 
 
 import numpy as np
@@ -29,22 +29,20 @@ def resample_contour_dense(
     # Use minimum spacing dimension as target resolution
     target_resolution = min(spacing) / density_divisor
     
-    resampled = []
+    # Segment i runs from point i to point i + 1, including the closing segment (last point back to first)
+    starts = contour_pts
+    segments = np.roll(contour_pts, -1, axis=0) - starts
+    distances = np.sqrt(np.einsum("ij,ij->i", segments, segments))
+    n_segments = np.maximum(1, np.ceil(distances / target_resolution).astype(np.int64))
     
-    # Include the closing segment (last point back to first)
-    for i in range(len(contour_pts)):
-        p1 = contour_pts[i]
-        p2 = contour_pts[(i + 1) % len(contour_pts)]  # Wrap around
-        
-        distance = np.linalg.norm(p2 - p1)
-        n_segments = max(1, int(np.ceil(distance / target_resolution)))
-        
-        # Add interpolated points (exclude last to avoid duplication on next iteration)
-        for j in range(n_segments):
-            t = j / n_segments
-            resampled.append(p1 + t * (p2 - p1))
+    # Interpolation parameter t = j / n for j in [0, n) of each segment (excludes the end point, which starts the next)
+    segment_idx = np.repeat(np.arange(len(contour_pts)), n_segments)
+    first_output_idx = np.cumsum(n_segments) - n_segments
+    j = np.arange(len(segment_idx)) - first_output_idx[segment_idx]
+    t = (j / n_segments[segment_idx]).astype(segments.dtype, copy=False)
     
-    return np.array(resampled, dtype=np.float32)
+    resampled = starts[segment_idx] + t[:, np.newaxis] * segments[segment_idx]
+    return resampled.astype(np.float32, copy=False)
 
 
 def numpy_roi_mask_generation(
@@ -94,6 +92,111 @@ def numpy_roi_mask_generation(
             mask[z_coords, y_coords, x_coords] = 1
 
 
+def get_label_plane_layout(num_labels: int) -> Tuple[int, np.dtype]:
+    """Return (number of planes, plane dtype) of a bit-packed label volume: the smallest unsigned word, or uint64 planes beyond 32 labels."""
+    num_labels = max(int(num_labels), 1)
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if num_labels <= np.iinfo(dtype).bits:
+            return 1, np.dtype(dtype)
+    return -(-num_labels // 64), np.dtype(np.uint64)
+
+
+def allocate_label_planes(num_labels: int, shape: Tuple[int, ...]) -> np.ndarray:
+    """Allocate a zeroed bit-packed label volume of shape (planes, *shape) with one bit per label."""
+    num_planes, dtype = get_label_plane_layout(num_labels)
+    return np.zeros((num_planes, *shape), dtype=dtype)
+
+
+def _get_label_plane_and_bit(planes: np.ndarray, label_index: int) -> Tuple[int, np.unsignedinteger]:
+    """Return the plane index and single-bit word holding a label."""
+    plane, bit = divmod(int(label_index), planes.dtype.itemsize * 8)
+    return plane, planes.dtype.type(1) << planes.dtype.type(bit)
+
+
+def set_label_bits(planes: np.ndarray, label_index: int, mask: np.ndarray, offset: Tuple[int, ...]) -> None:
+    """Set the bit of a label wherever the boolean mask is true; the mask sits at the (z, y, x) offset within the planes."""
+    plane, bit = _get_label_plane_and_bit(planes, label_index)
+    region = planes[(plane,) + tuple(slice(o, o + n) for o, n in zip(offset, mask.shape))]
+    np.bitwise_or(region, bit, out=region, where=mask)
+
+
+def clear_label_bits(planes: np.ndarray, label_index: int) -> None:
+    """Clear the bit of a label across the whole volume."""
+    plane, bit = _get_label_plane_and_bit(planes, label_index)
+    planes[plane] &= ~bit
+
+
+def get_label_mask(planes: np.ndarray, label_index: int) -> np.ndarray:
+    """Return the boolean mask of one label from (a slice of) a bit-packed label volume."""
+    plane, bit = _get_label_plane_and_bit(planes, label_index)
+    return (planes[plane] & bit) != 0
+
+
+def merge_label_masks(planes: np.ndarray, label_indices: List[int]) -> np.ndarray:
+    """Return the boolean union of several labels from (a slice of) a bit-packed label volume."""
+    plane_bits = np.zeros(planes.shape[0], dtype=planes.dtype)
+    for label_index in label_indices:
+        plane, bit = _get_label_plane_and_bit(planes, label_index)
+        plane_bits[plane] |= bit
+    
+    merged = np.zeros(planes.shape[1:], dtype=bool)
+    for plane in np.flatnonzero(plane_bits):
+        merged |= (planes[plane] & plane_bits[plane]) != 0
+    return merged
+
+
+def get_labels_from_words(words: np.ndarray) -> List[int]:
+    """Decode the label indices set in the per-plane words of a single voxel."""
+    bits_per_plane = words.dtype.itemsize * 8
+    labels = []
+    for plane, word in enumerate(int(w) for w in words):
+        while word:
+            lowest = word & -word
+            labels.append(plane * bits_per_plane + lowest.bit_length() - 1)
+            word ^= lowest
+    return labels
+
+
+def window_level_to_uint8(values: np.ndarray, lower_bound: float, upper_bound: float) -> np.ndarray:
+    """Map float32 physical values to uint8 gray levels of the window [lower_bound, upper_bound]; modifies values in place."""
+    scale_factor = 255.0 / (upper_bound - lower_bound + 1e-4)
+    np.clip(values, lower_bound, upper_bound, out=values)
+    values -= lower_bound
+    values *= scale_factor
+    return np.rint(values).astype(np.uint8)
+
+
+def get_window_level_lut(
+    dtype: np.dtype,
+    slope: float,
+    intercept: float,
+    lower_bound: float,
+    upper_bound: float
+) -> Optional[np.ndarray]:
+    """
+    Return a uint8 lookup table of the windowed gray level of every stored value of an 8- or 16-bit integer dtype.
+    
+    The table is indexed by the stored values' bits read as unsigned, see apply_window_level_lut. Returns None
+    for other dtypes, whose values have to be windowed directly (window_level_to_uint8).
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iu" or dtype.itemsize > 2:
+        return None
+    
+    stored_values = np.arange(2 ** (8 * dtype.itemsize)).astype(f"u{dtype.itemsize}").view(dtype)
+    values = stored_values.astype(np.float32)
+    if slope != 1.0:
+        values *= np.float32(slope)
+    if intercept != 0.0:
+        values += np.float32(intercept)
+    return window_level_to_uint8(values, lower_bound, upper_bound)
+
+
+def apply_window_level_lut(lut: np.ndarray, stored_array: np.ndarray) -> np.ndarray:
+    """Return the uint8 gray levels of stored values from a table of get_window_level_lut, as a single gather."""
+    return np.take(lut, stored_array.view(f"u{stored_array.dtype.itemsize}"), mode="clip")  # Every index is in range; "clip" skips bounds checks
+
+
 def create_HU_to_RED_map(
     hu_values: Union[List[float], Tuple[float, ...]],
     red_values: Union[List[float], Tuple[float, ...]]
@@ -2,23 +2,34 @@ from __future__ import annotations
 
 
 import logging
+from json import dumps, loads
 from typing import TYPE_CHECKING, Optional, Tuple, Dict, Union, Any, List
 
 
 import numpy as np
 import SimpleITK as sitk
+from pydicom.datadict import dictionary_VR
+from pydicom.multival import MultiValue
 
 
 from mdh_app.utils.dicom_utils import safe_keyword_for_tag
 
 
 if TYPE_CHECKING:
-    pass
+    from pydicom import Dataset
 
 
 logger = logging.getLogger(__name__)
 
 
+INTERPOLATORS: Dict[str, int] = {
+    "nearest": sitk.sitkNearestNeighbor,
+    "label_gaussian": sitk.sitkLabelGaussian,
+    "linear": sitk.sitkLinear,
+    "bspline": sitk.sitkBSpline,
+}
+
+
 def sitk_transform_physical_points_to_index(
     physical_points: np.ndarray,  # Shape: (N, 3)
     origin: Union[Tuple[float, ...], List[float]],
@@ -74,40 +85,207 @@ def resample_sitk_data_with_params(
     if sitk_data.GetDimension() != 3:
         raise ValueError(f"Input must be a 3D SimpleITK Image, but got {sitk_data.GetDimension()}D.")
     
-    original_spacing = sitk_data.GetSpacing()
-    original_size = sitk_data.GetSize()
-    original_direction = sitk_data.GetDirection()
-    original_origin = sitk_data.GetOrigin()
+    grid = get_resampled_grid(
+        {"size": sitk_data.GetSize(), "spacing": sitk_data.GetSpacing(), "origin": sitk_data.GetOrigin(), "direction": sitk_data.GetDirection()},
+        set_spacing=set_spacing,
+        set_rotation=set_rotation,
+        set_flip=set_flip,
+    )
+    return resample_to_grid(sitk_data, grid, interpolator=interpolator)
+
+
+def get_image_grid(sitk_data: sitk.Image) -> Dict[str, Tuple]:
+    """Return the 'size', 'spacing', 'origin' and 'direction' of the full grid of an image (of a cropped mask's full grid)."""
+    _, full_size = get_crop_params(sitk_data)
+    return {
+        "size": tuple(int(v) for v in full_size),
+        "spacing": tuple(sitk_data.GetSpacing()),
+        "origin": tuple(get_full_grid_origin(sitk_data)),
+        "direction": tuple(sitk_data.GetDirection()),
+    }
+
+
+def get_resampled_grid(
+    grid: Dict[str, Tuple],
+    set_spacing: Optional[Tuple[float, float, float]] = None,
+    set_rotation: Optional[float] = None,
+    set_flip: Optional[Tuple[bool, bool, bool]] = (False, False, False),
+) -> Dict[str, Tuple]:
+    """Return the grid that resample_sitk_data_with_params resamples an image of the given grid onto, without resampling."""
+    original_size = grid["size"]
+    original_spacing = grid["spacing"]
     
     # Determine new spacing and size
     if set_spacing:
-        new_spacing = set_spacing
-        new_size = [round(osz * ospc / nspc) for osz, ospc, nspc in zip(original_size, original_spacing, new_spacing)]
+        new_spacing = tuple(float(v) for v in set_spacing)
+        new_size = tuple(round(osz * ospc / nspc) for osz, ospc, nspc in zip(original_size, original_spacing, new_spacing))
     else:
-        new_spacing = original_spacing
-        new_size = original_size
+        new_spacing = tuple(original_spacing)
+        new_size = tuple(original_size)
     
     new_direction, transformation_matrix = transform_direction_cosines(
-        original_direction, set_rotation, set_flip, return_transformation_matrix=True
+        grid["direction"], set_rotation, set_flip, return_transformation_matrix=True
     )
     
     # Update origin to account for transformation around the image center
-    center = sitk_data.TransformContinuousIndexToPhysicalPoint((np.array(original_size) - 1) / 2.0)
-    new_origin = center - transformation_matrix @ (center - np.array(original_origin))
+    center = transform_grid_index_to_physical(grid, (np.array(original_size) - 1) / 2.0)
+    new_origin = center - transformation_matrix @ (center - np.array(grid["origin"]))
     
-    resampler = sitk.ResampleImageFilter()
-    resampler.SetInterpolator(interpolator)
-    resampler.SetOutputSpacing(tuple(new_spacing))
-    resampler.SetSize(new_size if set_spacing else original_size)
-    resampler.SetOutputDirection(tuple(new_direction))
-    resampler.SetOutputOrigin(tuple(new_origin))
+    return {
+        "size": tuple(int(v) for v in new_size),
+        "spacing": new_spacing,
+        "origin": tuple(float(v) for v in new_origin),
+        "direction": tuple(float(v) for v in new_direction),
+    }
+
+
+def _get_grid_geometry_image(grid: Dict[str, Tuple]) -> sitk.Image:
+    """Return a single-voxel image carrying the spacing, origin and direction of a grid, for SimpleITK's index/point transforms."""
+    geometry_image = sitk.Image([1] * len(grid["size"]), sitk.sitkUInt8)
+    geometry_image.SetSpacing(tuple(float(v) for v in grid["spacing"]))
+    geometry_image.SetOrigin(tuple(float(v) for v in grid["origin"]))
+    geometry_image.SetDirection(tuple(float(v) for v in grid["direction"]))
+    return geometry_image
+
+
+def transform_grid_index_to_physical(grid: Dict[str, Tuple], index: Union[Tuple[float, ...], np.ndarray]) -> np.ndarray:
+    """Map an (x, y, z) index of a grid, integer or continuous, to its physical point."""
+    geometry_image = _get_grid_geometry_image(grid)
+    if all(float(v).is_integer() for v in index):
+        return np.array(geometry_image.TransformIndexToPhysicalPoint(tuple(int(v) for v in index)))
+    return np.array(geometry_image.TransformContinuousIndexToPhysicalPoint(tuple(float(v) for v in index)))
+
+
+def transform_physical_to_grid_index(grid: Dict[str, Tuple], point: Union[Tuple[float, ...], np.ndarray]) -> np.ndarray:
+    """Map a physical point to its continuous (x, y, z) index in a grid."""
+    return np.array(_get_grid_geometry_image(grid).TransformPhysicalPointToContinuousIndex(tuple(float(v) for v in point)))
+
+
+def is_same_grid(grid_a: Dict[str, Tuple], grid_b: Dict[str, Tuple], atol: float = 1e-5) -> bool:
+    """True if two grids have the same size and (within a tolerance) the same spacing, origin and direction."""
+    return tuple(grid_a["size"]) == tuple(grid_b["size"]) and all(
+        np.allclose(grid_a[key], grid_b[key], rtol=0.0, atol=atol) for key in ("spacing", "origin", "direction")
+    )
+
+
+def get_axis_aligned_mapping(
+    source_grid: Dict[str, Tuple],
+    target_grid: Dict[str, Tuple],
+    atol: float = 1e-4
+) -> Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int], Tuple[int, int, int]]]:
+    """
+    Return how each voxel center of a target grid lands exactly on a voxel center of a source grid, if it does.
     
-    resampled: sitk.Image = resampler.Execute(sitk_data)
-    resampled.SetSpacing(tuple(new_spacing))
-    resampled.SetOrigin(tuple(new_origin))
-    resampled.SetDirection(tuple(new_direction))
+    This holds when the target only permutes and/or flips the source axes, keeps their spacing, and is shifted by
+    whole voxels (e.g., 90-degree rotations and flips). Returns (axes, signs, offsets) such that source index
+    [axes[j]] = offsets[j] + signs[j] * target index[j] for each target axis j, otherwise None.
+    """
+    source_matrix = np.array(source_grid["direction"], dtype=np.float64).reshape(3, 3) @ np.diag(source_grid["spacing"])
+    target_matrix = np.array(target_grid["direction"], dtype=np.float64).reshape(3, 3) @ np.diag(target_grid["spacing"])
+    index_matrix = np.linalg.solve(source_matrix, target_matrix)
+    signed_permutation = np.rint(index_matrix)
+    if not np.allclose(index_matrix, signed_permutation, rtol=0.0, atol=atol):
+        return None
+    if not (
+        np.array_equal(np.abs(signed_permutation).sum(axis=0), np.ones(3)) and
+        np.array_equal(np.abs(signed_permutation).sum(axis=1), np.ones(3))
+    ):
+        return None
     
-    return resampled
+    offsets = np.linalg.solve(source_matrix, np.array(target_grid["origin"]) - np.array(source_grid["origin"]))
+    if not np.allclose(offsets, np.rint(offsets), rtol=0.0, atol=atol):
+        return None
+    
+    axes = tuple(int(np.flatnonzero(signed_permutation[:, j])[0]) for j in range(3))
+    signs = tuple(int(signed_permutation[axes[j], j]) for j in range(3))
+    return axes, signs, tuple(int(np.rint(offsets[axes[j]])) for j in range(3))
+
+
+def sample_axis_aligned(
+    source_array: np.ndarray,
+    mapping: Tuple[Tuple[int, int, int], Tuple[int, int, int], Tuple[int, int, int]],
+    start: Tuple[int, int, int],
+    size: Tuple[int, int, int],
+    default_value: Union[int, float] = 0
+) -> np.ndarray:
+    """
+    Return the (z, y, x) box of a target grid, starting at its (x, y, z) index start, from a (z, y, x) source array.
+    
+    Uses a mapping from get_axis_aligned_mapping, so no interpolation is needed. The result is a strided view of
+    the source array when the box lies inside it, otherwise a copy filled with default_value outside it.
+    """
+    axes, signs, offsets = mapping
+    source_slices: List[slice] = [slice(None)] * 3
+    target_slices: List[slice] = [slice(None)] * 3
+    is_inside = True
+    for j in range(3):
+        first = offsets[j] + signs[j] * start[j]
+        num_source = source_array.shape[2 - axes[j]]
+        if signs[j] > 0:
+            k_lo, k_hi = max(0, -first), min(size[j], num_source - first)
+        else:
+            k_lo, k_hi = max(0, first - num_source + 1), min(size[j], first + 1)
+        if k_hi <= k_lo:
+            return np.full(tuple(size[::-1]), default_value, dtype=source_array.dtype)
+    
+        lo = first + signs[j] * k_lo
+        last = first + signs[j] * (k_hi - 1)
+        if signs[j] > 0:
+            source_slices[2 - axes[j]] = slice(lo, last + 1)
+        else:
+            source_slices[2 - axes[j]] = slice(lo, last - 1 if last > 0 else None, -1)
+        target_slices[2 - j] = slice(k_lo, k_hi)
+        is_inside = is_inside and k_lo == 0 and k_hi == size[j]
+    
+    # Output axis d is target axis 2 - d, which reads source array axis 2 - axes[2 - d]
+    view = source_array[tuple(source_slices)].transpose([2 - axes[2 - d] for d in range(3)])
+    if is_inside:
+        return view
+    
+    box = np.full(tuple(size[::-1]), default_value, dtype=source_array.dtype)
+    box[tuple(target_slices)] = view
+    return box
+
+
+def resample_to_grid(
+    sitk_data: sitk.Image,
+    grid: Dict[str, Tuple],
+    start: Tuple[int, int, int] = (0, 0, 0),
+    size: Optional[Tuple[int, int, int]] = None,
+    interpolator: int = sitk.sitkLinear,
+    default_pixel_val_outside_image: float = 0.0
+) -> sitk.Image:
+    """
+    Resample an image onto a grid, or onto the box of it starting at the (x, y, z) index start.
+    
+    Each output voxel only depends on its own physical point, so resampling a box (e.g., a single plane)
+    gives the same values, up to floating-point rounding, as resampling the whole grid and slicing it.
+    
+    Grids whose voxel centers fall on the image's own (flips, 90-degree rotations, unchanged spacing) are
+    read directly from the image's voxels without interpolation; the image itself is returned if nothing changes.
+    """
+    size = tuple(int(v) for v in (size if size is not None else grid["size"]))
+    source_grid = {"size": sitk_data.GetSize(), "spacing": sitk_data.GetSpacing(), "origin": sitk_data.GetOrigin(), "direction": sitk_data.GetDirection()}
+    mapping = get_axis_aligned_mapping(source_grid, grid) if sitk_data.GetDimension() == 3 and sitk_data.GetNumberOfComponentsPerPixel() == 1 else None
+    if mapping is not None:
+        if mapping == ((0, 1, 2), (1, 1, 1), (0, 0, 0)) and tuple(start) == (0, 0, 0) and size == tuple(sitk_data.GetSize()):
+            return sitk_data
+        box = sample_axis_aligned(sitk.GetArrayViewFromImage(sitk_data), mapping, start, size, default_pixel_val_outside_image)
+        resampled = sitk.GetImageFromArray(np.ascontiguousarray(box))
+        resampled.SetSpacing(tuple(float(v) for v in grid["spacing"]))
+        resampled.SetDirection(tuple(float(v) for v in grid["direction"]))
+        resampled.SetOrigin(tuple(float(v) for v in transform_grid_index_to_physical(grid, start)))
+        return resampled
+
+    resampler = sitk.ResampleImageFilter()
+    resampler.SetInterpolator(interpolator)
+    resampler.SetDefaultPixelValue(default_pixel_val_outside_image)
+    resampler.SetTransform(sitk.AffineTransform(sitk_data.GetDimension()))
+    resampler.SetOutputSpacing(tuple(grid["spacing"]))
+    resampler.SetOutputDirection(tuple(grid["direction"]))
+    resampler.SetOutputOrigin(tuple(float(v) for v in transform_grid_index_to_physical(grid, start)))
+    resampler.SetSize(size)
+    return resampler.Execute(sitk_data)
 
 
 def get_orientation_labels(
@@ -229,6 +407,286 @@ def merge_imagereader_metadata(
     return image
 
 
+RESCALE_SLOPE_KEY = "mdh_rescale_slope"
+RESCALE_INTERCEPT_KEY = "mdh_rescale_intercept"
+
+
+def set_rescale_params(sitk_data: sitk.Image, slope: float, intercept: float) -> None:
+    """Store the linear map from stored pixel values to physical values on the image."""
+    sitk_data.SetMetaData(RESCALE_SLOPE_KEY, repr(float(slope)))
+    sitk_data.SetMetaData(RESCALE_INTERCEPT_KEY, repr(float(intercept)))
+
+
+def get_rescale_params(sitk_data: sitk.Image) -> Tuple[float, float]:
+    """Return (slope, intercept) mapping stored pixel values to physical values; (1.0, 0.0) if not set."""
+    if not sitk_data.HasMetaDataKey(RESCALE_SLOPE_KEY) or not sitk_data.HasMetaDataKey(RESCALE_INTERCEPT_KEY):
+        return 1.0, 0.0
+    try:
+        return float(sitk_data.GetMetaData(RESCALE_SLOPE_KEY)), float(sitk_data.GetMetaData(RESCALE_INTERCEPT_KEY))
+    except ValueError:
+        logger.error(f"Invalid rescale parameters on image; assuming identity.")
+        return 1.0, 0.0
+
+
+def copy_rescale_params(src: sitk.Image, dst: sitk.Image) -> sitk.Image:
+    """Copy rescale parameters (if any) from source to destination image."""
+    slope, intercept = get_rescale_params(src)
+    if slope != 1.0 or intercept != 0.0:
+        set_rescale_params(dst, slope, intercept)
+    return dst
+
+
+def rescale_array_to_float(array: np.ndarray, slope: float, intercept: float) -> np.ndarray:
+    """Convert stored pixel values to a new float32 array of physical values."""
+    values = np.array(array, dtype=np.float32)
+    if slope != 1.0:
+        values *= np.float32(slope)
+    if intercept != 0.0:
+        values += np.float32(intercept)
+    return values
+
+
+def sitk_to_float_image(sitk_data: sitk.Image) -> sitk.Image:
+    """Return a float32 image of physical values, applying stored rescale parameters if present."""
+    slope, intercept = get_rescale_params(sitk_data)
+    if sitk_data.GetPixelID() == sitk.sitkFloat32 and slope == 1.0 and intercept == 0.0:
+        return sitk_data
+    float_img = sitk.Cast(sitk_data, sitk.sitkFloat32)
+    if slope != 1.0 or intercept != 0.0:
+        float_img = sitk.ShiftScale(float_img, shift=intercept / slope, scale=slope)  # (x + shift) * scale
+    float_img = copy_all_metadata(src=sitk_data, dst=float_img)
+    for key in (RESCALE_SLOPE_KEY, RESCALE_INTERCEPT_KEY):
+        if float_img.HasMetaDataKey(key):
+            float_img.EraseMetaData(key)
+    return float_img
+
+
+CROP_INDEX_KEY = "mdh_crop_index"
+FULL_SIZE_KEY = "mdh_full_size"
+
+
+def set_crop_params(sitk_data: sitk.Image, crop_index: Tuple[int, int, int], full_size: Tuple[int, int, int]) -> None:
+    """Store the (x, y, z) index of a cropped image within its full grid, and the full grid size."""
+    sitk_data.SetMetaData(CROP_INDEX_KEY, " ".join(str(int(v)) for v in crop_index))
+    sitk_data.SetMetaData(FULL_SIZE_KEY, " ".join(str(int(v)) for v in full_size))
+
+
+def get_crop_params(sitk_data: sitk.Image) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Return ((x, y, z) crop index, full grid size); ((0, 0, 0), own size) if the image is not cropped."""
+    if not is_cropped_image(sitk_data):
+        return (0,) * sitk_data.GetDimension(), sitk_data.GetSize()
+    crop_index = tuple(int(v) for v in sitk_data.GetMetaData(CROP_INDEX_KEY).split())
+    full_size = tuple(int(v) for v in sitk_data.GetMetaData(FULL_SIZE_KEY).split())
+    return crop_index, full_size
+
+
+def is_cropped_image(sitk_data: sitk.Image) -> bool:
+    """Check whether an image is a bounding-box crop of a larger grid."""
+    return sitk_data.HasMetaDataKey(CROP_INDEX_KEY) and sitk_data.HasMetaDataKey(FULL_SIZE_KEY)
+
+
+def get_full_grid_origin(sitk_data: sitk.Image) -> Tuple[float, ...]:
+    """Return the physical origin of the full grid that a (possibly cropped) image belongs to."""
+    crop_index, _ = get_crop_params(sitk_data)
+    return sitk_data.TransformContinuousIndexToPhysicalPoint([-float(v) for v in crop_index])
+
+
+def crop_mask_array_to_image(
+    mask_array: np.ndarray,
+    spacing: Tuple[float, ...],
+    direction: Tuple[float, ...],
+    origin: Tuple[float, ...],
+    array_index: Tuple[int, int, int] = (0, 0, 0),
+    full_size: Optional[Tuple[int, int, int]] = None,
+) -> sitk.Image:
+    """
+    Create a mask image cropped to the bounding box of the nonzero voxels of a (slices, rows, cols) array.
+    
+    The array spans the full grid unless it is a sub-array placed at the (x, y, z) array_index of a grid of full_size.
+    """
+    if full_size is None:
+        full_size = mask_array.shape[::-1]
+    nonzero_z = np.flatnonzero(mask_array.any(axis=(1, 2)))
+    if nonzero_z.size == 0:
+        mask_array = np.zeros((1, 1, 1), dtype=mask_array.dtype)  # Empty mask is kept as a single zero voxel
+        start, stop, array_index = (0, 0, 0), (1, 1, 1), (0, 0, 0)
+    else:
+        z0, z1 = nonzero_z[0], nonzero_z[-1] + 1
+        slab = mask_array[z0:z1]
+        nonzero_y = np.flatnonzero(slab.any(axis=(0, 2)))
+        nonzero_x = np.flatnonzero(slab.any(axis=(0, 1)))
+        start = (int(z0), int(nonzero_y[0]), int(nonzero_x[0]))
+        stop = (int(z1), int(nonzero_y[-1]) + 1, int(nonzero_x[-1]) + 1)
+    
+    return cropped_mask_from_array(
+        mask_array[start[0]:stop[0], start[1]:stop[1], start[2]:stop[2]],
+        crop_index=tuple(int(a) + int(b) for a, b in zip(start[::-1], array_index)),  # (x, y, z)
+        full_size=full_size,
+        spacing=spacing,
+        direction=direction,
+        origin=origin,
+    )
+
+
+def cropped_mask_from_array(
+    crop_array: np.ndarray,
+    crop_index: Tuple[int, ...],
+    full_size: Tuple[int, ...],
+    spacing: Tuple[float, ...],
+    direction: Tuple[float, ...],
+    origin: Tuple[float, ...],
+) -> sitk.Image:
+    """Create a cropped mask image from its (slices, rows, cols) sub-array at the (x, y, z) crop index of a full grid with the given origin."""
+    cropped = sitk.GetImageFromArray(crop_array)
+    cropped.SetSpacing(spacing)
+    cropped.SetDirection(direction)
+    cropped.SetOrigin(origin)
+    crop_index = tuple(int(i) for i in crop_index)
+    cropped.SetOrigin(cropped.TransformIndexToPhysicalPoint(crop_index))
+    set_crop_params(cropped, crop_index, full_size)
+    return cropped
+
+
+MASK_STATS_KEY = "mdh_mask_stats"
+
+
+def set_mask_statistics(mask: sitk.Image) -> Dict[str, Any]:
+    """
+    Compute geometry statistics of a (possibly cropped) binary mask and store them in its metadata.
+
+    Returns:
+        Dictionary with 'voxel_count', 'volume_cc', 'centroid' (physical x, y, z), and
+        'bbox_index' / 'bbox_size' (x, y, z) of the nonzero voxels within the mask's full grid.
+        Centroid and bounding box are None for an empty mask.
+    """
+    view = sitk.GetArrayViewFromImage(mask)
+    counts_z = np.count_nonzero(view, axis=(1, 2))
+    counts_y = np.count_nonzero(view, axis=(0, 2))
+    counts_x = np.count_nonzero(view, axis=(0, 1))
+    voxel_count = int(counts_z.sum())
+    
+    stats: Dict[str, Any] = {
+        "voxel_count": voxel_count,
+        "volume_cc": voxel_count * float(np.prod(mask.GetSpacing())) / 1000.0,
+        "centroid": None,
+        "bbox_index": None,
+        "bbox_size": None,
+    }
+    if voxel_count:
+        axis_counts = (counts_x, counts_y, counts_z)
+        centroid_index = [float(np.dot(counts, np.arange(counts.size))) / voxel_count for counts in axis_counts]
+        stats["centroid"] = list(mask.TransformContinuousIndexToPhysicalPoint(centroid_index))
+        
+        crop_index, _ = get_crop_params(mask)
+        nonzero = [np.flatnonzero(counts) for counts in axis_counts]
+        stats["bbox_index"] = [int(idx[0]) + offset for idx, offset in zip(nonzero, crop_index)]
+        stats["bbox_size"] = [int(idx[-1] - idx[0]) + 1 for idx in nonzero]
+    
+    mask.SetMetaData(MASK_STATS_KEY, dumps(stats))
+    return stats
+
+
+def get_mask_statistics(mask: sitk.Image) -> Optional[Dict[str, Any]]:
+    """Return the geometry statistics stored by set_mask_statistics, or None if absent."""
+    if not mask.HasMetaDataKey(MASK_STATS_KEY):
+        return None
+    return loads(mask.GetMetaData(MASK_STATS_KEY))
+
+
+def expand_cropped_mask(sitk_data: sitk.Image) -> sitk.Image:
+    """Return the full-size version of a cropped mask (the image itself if it is not cropped)."""
+    if not is_cropped_image(sitk_data):
+        return sitk_data
+    crop_index, full_size = get_crop_params(sitk_data)
+    crop_view = sitk.GetArrayViewFromImage(sitk_data)
+    full_array = np.zeros(full_size[::-1], dtype=crop_view.dtype)
+    x0, y0, z0 = crop_index
+    full_array[z0:z0 + crop_view.shape[0], y0:y0 + crop_view.shape[1], x0:x0 + crop_view.shape[2]] = crop_view
+    
+    full_image = sitk.GetImageFromArray(full_array)
+    full_image.SetSpacing(sitk_data.GetSpacing())
+    full_image.SetDirection(sitk_data.GetDirection())
+    full_image.SetOrigin(get_full_grid_origin(sitk_data))
+    copy_all_metadata(src=sitk_data, dst=full_image)
+    for key in (CROP_INDEX_KEY, FULL_SIZE_KEY):
+        full_image.EraseMetaData(key)
+    return full_image
+
+
+def resample_cropped_mask_to_grid(
+    mask: sitk.Image,
+    reference_grid: Dict[str, Tuple],
+    interpolator: int = sitk.sitkNearestNeighbor,
+) -> sitk.Image:
+    """
+    Resample a cropped mask onto the part of the reference grid covered by its bounding box, keeping it cropped.
+    
+    Use a label interpolator (nearest or label Gaussian); the result is stored as uint8 like the mask itself.
+    """
+    ref_size = np.array(reference_grid["size"])
+    crop_index, full_size = get_crop_params(mask)
+    
+    # Reference voxels whose centers fall within the mask's outer voxel edges (where the interpolator is defined)
+    corners = np.array([
+        transform_physical_to_grid_index(
+            reference_grid,
+            mask.TransformContinuousIndexToPhysicalPoint([(-0.5 if c == 0 else n - 0.5) for c, n in zip(corner, mask.GetSize())])
+        )
+        for corner in np.ndindex(2, 2, 2)
+    ])
+    start = np.maximum(np.ceil(corners.min(axis=0) - 1e-3).astype(int), 0)
+    stop = np.minimum(np.floor(corners.max(axis=0) + 1e-3).astype(int) + 1, ref_size)
+    if np.any(stop <= start):
+        start, stop = np.zeros(3, dtype=int), np.ones(3, dtype=int)  # No overlap: single zero voxel
+    
+    if (
+        tuple(start.tolist()) == crop_index and tuple(ref_size.tolist()) == full_size
+        and tuple((stop - start).tolist()) == mask.GetSize()
+        and np.allclose(mask.GetSpacing(), reference_grid["spacing"])
+        and np.allclose(mask.GetDirection(), reference_grid["direction"])
+        and np.allclose(mask.GetOrigin(), transform_grid_index_to_physical(reference_grid, start))
+    ):
+        return mask  # Already on the reference grid
+    
+    # Zero-pad inner crop edges so interpolation sees the same neighbors as in the full-size mask
+    pad_lower = [int(i > 0) for i in crop_index]
+    pad_upper = [int(i + n < f) for i, n, f in zip(crop_index, mask.GetSize(), full_size)]
+    padded_mask = sitk.ConstantPad(mask, pad_lower, pad_upper, 0) if any(pad_lower + pad_upper) else mask
+    
+    resampled = resample_to_grid(padded_mask, reference_grid, start=tuple(start.tolist()), size=tuple((stop - start).tolist()), interpolator=interpolator)
+    if resampled.GetPixelID() != sitk.sitkUInt8:
+        resampled = sitk.Cast(resampled, sitk.sitkUInt8)
+    copy_all_metadata(src=mask, dst=resampled)
+    set_crop_params(resampled, tuple(start.tolist()), tuple(ref_size.tolist()))
+    return resampled
+
+
+def merge_dataset_metadata(ds: Dataset, image: sitk.Image) -> sitk.Image:
+    """Copies top-level, non-sequence, non-binary DICOM elements to the image metadata, keyed like merge_imagereader_metadata."""
+    for tag in ds.keys():
+        # Check the VR before conversion so deferred binary elements (e.g., PixelData) are never read
+        raw_elem = ds.get_item(tag, keep_deferred=True)
+        vr = raw_elem.VR
+        if vr is None:
+            try:
+                vr = dictionary_VR(tag)
+            except KeyError:
+                vr = "UN"
+        if vr in ("SQ", "OB", "OD", "OF", "OL", "OV", "OW", "UN"):
+            continue
+        elem = ds[tag]
+        keyword = elem.keyword or f"{elem.tag.group:04x}|{elem.tag.element:04x}"
+        value = elem.value
+        if value is None:
+            value_str = ""
+        elif isinstance(value, (list, tuple, MultiValue)):
+            value_str = "\\".join(str(v) for v in value)
+        else:
+            value_str = str(value)
+        image.SetMetaData(keyword, value_str)
+    return image
+
+
 def log_image_metadata(image: sitk.Image) -> None:
     """Logs metadata, spacing, origin, direction, and size of a SimpleITK image."""
     logger.info("Logging image metadata:")
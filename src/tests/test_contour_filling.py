@@ -4,12 +4,41 @@ Test ROI contour-to-mask conversion and complete DICOM-to-mask pipeline includin
 from __future__ import annotations
 
 
+import warnings
+from io import BytesIO
+
+
 import cv2
 import numpy as np
 import pytest
+from pydicom import dcmread
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.sequence import Sequence
+from pydicom.uid import ExplicitVRLittleEndian, ImplicitVRLittleEndian
+import SimpleITK as sitk
 
 
+from mdh_app.data_builders.RTStructBuilder import extract_roi_contours, build_roi_contour_store
+from mdh_app.managers.data_manager import CONTOUR_FILL_SHIFT, LazyROIMask, build_roi_slice_polylines, build_single_mask
 from mdh_app.utils.numpy_utils import resample_contour_dense, numpy_roi_mask_generation
+from mdh_app.utils.sitk_utils import get_crop_params
+
+
+def _reference_resample_contour_dense(contour_pts, spacing, density_divisor=8.0):
+    """Original per-vertex loop implementation of resample_contour_dense, kept as the equivalence reference."""
+    if len(contour_pts) < 2:
+        return contour_pts
+    target_resolution = min(spacing) / density_divisor
+    resampled = []
+    for i in range(len(contour_pts)):
+        p1 = contour_pts[i]
+        p2 = contour_pts[(i + 1) % len(contour_pts)]
+        distance = np.linalg.norm(p2 - p1)
+        n_segments = max(1, int(np.ceil(distance / target_resolution)))
+        for j in range(n_segments):
+            t = j / n_segments
+            resampled.append(p1 + t * (p2 - p1))
+    return np.array(resampled, dtype=np.float32)
 
 
 class TestContourFilling:
@@ -565,4 +594,295 @@ class TestContourFilling:
             except (ValueError, IndexError):
                 # Expected for invalid input
                 pass
-    
\ No newline at end of file
+
+    def test_resample_contour_dense_matches_reference(self):
+        """
+        Test that the vectorized densification reproduces the per-vertex loop exactly.
+        References numpy_utils.py resample_contour_dense.
+        """
+        rng = np.random.default_rng(0)
+        for i in range(50):
+            contour_points_3d = (rng.random((rng.integers(2, 50), 3)) * 40.0 - 20.0).astype(np.float32)
+            if i % 2 == 0:
+                contour_points_3d[:, 2] = contour_points_3d[0, 2]  # Planar contour
+            spacing_array = (rng.random(3) * 3.0 + 0.5).astype(np.float32)
+
+            expected = _reference_resample_contour_dense(contour_points_3d, spacing_array)
+            result = resample_contour_dense(contour_points_3d, spacing=spacing_array)
+
+            assert result.dtype == np.float32, f"Case {i}: expected float32 output"
+            assert result.shape == expected.shape, f"Case {i}: shape {result.shape} != {expected.shape}"
+            assert np.array_equal(result, expected), f"Case {i}: resampled points differ from reference"
+
+        # Duplicate vertices (zero-length segments) and degenerate inputs
+        duplicate_points = np.array([[0, 0, 5], [0, 0, 5], [10, 0, 5], [10, 10, 5]], dtype=np.float32)
+        spacing_array = np.array([1.0, 1.0, 2.0], dtype=np.float32)
+        assert np.array_equal(
+            resample_contour_dense(duplicate_points, spacing=spacing_array),
+            _reference_resample_contour_dense(duplicate_points, spacing_array),
+        ), "Zero-length segment handling differs from reference"
+        single_point = np.array([[1.0, 2.0, 3.0]], dtype=np.float32)
+        assert resample_contour_dense(single_point, spacing=spacing_array) is single_point, "Single point should be returned as-is"
+
+    def test_resample_contour_dense_large_contour(self):
+        """
+        Test that the vectorized densification matches the per-vertex loop on a finely sampled contour.
+        References numpy_utils.py resample_contour_dense.
+        """
+        # Circle of 2000 vertices (~0.5 mm edges), typical of a finely sampled body contour
+        angles = np.linspace(0, 2 * np.pi, 2000, endpoint=False)
+        contour_points_3d = np.column_stack(
+            (200.0 + 150.0 * np.cos(angles), 200.0 + 150.0 * np.sin(angles), np.full_like(angles, 50.0))
+        ).astype(np.float32)
+        spacing_array = np.array([1.0, 1.0, 2.5], dtype=np.float32)
+
+        expected = _reference_resample_contour_dense(contour_points_3d, spacing_array)
+        result = resample_contour_dense(contour_points_3d, spacing=spacing_array)
+
+        assert len(result) > 2 * len(contour_points_3d), "Expected several samples per edge"
+        assert np.array_equal(result, expected), "Resampled points differ from reference"
+
+        # Verify reasonable execution time (the per-vertex loop takes ~50 ms on this contour)
+        import time
+        execution_times = []
+        for _ in range(3):
+            start_time = time.time()
+            resample_contour_dense(contour_points_3d, spacing=spacing_array)
+            execution_times.append(time.time() - start_time)
+        assert min(execution_times) < 0.01, f"Contour densification too slow: {min(execution_times) * 1000:.1f} ms"
+
+    @pytest.mark.parametrize("transfer_syntax", [ExplicitVRLittleEndian, ImplicitVRLittleEndian])
+    def test_extract_roi_contours_matches_pydicom(self, transfer_syntax):
+        """
+        Test that bulk decoding of raw ContourData matches pydicom's DS conversion.
+        References RTStructBuilder.py extract_roi_contours.
+        """
+        rng = np.random.default_rng(3)
+        contour_values = [
+            [f"{v:.6g}" for v in rng.uniform(-300.0, 300.0, size=3 * rng.integers(1, 40))] for _ in range(25)
+        ]
+        contour_values[4] = ["1.5", "-2", "3e1"]  # Exponent and integer notation
+        contour_values[7] = ["1.5", "987654", "2.0"]  # Patched to a malformed value after writing
+
+        ds = Dataset()
+        roi_contour_ds = Dataset()
+        roi_contour_ds.ReferencedROINumber = 1
+        roi_contour_ds.ContourSequence = Sequence()
+        for idx, values in enumerate(contour_values):
+            contour_ds = Dataset()
+            contour_ds.ContourNumber = idx + 1
+            contour_ds.ContourGeometricType = "CLOSED_PLANAR"
+            contour_ds.NumberOfContourPoints = len(values) // 3
+            contour_ds.add_new(0x30060050, "DS", "\\".join(values))
+            roi_contour_ds.ContourSequence.append(contour_ds)
+        no_data_ds = Dataset()
+        no_data_ds.ContourNumber = len(contour_values) + 1
+        no_data_ds.ContourGeometricType = "POINT"
+        roi_contour_ds.ContourSequence.append(no_data_ds)
+        ds.ROIContourSequence = Sequence([roi_contour_ds])
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = transfer_syntax
+
+        # Write and read back so ContourData stays as raw bytes until accessed
+        buffer = BytesIO()
+        ds.save_as(buffer, implicit_vr=transfer_syntax.is_implicit_VR, little_endian=True)
+        file_bytes = buffer.getvalue()
+        assert file_bytes.count(b"\\987654\\") == 1
+        file_bytes = file_bytes.replace(b"\\987654\\", b"\\abcdef\\")  # pydicom refuses to write an invalid DS
+        roi_contour_read = dcmread(BytesIO(file_bytes), force=True).ROIContourSequence[0]
+
+        # NumPy deprecates parsing up to malformed text in favor of raising, which the decoder must also handle
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            contours = extract_roi_contours(roi_contour_read)
+        assert len(contours) == len(contour_values) + 1
+        for idx, (contour_number, geometric_type, points) in enumerate(contours[:-1]):
+            assert contour_number == idx + 1 and geometric_type == "CLOSED_PLANAR"
+            if idx == 7:
+                assert points is None, "Malformed ContourData should be dropped"
+                continue
+            expected = np.array([float(v) for v in contour_values[idx]], dtype=np.float32)
+            assert points.dtype == np.float32
+            assert np.array_equal(points, expected), f"Contour {idx + 1} differs from pydicom conversion"
+        assert contours[-1][2] is None, "Missing ContourData should be reported as None"
+
+    def test_roi_contour_store_packing(self):
+        """
+        Test that packed contours match the decoded contours, are read-only, and release the ContourSequence.
+        References RTStructBuilder.py build_roi_contour_store.
+        """
+        image_params = {"origin": (-100.0, -100.0, -50.0), "spacing": (1.0, 1.0, 2.5), "direction": (1, 0, 0, 0, 1, 0, 0, 0, 1)}
+        contour_points = [
+            np.array([[0.0, 0.0, 0.0], [10.0, 0.0, 0.0], [10.0, 10.0, 0.0]]),
+            np.array([[5.0, 5.0, 12.5]]),
+            None,  # Missing ContourData
+            np.array([[0.0, 0.0, -2.5], [4.0, 0.0, -2.5], [4.0, 4.0, -2.5], [0.0, 4.0, -2.5]]),
+        ]
+        roi_contour_ds = Dataset()
+        roi_contour_ds.ContourSequence = Sequence()
+        for idx, points in enumerate(contour_points):
+            contour_ds = Dataset()
+            contour_ds.ContourNumber = idx + 1
+            contour_ds.ContourGeometricType = "POINT" if points is not None and len(points) == 1 else "CLOSED_PLANAR"
+            if points is not None:
+                contour_ds.ContourData = [f"{v:g}" for v in points.ravel()]
+            roi_contour_ds.ContourSequence.append(contour_ds)
+
+        store = build_roi_contour_store(roi_contour_ds, image_params)
+
+        assert store["vertices"].shape == (8, 3) and store["vertices"].dtype == np.float32
+        assert store["offsets"].tolist() == [0, 3, 4, 4, 8]
+        assert store["slice_indices"].tolist() == [20, 25, -1, 19]
+        assert store["contour_numbers"] == (1, 2, 3, 4)
+        assert store["geometric_types"] == ("CLOSED_PLANAR", "POINT", "CLOSED_PLANAR", "CLOSED_PLANAR")
+        for idx, points in enumerate(contour_points):
+            packed = store["vertices"][store["offsets"][idx]:store["offsets"][idx + 1]]
+            expected = points if points is not None else np.empty((0, 3))
+            assert np.array_equal(packed, expected.astype(np.float32)), f"Contour {idx + 1} changed when packed"
+
+        for key in ("vertices", "offsets", "slice_indices"):
+            assert not store[key].flags.writeable, f"Packed {key} should be read-only"
+        assert "ContourSequence" not in roi_contour_ds, "ContourSequence should be released once packed"
+
+    def test_lazy_roi_mask_matches_full_build(self):
+        """
+        Test that a lazily rasterized mask fills viewed slices exactly and completes to the full build.
+        References data_manager.py LazyROIMask / build_single_mask.
+        """
+        image_params = {
+            "cols": 64, "rows": 48, "slices": 24,
+            "origin": (-32.0, -24.0, -30.0), "spacing": (1.0, 1.0, 2.5), "direction": (1, 0, 0, 0, 1, 0, 0, 0, 1),
+        }
+        rng = np.random.default_rng(11)
+        roi_contour_ds = Dataset()
+        roi_contour_ds.ContourSequence = Sequence()
+        for idx, z in enumerate(np.arange(-20.0, 10.1, 2.5)):
+            angles = np.sort(rng.uniform(0.0, 2.0 * np.pi, size=12))
+            radii = rng.uniform(6.0, 14.0, size=12)
+            points = np.stack([radii * np.cos(angles), radii * np.sin(angles) - 4.0, np.full(12, z)], axis=1)
+            contour_ds = Dataset()
+            contour_ds.ContourNumber = idx + 1
+            contour_ds.ContourGeometricType = "CLOSED_PLANAR"
+            contour_ds.ContourData = [f"{v:.3f}" for v in points.ravel()]
+            roi_contour_ds.ContourSequence.append(contour_ds)
+        store = build_roi_contour_store(roi_contour_ds, image_params)
+        roi_ds_dict = {"StructureSetROI": {"ROIName": "Lazy", "ROINumber": 1}}
+
+        expected_image = build_single_mask(roi_ds_dict, image_params, roi_contours=store)
+        expected_full = np.zeros((24, 48, 64), dtype=np.uint8)
+        (x0, y0, z0), _ = get_crop_params(expected_image)
+        expected_array = sitk.GetArrayFromImage(expected_image)
+        expected_full[z0:z0 + expected_array.shape[0], y0:y0 + expected_array.shape[1], x0:x0 + expected_array.shape[2]] = expected_array
+
+        assert LazyROIMask.supports(store)
+        lazy_mask = LazyROIMask(store, image_params, "Lazy", 1)
+        full_slicer = (slice(0, 48), slice(0, 64))
+        for slice_idx in (12, 4, 0, 23):
+            assert np.array_equal(lazy_mask.get_plane((slice_idx,) + full_slicer), expected_full[slice_idx]), f"Slice {slice_idx} differs"
+        assert lazy_mask.get_value((12, 20, 32)) == bool(expected_full[12, 20, 32])
+        assert not lazy_mask.is_complete
+
+        lazy_image = lazy_mask.to_image()
+        assert lazy_mask.is_complete
+        assert np.array_equal(sitk.GetArrayFromImage(lazy_image), expected_array)
+        for key in expected_image.GetMetaDataKeys():
+            assert lazy_image.GetMetaData(key) == expected_image.GetMetaData(key), f"Metadata '{key}' differs"
+        assert lazy_image.GetOrigin() == expected_image.GetOrigin() and lazy_image.GetSize() == expected_image.GetSize()
+
+        # Once complete, reformatted planes are exact too
+        assert np.array_equal(lazy_mask.get_plane((slice(0, 24), 20, slice(0, 64))), expected_full[:, 20, :])
+        assert np.array_equal(lazy_mask.get_plane((slice(0, 24), slice(0, 48), 30)), expected_full[:, :, 30])
+
+    def test_single_mask_matches_full_grid_fill(self):
+        """
+        Test that rasterizing within the contours' bounding box gives the same mask as filling full image slices,
+        including contours that cross the grid edges or lie outside it.
+        References data_manager.py build_single_mask.
+        """
+        image_params = {
+            "cols": 40, "rows": 30, "slices": 12,
+            "origin": (0.0, 0.0, 0.0), "spacing": (1.0, 1.0, 2.0), "direction": (1, 0, 0, 0, 1, 0, 0, 0, 1),
+        }
+        angles = np.linspace(0, 2 * np.pi, 24, endpoint=False)
+        circles = [(20.0, 15.0, 6.0, 8.0), (-3.0, 25.0, 7.0, 4.0), (36.0, -2.0, 9.0, 10.0), (70.0, 10.0, 5.0, 6.0), (20.0, 15.0, 4.0, 40.0)]
+        roi_contour_ds = Dataset()
+        roi_contour_ds.ContourSequence = Sequence()
+        expected = np.zeros((12, 30, 40), dtype=np.uint8)
+        for idx, (cx, cy, radius, z) in enumerate(circles):
+            points = np.stack([cx + radius * np.cos(angles), cy + radius * np.sin(angles), np.full(24, z)], axis=1).astype(np.float32)
+            contour_ds = Dataset()
+            contour_ds.ContourNumber = idx + 1
+            contour_ds.ContourGeometricType = "CLOSED_PLANAR"
+            contour_ds.ContourData = [f"{v:.3f}" for v in points.ravel()]
+            roi_contour_ds.ContourSequence.append(contour_ds)
+
+            # Reference: fill the densified polygon into the full image slice
+            points = np.array([float(v) for v in contour_ds.ContourData], dtype=np.float32).reshape(-1, 3)
+            dense_points = resample_contour_dense(points, spacing=np.array(image_params["spacing"], dtype=np.float32))
+            matrix_points = dense_points / np.array(image_params["spacing"], dtype=np.float32)
+            slice_idx = int(np.round(matrix_points[0, 2]))
+            if 0 <= slice_idx < 12:
+                polygon = np.rint(matrix_points[:, :2] * (2 ** CONTOUR_FILL_SHIFT)).astype(np.int32)
+                cv2.fillPoly(expected[slice_idx], [polygon], color=1, shift=CONTOUR_FILL_SHIFT, lineType=cv2.LINE_8)
+
+        store = build_roi_contour_store(roi_contour_ds, image_params)
+        mask_image = build_single_mask({"StructureSetROI": {"ROIName": "Edges", "ROINumber": 1}}, image_params, roi_contours=store)
+
+        result = np.zeros_like(expected)
+        (x0, y0, z0), full_size = get_crop_params(mask_image)
+        mask_array = sitk.GetArrayFromImage(mask_image)
+        result[z0:z0 + mask_array.shape[0], y0:y0 + mask_array.shape[1], x0:x0 + mask_array.shape[2]] = mask_array
+        assert full_size == (40, 30, 12)
+        assert np.array_equal(result, expected), "Bounding box rasterization differs from full slice filling"
+
+    def test_roi_slice_polylines(self):
+        """
+        Test that contour polylines are grouped per slice and outline the same pixels as the mask they fill.
+        References data_manager.py build_roi_slice_polylines.
+        """
+        image_params = {
+            "cols": 40, "rows": 40, "slices": 10,
+            "origin": (0.0, 0.0, 0.0), "spacing": (1.0, 1.0, 2.0), "direction": (1, 0, 0, 0, 1, 0, 0, 0, 1),
+        }
+        contours = [
+            ("CLOSED_PLANAR", [[5, 5, 4], [30, 5, 4], [30, 20, 4], [5, 20, 4]]),
+            ("OPEN_PLANAR", [[5, 30, 4], [20, 35, 4]]),
+            ("POINT", [[12, 12, 10]]),
+        ]
+        roi_contour_ds = Dataset()
+        roi_contour_ds.ContourSequence = Sequence()
+        for idx, (geometric_type, points) in enumerate(contours):
+            contour_ds = Dataset()
+            contour_ds.ContourNumber = idx + 1
+            contour_ds.ContourGeometricType = geometric_type
+            contour_ds.ContourData = [f"{v:g}" for point in points for v in point]
+            roi_contour_ds.ContourSequence.append(contour_ds)
+        store = build_roi_contour_store(roi_contour_ds, image_params)
+
+        slice_polylines = build_roi_slice_polylines(store, image_params)
+        assert sorted(slice_polylines) == [2, 5]
+        closed_polylines, open_polylines = slice_polylines[2]
+        assert len(closed_polylines) == 1 and len(open_polylines) == 1
+        assert np.array_equal(closed_polylines[0] >> CONTOUR_FILL_SHIFT, [[5, 5], [30, 5], [30, 20], [5, 20]])
+        assert np.array_equal(slice_polylines[5][0][0] >> CONTOUR_FILL_SHIFT, [[12, 12]])
+
+        # The outline drawn from the polygon matches the outline traced from the filled mask
+        mask_image = build_single_mask({"StructureSetROI": {"ROIName": "Box", "ROINumber": 1}}, image_params, roi_contours=store)
+        (x0, y0, z0), _ = get_crop_params(mask_image)
+        mask_slice = np.zeros((40, 40), dtype=np.uint8)
+        mask_array = sitk.GetArrayFromImage(mask_image)[2 - z0]
+        mask_slice[y0:y0 + mask_array.shape[0], x0:x0 + mask_array.shape[1]] = mask_array
+        mask_slice[30:, :] = 0  # Drop the filled open contour, which is drawn as a line instead
+        mask_contours, _ = cv2.findContours(mask_slice, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        expected_outline = np.zeros((40, 40), dtype=np.uint8)
+        cv2.drawContours(expected_outline, mask_contours, -1, 1, 1)
+        outline = np.zeros((40, 40), dtype=np.uint8)
+        cv2.polylines(outline, closed_polylines, True, 1, 1, cv2.LINE_8, CONTOUR_FILL_SHIFT)
+        assert np.array_equal(outline, expected_outline)
+
+        # Contours that cross slices cannot be drawn per slice
+        oblique_contour_ds = Dataset()
+        oblique_contour_ds.ContourSequence = Sequence([Dataset()])
+        oblique_contour_ds.ContourSequence[0].ContourGeometricType = "CLOSED_PLANAR"
+        oblique_contour_ds.ContourSequence[0].ContourData = ["5", "5", "4", "30", "5", "10", "30", "20", "10"]
+        assert build_roi_slice_polylines(build_roi_contour_store(oblique_contour_ds, image_params), image_params) is None
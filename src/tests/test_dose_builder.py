@@ -0,0 +1,121 @@
+"""
+Test RT Dose construction via construct_dose() from mdh_app/data_builders/RTDoseBuilder.py
+"""
+from __future__ import annotations
+
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
+from pydicom.sequence import Sequence
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+
+from mdh_app.data_builders.RTDoseBuilder import construct_dose
+from mdh_app.utils.sitk_utils import merge_imagereader_metadata, get_rescale_params
+
+
+DOSE_GRID_SCALING = 3.5e-5
+OBLIQUE_IOP = [np.cos(0.3), np.sin(0.3), 0.0, -0.8 * np.sin(0.3), 0.8 * np.cos(0.3), 0.6]
+
+
+def write_rtdose(file_path: str, offsets, iop=OBLIQUE_IOP) -> str:
+    """Write a small RTDOSE file with the given GridFrameOffsetVector and ImageOrientationPatient."""
+    file_meta = FileMetaDataset()
+    file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.481.2"
+    file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds = FileDataset(file_path, {}, file_meta=file_meta, preamble=b"\0" * 128)
+    ds.SOPClassUID = file_meta.MediaStorageSOPClassUID
+    ds.SOPInstanceUID = file_meta.MediaStorageSOPInstanceUID
+    ds.Modality = "RTDOSE"
+    ds.PatientID = "DOSE_TEST"
+    ds.StudyInstanceUID = generate_uid()
+    ds.SeriesInstanceUID = generate_uid()
+    ds.FrameOfReferenceUID = generate_uid()
+
+    num_frames, rows, cols = len(offsets), 6, 5
+    ds.ImagePositionPatient = [-10.5, 20.25, -3.0]
+    ds.ImageOrientationPatient = [float(v) for v in iop]
+    ds.PixelSpacing = [2.5, 3.0]
+    ds.SliceThickness = 9.0  # Deliberately different from the frame offsets
+    ds.NumberOfFrames = num_frames
+    ds.FrameIncrementPointer = (0x3004, 0x000C)
+    ds.GridFrameOffsetVector = list(offsets)
+    ds.Rows, ds.Columns = rows, cols
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated, ds.BitsStored, ds.HighBit, ds.PixelRepresentation = 32, 32, 31, 0
+    ds.DoseUnits, ds.DoseType, ds.DoseSummationType = "GY", "PHYSICAL", "PLAN"
+    ds.DoseGridScaling = DOSE_GRID_SCALING
+    ref_plan = Dataset()
+    ref_plan.ReferencedSOPClassUID = "1.2.840.10008.5.1.4.1.1.481.5"
+    ref_plan.ReferencedSOPInstanceUID = generate_uid()
+    ds.ReferencedRTPlanSequence = Sequence([ref_plan])
+    ds.PixelData = (np.arange(num_frames * rows * cols, dtype=np.uint32) * 9973).tobytes()
+    ds.save_as(file_path, enforce_file_format=True)
+    return file_path
+
+
+def read_dose_with_sitk(file_path: str) -> sitk.Image:
+    """Read the dose as the SimpleITK file reader did before the single-pass builder."""
+    reader = sitk.ImageFileReader()
+    reader.SetFileName(file_path)
+    reader.ReadImageInformation()
+    reader.SetOutputPixelType(sitk.sitkFloat64)
+    sitk_dose = sitk.Cast(sitk.Multiply(reader.Execute(), DOSE_GRID_SCALING), sitk.sitkFloat32)
+    return merge_imagereader_metadata(reader, sitk_dose)
+
+
+class TestDoseBuilder:
+    """Test building dose grids directly from the parsed RT Dose dataset."""
+
+    @pytest.mark.parametrize(
+        "offsets",
+        [[0.0, 2.0, 4.0, 6.0], [100.0, 102.5, 105.0, 107.5], [0.0, -2.0, -4.0, -6.0]],
+        ids=["relative", "absolute", "decreasing"],
+    )
+    def test_matches_sitk_reader(self, tmp_path, offsets):
+        """
+        Test that geometry, scaled values and metadata match the SimpleITK file reader.
+        References RTDoseBuilder.py _get_dose_geometry / construct_dose and sitk_utils.py merge_dataset_metadata.
+        """
+        file_path = write_rtdose(str(tmp_path / "rd.dcm"), offsets)
+        expected = read_dose_with_sitk(file_path)
+        dose = construct_dose(file_path, None)
+
+        assert dose is not None
+        assert dose.GetSize() == expected.GetSize()
+        assert np.allclose(dose.GetOrigin(), expected.GetOrigin())
+        assert np.allclose(dose.GetSpacing(), expected.GetSpacing())
+        assert np.allclose(dose.GetDirection(), expected.GetDirection(), atol=1e-6)
+        assert dose.GetPixelID() == sitk.sitkFloat32
+        assert np.allclose(sitk.GetArrayViewFromImage(dose), sitk.GetArrayViewFromImage(expected), rtol=1e-6, atol=0)
+
+        # Values may differ only by DICOM padding and hex case (e.g., '9.0 ' and '(3004,000c)')
+        missing_keys = set(expected.GetMetaDataKeys()) - set(dose.GetMetaDataKeys())
+        assert not missing_keys
+        for key in expected.GetMetaDataKeys():
+            assert dose.GetMetaData(key).strip().upper() == expected.GetMetaData(key).strip().upper(), key
+        assert dose.GetMetaData("ReferencedRTPlanSOPInstanceUID")
+
+    def test_native_pixel_type(self, tmp_path):
+        """Test that native storage keeps the stored values with DoseGridScaling as rescale slope."""
+        file_path = write_rtdose(str(tmp_path / "rd.dcm"), [0.0, 2.0, 4.0])
+        dose = construct_dose(file_path, None)
+        native_dose = construct_dose(file_path, None, native_pixel_type=True)
+
+        assert native_dose.GetPixelID() == sitk.sitkUInt32
+        slope, intercept = get_rescale_params(native_dose)
+        assert slope == pytest.approx(DOSE_GRID_SCALING) and intercept == 0
+        rescaled = sitk.GetArrayViewFromImage(native_dose) * slope + intercept
+        assert np.allclose(rescaled, sitk.GetArrayViewFromImage(dose), rtol=1e-6, atol=0)
+
+    def test_non_uniform_offsets_rejected(self, tmp_path):
+        """
+        Test that non-uniform frame offsets are rejected rather than placed on a regular grid.
+        The SimpleITK reader applies the first offset step to every frame, misplacing the later ones.
+        """
+        file_path = write_rtdose(str(tmp_path / "rd.dcm"), [0.0, 2.0, 5.0, 9.0])
+        assert construct_dose(file_path, None) is None
@@ -0,0 +1,132 @@
+"""
+Test the incremental dose sum of the displayed doses in mdh_app/managers/data_manager.py
+"""
+from __future__ import annotations
+
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+
+from mdh_app.managers.data_manager import DataManager
+from mdh_app.utils.sitk_utils import cropped_mask_from_array
+
+
+class StubConfigManager:
+    """Configuration with only the settings used to cache images, masks and doses for display."""
+
+    def get_ct_HU_map_vals(self):
+        return [-1000.0, 0.0, 1000.0]
+
+    def get_ct_RED_map_vals(self):
+        return [0.0, 1.0, 1.5]
+
+    def get_dose_interpolation(self) -> str:
+        return "linear"
+
+    def get_roi_interpolation(self) -> str:
+        return "nearest"
+
+    def get_bool_lazy_roi_rasterization(self) -> bool:
+        return False
+
+
+def make_dose(size, spacing, origin, seed: int) -> sitk.Image:
+    """Return a float32 dose of random values on the given (x, y, z) grid, zero in about a third of its voxels."""
+    rng = np.random.default_rng(seed)
+    dose = sitk.GetImageFromArray(np.maximum(rng.uniform(-35.0, 70.0, size=size[::-1]), 0.0).astype(np.float32))
+    dose.SetSpacing(spacing)
+    dose.SetOrigin(origin)
+    return dose
+
+
+def get_expected_sum(doses):
+    """Sum doses from scratch on the grid of the first one, linearly resampling the others with zero outside their grids."""
+    reference = doses[0]
+    total = sitk.GetArrayFromImage(reference).astype(np.float32)
+    for dose in doses[1:]:
+        resampled = sitk.Resample(dose, reference, sitk.Transform(), sitk.sitkLinear, 0.0, sitk.sitkFloat32)
+        total += sitk.GetArrayViewFromImage(resampled)
+    return total
+
+
+@pytest.fixture
+def data_mgr():
+    """Data manager with three doses on different grids, overlapping only in part."""
+    data_mgr = DataManager(StubConfigManager(), None)
+    data_mgr.rtdoses = {
+        "dose_a": make_dose((20, 18, 12), (2.0, 2.0, 2.5), (-20.0, -18.0, -15.0), 1),
+        "dose_b": make_dose((15, 16, 10), (2.5, 2.5, 3.0), (-12.0, -25.0, -10.0), 2),
+        "dose_c": make_dose((24, 20, 16), (1.5, 1.8, 2.0), (-30.0, -10.0, -20.0), 3),
+    }
+    return data_mgr
+
+
+class TestDoseSum:
+    """Test that adding and removing doses keeps the sum equal to one computed from scratch."""
+
+    @pytest.mark.parametrize(
+        "removal_order",
+        [["dose_a", "dose_b", "dose_c"], ["dose_b", "dose_a", "dose_c"], ["dose_c", "dose_b", "dose_a"], ["dose_b", "dose_c", "dose_a"]],
+    )
+    def test_matches_fresh_sum(self, data_mgr, removal_order):
+        """
+        Test that the sum matches a freshly computed one after each dose is added and removed, including the dose defining the grid.
+        References data_manager.py _add_dose_to_sum / _remove_dose_from_sum.
+        """
+        added = ["dose_a", "dose_b", "dose_c"]
+        for i, dose_uid in enumerate(added):
+            data_mgr.update_cached_data(True, ("dose", dose_uid))
+            expected = get_expected_sum([data_mgr.rtdoses[uid] for uid in added[:i + 1]])
+            assert np.allclose(sitk.GetArrayViewFromImage(data_mgr._cached_dose_sum), expected, rtol=1e-5, atol=1e-4)
+
+        remaining = list(added)
+        for dose_uid in removal_order:
+            data_mgr.update_cached_data(False, ("dose", dose_uid))
+            remaining.remove(dose_uid)
+            if not remaining:
+                assert data_mgr._cached_dose_sum is None
+                continue
+
+            dose_sum = data_mgr._cached_dose_sum
+            first_dose = data_mgr.rtdoses[remaining[0]]
+            assert dose_sum.GetSize() == first_dose.GetSize()
+            assert np.allclose(dose_sum.GetOrigin(), first_dose.GetOrigin())
+            assert np.allclose(dose_sum.GetSpacing(), first_dose.GetSpacing())
+            expected = get_expected_sum([data_mgr.rtdoses[uid] for uid in remaining])
+            assert np.allclose(sitk.GetArrayViewFromImage(dose_sum), expected, rtol=1e-5, atol=1e-4)
+            assert np.all(sitk.GetArrayViewFromImage(dose_sum)[expected == 0] == 0), "Residue left where no dose remains"
+
+    def test_unchanged_by_image_and_roi_toggles(self, data_mgr):
+        """
+        Test that toggling an image or an ROI leaves the dose sum untouched.
+        References data_manager.py update_cached_data.
+        """
+        image = sitk.Image(32, 28, 20, sitk.sitkInt16)
+        image.SetSpacing((2.0, 2.0, 2.5))
+        image.SetOrigin((-30.0, -25.0, -20.0))
+        data_mgr.images = {"image": image}
+        mask = np.zeros((4, 6, 5), dtype=np.uint8)
+        mask[1:3, 2:5, 1:4] = 1
+        data_mgr.rtstruct_roi_ds_dicts = {"struct": {1: {}}}
+        data_mgr.rois = {("struct", 1): cropped_mask_from_array(
+            mask, crop_index=(10, 8, 6), full_size=image.GetSize(),
+            spacing=image.GetSpacing(), direction=image.GetDirection(), origin=image.GetOrigin(),
+        )}
+
+        data_mgr.update_cached_data(True, ("image", "image"))
+        data_mgr.update_cached_data(True, ("dose", "dose_a"))
+        data_mgr.update_cached_data(True, ("dose", "dose_b"))
+        dose_sum = data_mgr._cached_dose_sum
+        dose_sum_values = sitk.GetArrayFromImage(dose_sum)
+
+        for load_data, display_keys in [
+            (True, ("roi", "struct", 1)), (False, ("roi", "struct", 1)),
+            (False, ("image", "image")), (True, ("image", "image")), (True, ("roi", "struct", 1)),
+        ]:
+            data_mgr.update_cached_data(load_data, display_keys)
+            assert data_mgr._cached_dose_sum is dose_sum
+        assert ("roi", "struct", 1) in data_mgr._cached_sitk_objects
+        assert np.array_equal(sitk.GetArrayViewFromImage(dose_sum), dose_sum_values)
+        assert data_mgr._dose_sum_keys == [("dose", "dose_a"), ("dose", "dose_b")]
@@ -0,0 +1,204 @@
+"""
+Test enhanced multi-frame image construction via construct_image() from mdh_app/data_builders/ImageBuilder.py
+"""
+from __future__ import annotations
+
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+from pydicom import dcmread
+from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
+from pydicom.sequence import Sequence
+from pydicom.uid import ExplicitVRLittleEndian, RLELossless, generate_uid
+
+
+from mdh_app.data_builders.ImageBuilder import construct_image, read_image_params
+from mdh_app.utils.sitk_utils import get_rescale_params, sitk_to_float_image
+
+
+NUM_SLICES, ROWS, COLS = 6, 16, 12  # Large enough for the pixel data to be deferred and memory-mapped
+IOP = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+
+
+def get_slice_params(signed: bool):
+    """Return per-slice stored values (12 of 16 bits, with garbage in the unused bits), positions and rescale parameters."""
+    rng = np.random.default_rng(7)
+    low, high = (-2048, 2047) if signed else (0, 4095)
+    values = rng.integers(low, high, size=(NUM_SLICES, ROWS, COLS), endpoint=True)
+    stored = ((values & 0x0FFF) | 0xA000).astype(np.uint16)  # Bits 12-15 must be ignored
+    positions = [[-20.0, 10.0, 5.0 + 2.5 * k] for k in range(NUM_SLICES)]
+    slopes = [1.0 + 0.5 * k for k in range(NUM_SLICES)]
+    intercepts = [-1024.0 + 10 * k for k in range(NUM_SLICES)]
+    return stored, positions, slopes, intercepts
+
+
+def new_dataset(file_path: str, series_uid: str, signed: bool, transfer_syntax=ExplicitVRLittleEndian) -> FileDataset:
+    """Create a CT dataset with the shared image pixel attributes."""
+    file_meta = FileMetaDataset()
+    file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+    file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    file_meta.TransferSyntaxUID = transfer_syntax
+    ds = FileDataset(file_path, {}, file_meta=file_meta, preamble=b"\0" * 128)
+    ds.SOPClassUID = file_meta.MediaStorageSOPClassUID
+    ds.SOPInstanceUID = file_meta.MediaStorageSOPInstanceUID
+    ds.Modality = "CT"
+    ds.SeriesInstanceUID = series_uid
+    ds.Rows, ds.Columns = ROWS, COLS
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated, ds.BitsStored, ds.HighBit = 16, 12, 11
+    ds.PixelRepresentation = int(signed)
+    return ds
+
+
+def write_series(directory, series_uid: str, signed: bool):
+    """Write one file per slice."""
+    stored, positions, slopes, intercepts = get_slice_params(signed)
+    file_paths = []
+    for k in range(NUM_SLICES):
+        file_path = str(directory / f"ct_{k}.dcm")
+        ds = new_dataset(file_path, series_uid, signed)
+        ds.ImageOrientationPatient = IOP
+        ds.ImagePositionPatient = positions[k]
+        ds.PixelSpacing = [0.75, 0.5]
+        ds.SliceThickness = 2.5
+        ds.RescaleSlope, ds.RescaleIntercept = slopes[k], intercepts[k]
+        ds.PixelData = stored[k].tobytes()
+        ds.save_as(file_path, enforce_file_format=True)
+        file_paths.append(file_path)
+    return file_paths
+
+
+def write_multiframe(file_path: str, series_uid: str, signed: bool, frame_order, transfer_syntax=ExplicitVRLittleEndian) -> str:
+    """Write the same slices as one enhanced multi-frame file, with frames stored in the given order."""
+    stored, positions, slopes, intercepts = get_slice_params(signed)
+    ds = new_dataset(file_path, series_uid, signed, transfer_syntax)
+    ds.SOPClassUID = ds.file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.2.1"
+    ds.NumberOfFrames = NUM_SLICES
+
+    shared_item = Dataset()
+    orientation = Dataset()
+    orientation.ImageOrientationPatient = IOP
+    shared_item.PlaneOrientationSequence = Sequence([orientation])
+    measures = Dataset()
+    measures.PixelSpacing = [0.75, 0.5]
+    measures.SliceThickness = 2.5
+    shared_item.PixelMeasuresSequence = Sequence([measures])
+    ds.SharedFunctionalGroupsSequence = Sequence([shared_item])
+
+    per_frame_items = []
+    for k in frame_order:
+        frame_item = Dataset()
+        position = Dataset()
+        position.ImagePositionPatient = positions[k]
+        frame_item.PlanePositionSequence = Sequence([position])
+        transform = Dataset()
+        transform.RescaleSlope, transform.RescaleIntercept = slopes[k], intercepts[k]
+        frame_item.PixelValueTransformationSequence = Sequence([transform])
+        per_frame_items.append(frame_item)
+    ds.PerFrameFunctionalGroupsSequence = Sequence(per_frame_items)
+
+    frames = np.ascontiguousarray(stored[list(frame_order)])
+    if transfer_syntax == ExplicitVRLittleEndian:
+        ds.PixelData = frames.tobytes()
+    else:
+        # The encoder only accepts values within BitsStored
+        frames = (frames.astype(np.int16) << 4) >> 4 if signed else frames & 0x0FFF
+        ds.compress(transfer_syntax, frames)
+    ds.save_as(file_path, enforce_file_format=True)
+    return file_path
+
+
+class TestMultiframeImageBuilder:
+    """Test building enhanced multi-frame images one frame at a time."""
+
+    @pytest.mark.parametrize("transfer_syntax", [ExplicitVRLittleEndian, RLELossless], ids=["memmap", "rle"])
+    @pytest.mark.parametrize("native_pixel_type", [False, True])
+    @pytest.mark.parametrize("signed", [False, True])
+    def test_matches_per_slice_series(self, tmp_path, signed, native_pixel_type, transfer_syntax):
+        """
+        Test that shuffled frames with per-frame rescale and BitsStored=12 give the same image as the per-slice series.
+        References ImageBuilder.py _iter_multiframe_pixels / _get_stored_values / _construct_multiframe_image.
+        """
+        series_uid = generate_uid()
+        series_dir = tmp_path / "series"
+        series_dir.mkdir()
+        expected = construct_image(write_series(series_dir, series_uid, signed), None, series_uid)
+
+        frame_order = [3, 0, 5, 1, 4, 2]
+        file_path = write_multiframe(str(tmp_path / "enhanced.dcm"), series_uid, signed, frame_order, transfer_syntax)
+        image = construct_image([file_path], None, series_uid, native_pixel_type=native_pixel_type)
+
+        assert image is not None and expected is not None
+        assert image.GetSize() == expected.GetSize() == (COLS, ROWS, NUM_SLICES)
+        assert np.allclose(image.GetOrigin(), expected.GetOrigin())
+        assert np.allclose(image.GetSpacing(), expected.GetSpacing())
+        assert np.allclose(image.GetDirection(), expected.GetDirection())
+        assert image.GetPixelID() == sitk.sitkFloat32  # Rescale varies per frame
+        assert np.allclose(
+            sitk.GetArrayViewFromImage(sitk_to_float_image(image)),
+            sitk.GetArrayViewFromImage(expected),
+            rtol=1e-6, atol=1e-3,
+        )
+
+    def test_native_uniform_rescale(self, tmp_path):
+        """Test that a uniformly rescaled file is stored in its native type with masked, sign-extended values."""
+        series_uid = generate_uid()
+        file_path = write_multiframe(str(tmp_path / "enhanced.dcm"), series_uid, True, [2, 1, 0, 5, 4, 3])
+        ds = dcmread(file_path)
+        for frame_item in ds.PerFrameFunctionalGroupsSequence:
+            frame_item.PixelValueTransformationSequence[0].RescaleSlope = 2.0
+            frame_item.PixelValueTransformationSequence[0].RescaleIntercept = -100.0
+        ds.save_as(file_path)
+
+        image = construct_image([file_path], None, series_uid, native_pixel_type=True)
+        stored, _, _, _ = get_slice_params(True)
+        expected = (stored.astype(np.int16) << 4) >> 4
+
+        assert image.GetPixelID() == sitk.sitkInt16
+        assert np.array_equal(sitk.GetArrayViewFromImage(image), expected)
+        assert get_rescale_params(image) == (2.0, -100.0)
+
+
+class TestSeriesImageBuilder:
+    """Test building images from one file per slice."""
+
+    def test_native_per_slice_rescale(self, tmp_path):
+        """
+        Test that a native read of slices with different rescale parameters falls back to the float32 image.
+        References ImageBuilder.py construct_image / _has_varying_rescale.
+        """
+        series_uid = generate_uid()
+        file_paths = write_series(tmp_path, series_uid, True)
+        expected = construct_image(file_paths, None, series_uid)
+        image = construct_image(file_paths, None, series_uid, native_pixel_type=True)
+
+        assert image.GetPixelID() == sitk.sitkFloat32
+        assert get_rescale_params(image) == (1.0, 0.0)
+        assert np.array_equal(sitk.GetArrayViewFromImage(image), sitk.GetArrayViewFromImage(expected))
+
+
+class TestImageParams:
+    """Test reading the image geometry from the DICOM headers."""
+
+    @pytest.mark.parametrize("layout", ["series", "multiframe"])
+    def test_matches_constructed_image(self, tmp_path, layout):
+        """
+        Test that the header geometry matches the image that construct_image builds from the same (unsorted) files.
+        References ImageBuilder.py read_image_params.
+        """
+        series_uid = generate_uid()
+        if layout == "series":
+            file_paths = write_series(tmp_path, series_uid, False)[::-1]
+        else:
+            file_paths = [write_multiframe(str(tmp_path / "enhanced.dcm"), series_uid, False, [3, 0, 5, 1, 4, 2])]
+        image = construct_image(file_paths, None, series_uid)
+        params = read_image_params(file_paths, None, series_uid)
+
+        assert image is not None and params is not None
+        assert (params["cols"], params["rows"], params["slices"]) == image.GetSize()
+        assert np.allclose(params["origin"], image.GetOrigin())
+        assert np.allclose(params["spacing"], image.GetSpacing())
+        assert np.allclose(params["direction"], image.GetDirection())
+        assert read_image_params(file_paths, None, generate_uid()) is None
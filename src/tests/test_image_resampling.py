@@ -9,7 +9,12 @@ import pytest
 import SimpleITK as sitk
 
 
-from mdh_app.utils.sitk_utils import resample_sitk_data_with_params
+from mdh_app.utils.sitk_utils import (
+    crop_mask_array_to_image, expand_cropped_mask, get_crop_params, resample_sitk_data_with_params,
+    set_mask_statistics, get_mask_statistics, get_image_grid, get_resampled_grid, resample_to_grid,
+    get_axis_aligned_mapping, sample_axis_aligned, transform_grid_index_to_physical, resample_cropped_mask_to_grid,
+    INTERPOLATORS
+)
 
 
 class TestImageResampling:
@@ -109,6 +114,141 @@ class TestImageResampling:
         assert 950 <= left_mean <= 1050, f"Left region: {left_mean}"
         assert 1950 <= right_mean <= 2050, f"Right region: {right_mean}"
 
+    def test_cropped_mask_round_trip(self):
+        """
+        Test that a bounding-box-cropped mask keeps its physical placement and expands back losslessly.
+        References sitk_utils.py crop_mask_array_to_image and expand_cropped_mask.
+        """
+        mask_array = np.zeros((10, 30, 40), dtype=np.uint8)
+        mask_array[3:6, 12:20, 5:9] = 1
+        spacing = (1.5, 1.5, 3.0)
+        origin = (-20.0, 10.0, 5.0)
+        direction = (1, 0, 0, 0, 1, 0, 0, 0, 1)
+
+        cropped = crop_mask_array_to_image(mask_array, spacing, direction, origin)
+        crop_index, full_size = get_crop_params(cropped)
+        assert cropped.GetSize() == (4, 8, 3), f"Cropped size: {cropped.GetSize()}"
+        assert tuple(crop_index) == (5, 12, 3), f"Crop index: {crop_index}"
+        assert tuple(full_size) == (40, 30, 10), f"Full size: {full_size}"
+
+        # First cropped voxel sits at the physical location of the original bbox corner
+        expected_corner = np.array(origin) + np.array(crop_index) * np.array(spacing)
+        assert np.allclose(cropped.GetOrigin(), expected_corner), f"Cropped origin: {cropped.GetOrigin()}"
+
+        expanded = expand_cropped_mask(cropped)
+        assert np.allclose(expanded.GetOrigin(), origin), f"Expanded origin: {expanded.GetOrigin()}"
+        assert np.array_equal(sitk.GetArrayViewFromImage(expanded), mask_array), "Round trip changed the mask"
+
+    @pytest.mark.parametrize("spacing, rotation, flips", [(None, 90, (True, False, True)), ((1.0, 1.0, 1.0), 180, (False, True, False))])
+    def test_plane_resampling_matches_full_grid(self, spacing, rotation, flips):
+        """
+        Test that resampling single planes of a resampled grid matches resampling the whole grid.
+        References sitk_utils.py get_resampled_grid and resample_to_grid.
+        """
+        array = np.random.default_rng(7).normal(size=(12, 30, 40)).astype(np.float32)
+        image = sitk.GetImageFromArray(array)
+        image.SetSpacing((1.5, 1.5, 3.0))
+        image.SetOrigin((-20.0, 10.0, 5.0))
+
+        full_image = resample_sitk_data_with_params(image, set_spacing=spacing, set_rotation=rotation, set_flip=flips)
+        grid = get_resampled_grid(get_image_grid(image), set_spacing=spacing, set_rotation=rotation, set_flip=flips)
+        assert grid["size"] == full_image.GetSize()
+        assert np.allclose(grid["origin"], full_image.GetOrigin()) and np.allclose(grid["direction"], full_image.GetDirection())
+
+        full_array = sitk.GetArrayViewFromImage(full_image)
+        size_x, size_y, size_z = grid["size"]
+        axial = sitk.GetArrayFromImage(resample_to_grid(image, grid, start=(0, 0, size_z // 2), size=(size_x, size_y, 1)))
+        coronal = sitk.GetArrayFromImage(resample_to_grid(image, grid, start=(2, size_y // 3, 0), size=(size_x - 4, 1, size_z)))
+        assert np.allclose(axial[0], full_array[size_z // 2], atol=1e-5)
+        assert np.allclose(coronal[:, 0], full_array[:, size_y // 3, 2:size_x - 2], atol=1e-5)
+
+    @pytest.mark.parametrize("rotation, flips", [(90, (False, False, False)), (180, (True, False, True)), (270, (False, True, False))])
+    def test_axis_aligned_fast_path(self, rotation, flips):
+        """
+        Test that flips and 90-degree rotations read voxels directly and match SimpleITK's resampling.
+        References sitk_utils.py get_axis_aligned_mapping, sample_axis_aligned and resample_to_grid.
+        """
+        array = np.random.default_rng(11).normal(size=(10, 24, 30)).astype(np.float32)
+        image = sitk.GetImageFromArray(array)
+        image.SetSpacing((1.2, 1.2, 2.5))
+        image.SetOrigin((-15.0, 8.0, 3.0))
+        grid = get_resampled_grid(get_image_grid(image), set_rotation=rotation, set_flip=flips)
+        assert get_axis_aligned_mapping(get_image_grid(image), grid) is not None, "Axis-aligned grid not detected"
+        assert get_axis_aligned_mapping(get_image_grid(image), get_resampled_grid(get_image_grid(image), set_spacing=(1.0, 1.0, 2.5))) is None
+        assert resample_to_grid(image, get_image_grid(image)) is image, "Unchanged grid should not be copied"
+
+        size_x, size_y, size_z = grid["size"]
+        for start, size in [((0, 0, 0), grid["size"]), ((0, 0, size_z // 2), (size_x, size_y, 1)), ((3, 0, 0), (1, size_y, size_z))]:
+            resampler = sitk.ResampleImageFilter()
+            resampler.SetInterpolator(sitk.sitkLinear)
+            resampler.SetOutputSpacing(grid["spacing"])
+            resampler.SetOutputDirection(grid["direction"])
+            resampler.SetOutputOrigin(tuple(transform_grid_index_to_physical(grid, start)))
+            resampler.SetSize(size)
+            expected = sitk.GetArrayFromImage(resampler.Execute(image))
+            assert np.array_equal(sitk.GetArrayFromImage(resample_to_grid(image, grid, start=start, size=size)), expected)
+
+        # Planes inside the image are strided views, not copies
+        if rotation == 180:
+            plane = sample_axis_aligned(array, get_axis_aligned_mapping(get_image_grid(image), grid), (0, 0, 4), (size_x, size_y, 1))
+            assert np.shares_memory(plane, array), "Plane inside the image was copied"
+
+    @pytest.mark.parametrize("interpolation", ["nearest", "label_gaussian"])
+    def test_cropped_mask_resampling_preserves_labels(self, interpolation):
+        """
+        Test that cropped masks resampled onto a rotated, respaced grid stay binary uint8 and match the full-size mask.
+        References sitk_utils.py resample_cropped_mask_to_grid.
+        """
+        mask_array = np.zeros((12, 30, 40), dtype=np.uint8)
+        mask_array[3:9, 6:24, 10:32] = np.random.default_rng(3).random((6, 18, 22)) > 0.3
+        spacing, origin, direction = (0.8, 1.2, 2.5), (-30.0, 12.0, 4.0), (1, 0, 0, 0, 1, 0, 0, 0, 1)
+        cropped = crop_mask_array_to_image(mask_array, spacing, direction, origin)
+        grid = get_resampled_grid(get_image_grid(cropped), set_spacing=(1.0, 1.0, 2.0), set_rotation=30)
+
+        resampled = resample_cropped_mask_to_grid(cropped, grid, interpolator=INTERPOLATORS[interpolation])
+        assert resampled.GetPixelID() == sitk.sitkUInt8, "Resampled mask is not one byte per voxel"
+        resampled_array = sitk.GetArrayFromImage(expand_cropped_mask(resampled))
+        assert set(np.unique(resampled_array)) <= {0, 1}, "Resampled mask has non-label values"
+
+        full_mask = sitk.GetImageFromArray(mask_array)
+        full_mask.SetSpacing(spacing)
+        full_mask.SetOrigin(origin)
+        full_mask.SetDirection(direction)
+        expected = sitk.GetArrayFromImage(resample_to_grid(full_mask, grid, interpolator=INTERPOLATORS[interpolation]))
+        assert np.array_equal(resampled_array, expected), "Cropped resampling differs from the full-size mask"
+
+    def test_cropped_mask_statistics(self):
+        """
+        Test that mask statistics computed on a cropped mask match those of the full-size mask.
+        References sitk_utils.py set_mask_statistics and get_mask_statistics.
+        """
+        rng = np.random.default_rng(7)
+        mask_array = np.zeros((12, 30, 40), dtype=np.uint8)
+        mask_array[2:9, 5:22, 11:30] = rng.random((7, 17, 19)) > 0.6
+        spacing = (0.8, 1.2, 2.5)
+        origin = (-30.0, 12.0, 4.0)
+        direction = (0, 1, 0, 1, 0, 0, 0, 0, 1)  # Swapped x/y axes
+
+        cropped = crop_mask_array_to_image(mask_array, spacing, direction, origin)
+        stats = set_mask_statistics(cropped)
+        assert get_mask_statistics(cropped) == stats, "Stored statistics differ from the computed ones"
+
+        coords = np.argwhere(mask_array)  # (z, y, x)
+        assert stats["voxel_count"] == len(coords)
+        assert stats["volume_cc"] == pytest.approx(len(coords) * np.prod(spacing) / 1000.0)
+        assert stats["bbox_index"] == list(coords.min(axis=0)[::-1])
+        assert stats["bbox_size"] == list((coords.max(axis=0) - coords.min(axis=0) + 1)[::-1])
+
+        full_image = sitk.GetImageFromArray(mask_array)
+        full_image.SetSpacing(spacing)
+        full_image.SetDirection(direction)
+        full_image.SetOrigin(origin)
+        expected_centroid = full_image.TransformContinuousIndexToPhysicalPoint(coords.mean(axis=0)[::-1].tolist())
+        assert np.allclose(stats["centroid"], expected_centroid), f"Centroid: {stats['centroid']} vs {expected_centroid}"
+
+        empty_stats = set_mask_statistics(crop_mask_array_to_image(np.zeros((4, 5, 6), dtype=np.uint8), spacing, direction, origin))
+        assert empty_stats["voxel_count"] == 0 and empty_stats["centroid"] is None
+
     def test_coordinate_preservation(self):
         """
         Test spatial coordinate preservation.
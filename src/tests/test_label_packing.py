@@ -0,0 +1,67 @@
+"""
+Test bit-packed multi-label ROI volumes via the label helpers in mdh_app/utils/numpy_utils.py
+"""
+from __future__ import annotations
+
+
+import numpy as np
+import pytest
+
+
+from mdh_app.utils.numpy_utils import (
+    get_label_plane_layout, allocate_label_planes, set_label_bits, clear_label_bits,
+    get_label_mask, merge_label_masks, get_labels_from_words
+)
+
+
+class TestLabelPacking:
+    """Test packing of overlapping ROI masks into per-voxel bitsets."""
+
+    @pytest.mark.parametrize(
+        "num_labels, expected_layout",
+        [(1, (1, np.uint8)), (8, (1, np.uint8)), (9, (1, np.uint16)), (32, (1, np.uint32)), (33, (1, np.uint64)), (64, (1, np.uint64)), (65, (2, np.uint64)), (128, (2, np.uint64))],
+    )
+    def test_plane_layout(self, num_labels, expected_layout):
+        """Test that the smallest word type is used, with extra uint64 planes beyond 64 labels."""
+        num_planes, dtype = get_label_plane_layout(num_labels)
+        assert (num_planes, dtype) == (expected_layout[0], np.dtype(expected_layout[1]))
+
+    @pytest.mark.parametrize("num_labels", [5, 40, 100])
+    def test_overlapping_masks_round_trip(self, num_labels):
+        """
+        Test that overlapping masks placed at offsets are recovered exactly, per label, per voxel, and merged.
+        References numpy_utils.py set_label_bits / get_label_mask / merge_label_masks / get_labels_from_words.
+        """
+        rng = np.random.default_rng(num_labels)
+        shape = (6, 20, 24)
+        planes = allocate_label_planes(num_labels, shape)
+
+        # Random boxes of random masks, so labels overlap heavily
+        full_masks = {}
+        for label in range(num_labels):
+            start = rng.integers(0, 4, size=3)
+            size = rng.integers(1, 3, size=3) + np.array([0, 10, 12])
+            mask = rng.random(tuple(size)) > 0.5
+            set_label_bits(planes, label, mask, tuple(int(v) for v in start))
+            full_mask = np.zeros(shape, dtype=bool)
+            full_mask[tuple(slice(a, a + n) for a, n in zip(start, size))] = mask
+            full_masks[label] = full_mask
+
+        for label, full_mask in full_masks.items():
+            assert np.array_equal(get_label_mask(planes, label), full_mask), f"Label {label} mask changed"
+
+        # Slicing the packed volume yields the same per-label slice
+        assert np.array_equal(get_label_mask(planes[:, 3], num_labels - 1), full_masks[num_labels - 1][3])
+
+        voxel = (3, 8, 9)
+        expected_labels = [label for label, full_mask in full_masks.items() if full_mask[voxel]]
+        assert get_labels_from_words(planes[(slice(None),) + voxel]) == expected_labels
+
+        merged_labels = [0, num_labels // 2, num_labels - 1]
+        expected_merged = np.logical_or.reduce([full_masks[label] for label in merged_labels])
+        assert np.array_equal(merge_label_masks(planes, merged_labels), expected_merged)
+
+        # Clearing one label leaves the others untouched
+        clear_label_bits(planes, num_labels - 1)
+        assert not get_label_mask(planes, num_labels - 1).any()
+        assert np.array_equal(get_label_mask(planes, 0), full_masks[0])
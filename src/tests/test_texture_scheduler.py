@@ -0,0 +1,111 @@
+"""
+Test texture frame scheduling via SharedStateManager.submit_texture_update() from mdh_app/managers/shared_state_manager.py
+"""
+from __future__ import annotations
+
+
+import threading
+import time
+
+
+import pytest
+
+
+from mdh_app.managers import shared_state_manager
+from mdh_app.managers.shared_state_manager import SharedStateManager
+
+
+@pytest.fixture
+def ss_mgr():
+    """Shared state manager whose threads are stopped after the test."""
+    ss_mgr = SharedStateManager()
+    yield ss_mgr
+    ss_mgr.shutdown_manager(timeout=0.5)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Clock of the texture loop, which only moves when a test advances it, so frame timing does not depend on the machine."""
+    now = [100.0]
+    monkeypatch.setattr(shared_state_manager, "perf_counter", lambda: now[0])
+    return now
+
+
+def wait_until(condition, timeout: float = 3.0) -> bool:
+    """Poll a condition until it holds or the timeout passes."""
+    end_time = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > end_time:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestTextureScheduler:
+    """Test coalescing of texture updates into frames."""
+
+    def test_bursts_coalesce_into_frames(self, ss_mgr, clock):
+        """
+        Test that updates submitted during a frame are coalesced, so only the latest one is rendered next.
+        References shared_state_manager.py _persistent_texture_loop / submit_texture_update.
+        """
+        release = threading.Event()
+        rendered = []
+
+        def render(i, **kwargs):
+            rendered.append((i, kwargs.get("texture_preview", False)))
+            if i == 0:
+                release.wait(3.0)
+
+        ss_mgr.submit_texture_update(render, 0)
+        assert wait_until(lambda: rendered)  # The first frame is rendering
+        for i in range(1, 100):
+            ss_mgr.submit_texture_update(render, i)
+        release.set()
+
+        assert wait_until(lambda: len(rendered) == 2 and not ss_mgr._texture_pending)
+        assert rendered == [(0, False), (99, False)]
+
+    def test_priority_order(self, ss_mgr):
+        """Test that pending resets render before pending updates, whatever the order they were submitted in."""
+        release = threading.Event()
+        rendered = []
+        ss_mgr.submit_texture_update(lambda **kwargs: release.wait(3.0))
+        assert wait_until(lambda: not ss_mgr._texture_pending)  # The blocking render has started
+
+        ss_mgr.submit_texture_update(lambda **kwargs: rendered.append("update"), texture_action_type="update")
+        ss_mgr.submit_texture_update(lambda **kwargs: rendered.append("reset"), texture_action_type="reset")
+        release.set()
+
+        assert wait_until(lambda: len(rendered) == 2)
+        assert rendered == ["reset", "update"]
+
+    def test_slow_frames_render_previews_then_refine(self, ss_mgr, clock):
+        """
+        Test that an update arriving while frames exceed the frame budget is rendered as a preview,
+        and that it is rendered in full once updates settle for a frame.
+        """
+        frame_budget = ss_mgr.TEXTURE_FRAME_BUDGET
+        ss_mgr.texture_frame_time = 2 * frame_budget  # Full frames are known to be slow
+        release = threading.Event()
+        rendered = []
+
+        def render(i, **kwargs):
+            clock[0] += 2 * frame_budget  # Each frame takes twice the budget
+            rendered.append((i, kwargs.get("texture_preview", False)))
+            if i == 0:
+                release.wait(3.0)
+
+        ss_mgr.submit_texture_update(render, 0)
+        assert wait_until(lambda: rendered)  # The first frame is rendering
+        for i in range(1, 4):
+            ss_mgr.submit_texture_update(render, i)
+        release.set()
+        assert wait_until(lambda: len(rendered) == 2)
+
+        def settle() -> bool:
+            clock[0] += frame_budget  # No updates arrive while time passes
+            return len(rendered) == 3
+
+        assert wait_until(settle)
+        assert rendered == [(0, False), (3, True), (3, False)]
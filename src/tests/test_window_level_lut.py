@@ -0,0 +1,43 @@
+"""
+Test window/level lookup tables via the window/level helpers in mdh_app/utils/numpy_utils.py
+"""
+from __future__ import annotations
+
+
+import numpy as np
+import pytest
+
+
+from mdh_app.utils.numpy_utils import window_level_to_uint8, get_window_level_lut, apply_window_level_lut
+
+
+class TestWindowLevelLUT:
+    """Test windowing stored integer pixels through lookup tables."""
+
+    @pytest.mark.parametrize(
+        "dtype, slope, intercept",
+        [(np.int16, 1.0, 0.0), (np.uint16, 1.0, -1024.0), (np.int16, 0.5, -10.0), (np.uint8, 4.0, -200.0), (np.int8, 1.0, 0.0)],
+    )
+    def test_lut_matches_direct_windowing(self, dtype, slope, intercept):
+        """
+        Test that the table lookup gives the same gray levels as rescaling and windowing the values directly.
+        References numpy_utils.py get_window_level_lut / apply_window_level_lut / window_level_to_uint8.
+        """
+        info = np.iinfo(dtype)
+        stored = np.random.default_rng(5).integers(info.min, info.max, size=(40, 50), endpoint=True).astype(dtype)
+        lower_bound, upper_bound = -160.0, 240.0
+
+        lut = get_window_level_lut(stored.dtype, slope, intercept, lower_bound, upper_bound)
+        assert lut.dtype == np.uint8 and lut.shape == (2 ** (8 * stored.dtype.itemsize),)
+
+        values = stored.astype(np.float32) * np.float32(slope) + np.float32(intercept)
+        expected = window_level_to_uint8(values, lower_bound, upper_bound)
+        assert np.array_equal(apply_window_level_lut(lut, stored), expected)
+
+        # Strided planes (e.g., coronal views) are looked up without a copy first
+        assert np.array_equal(apply_window_level_lut(lut, stored[:, 7]), expected[:, 7])
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.int32])
+    def test_unsupported_dtypes(self, dtype):
+        """Test that pixel types without a compact table fall back to direct windowing."""
+        assert get_window_level_lut(np.dtype(dtype), 1.0, 0.0, -160.0, 240.0) is None